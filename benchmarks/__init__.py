@@ -0,0 +1,3 @@
+"""
+Micro-benchmarks for the JIRA Daily Activity Dashboard
+"""
@@ -0,0 +1,432 @@
+"""
+Local JIRA stand-in server for offline load testing
+Implements the REST endpoints used by JIRAClient with configurable latency, pagination and 429 injection,
+and can replay responses captured by benchmarks.recorder.
+Usage: python -m benchmarks.jira_stub --issues 2000 --port 8765 --latency-ms 120 --rate-limit 0.02
+"""
+import argparse
+import functools
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from benchmarks.synthetic import generate_raw_issues, search_response, JIRA_TIMESTAMP_FORMAT
+from config import TEAM_MEMBERS
+
+# JIRA Server caps page size for /search regardless of the requested maxResults
+DEFAULT_MAX_PAGE_SIZE = 100
+
+SERVER_INFO = {
+    'baseUrl': '',
+    'version': '9.12.0',
+    'versionNumbers': [9, 12, 0],
+    'deploymentType': 'Server',
+    'buildNumber': 9120000,
+    'serverTitle': 'JIRA Stub'
+}
+
+# Clause names let the client cache field ids; without them it refetches /field before every search
+FIELDS = [
+    {'id': 'summary', 'name': 'Summary', 'custom': False, 'clauseNames': ['summary'], 'schema': {'type': 'string'}},
+    {'id': 'status', 'name': 'Status', 'custom': False, 'clauseNames': ['status'], 'schema': {'type': 'status'}},
+    {'id': 'assignee', 'name': 'Assignee', 'custom': False, 'clauseNames': ['assignee'], 'schema': {'type': 'user'}},
+    {'id': 'issuetype', 'name': 'Issue Type', 'custom': False, 'clauseNames': ['issuetype', 'type'], 'schema': {'type': 'issuetype'}},
+    {'id': 'priority', 'name': 'Priority', 'custom': False, 'clauseNames': ['priority'], 'schema': {'type': 'priority'}},
+    {'id': 'created', 'name': 'Created', 'custom': False, 'clauseNames': ['created', 'createdDate'], 'schema': {'type': 'datetime'}},
+    {'id': 'updated', 'name': 'Updated', 'custom': False, 'clauseNames': ['updated', 'updatedDate'], 'schema': {'type': 'datetime'}},
+    {'id': 'duedate', 'name': 'Due date', 'custom': False, 'clauseNames': ['due', 'duedate'], 'schema': {'type': 'date'}},
+    {'id': 'customfield_10016', 'name': 'Story Points', 'custom': True, 'clauseNames': ['cf[10016]', 'Story Points'], 'schema': {'type': 'number'}},
+    {'id': 'customfield_10020', 'name': 'Sprint', 'custom': True, 'clauseNames': ['cf[10020]', 'Sprint'], 'schema': {'type': 'array'}},
+    {'id': 'customfield_11580', 'name': 'Story Points actual', 'custom': True, 'clauseNames': ['cf[11580]', 'Story Points actual'], 'schema': {'type': 'number'}}
+]
+
+# JIRA group served by /group and matched by membersOf(); holds the built-in team
+STUB_GROUP = 'jira-dashboard-team'
+
+PROJECTS = [
+    {'id': '11232', 'key': 'RPA', 'name': 'Robotic Process Automation'},
+    {'id': '11236', 'key': 'DATA', 'name': 'Data Engineering'},
+    {'id': '11240', 'key': 'OPS', 'name': 'Operations'}
+]
+
+
+def _quoted_values(text: str) -> List[str]:
+    """Split a JQL value list such as ("To Do", 'Open', Done) into plain strings"""
+    return [v.strip().strip('"\'') for v in text.split(',') if v.strip()]
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_jira_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a JIRA REST timestamp (memoized: every distinct JQL rescans all issues)"""
+    if not value:
+        return None
+    return datetime.strptime(value, JIRA_TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def compile_jql(jql: str, now: Optional[datetime] = None, groups: Optional[Dict[str, List[str]]] = None):
+    """Compile the subset of JQL used by the dashboard into an issue predicate.
+
+    Supports assignee, status and issueType equality/IN clauses, assignee IN membersOf(group),
+    key IN lists, relative updated/created windows and updated minute ranges; other clauses are ignored.
+    """
+    now = now or datetime.now(timezone.utc)
+    where = re.split(r'\bORDER BY\b', jql, flags=re.IGNORECASE)[0]
+
+    assignees = set(re.findall(r'assignee\s*=\s*"([^"]+)"', where, flags=re.IGNORECASE))
+    for group in re.findall(r'assignee\s+in\s*\(([^)]*)\)', where, flags=re.IGNORECASE):
+        assignees.update(_quoted_values(group))
+    for group in re.findall(r'membersOf\(\s*"([^"]+)"\s*\)', where, flags=re.IGNORECASE):
+        assignees.update((groups or {}).get(group, []))
+
+    statuses = set()
+    for value in re.findall(r'status\s*=\s*(?:"([^"]+)"|\'([^\']+)\'|(\w+))', where, flags=re.IGNORECASE):
+        statuses.add(next(v for v in value if v))
+    for group in re.findall(r'status\s+in\s*\(([^)]*)\)', where, flags=re.IGNORECASE):
+        statuses.update(_quoted_values(group))
+
+    keys = set()
+    for group in re.findall(r'\bkey\s+in\s*\(([^)]*)\)', where, flags=re.IGNORECASE):
+        keys.update(value.strip().strip('"\'') for value in group.split(',') if value.strip())
+
+    issue_types = set()
+    for group in re.findall(r'issueType\s+in\s*\(([^)]*)\)', where, flags=re.IGNORECASE):
+        issue_types.update(_quoted_values(group))
+
+    cutoff = None
+    window = re.search(r'updated\s*>=\s*-(\d+)d', where, flags=re.IGNORECASE)
+    if window:
+        cutoff = now - timedelta(days=int(window.group(1)))
+
+    # Updated-time slices of a sharded search, as minute offsets
+    updated_after = [now - timedelta(minutes=int(m)) for m in re.findall(r'updated\s*>=\s*-(\d+)m', where, flags=re.IGNORECASE)]
+    updated_before = [now - timedelta(minutes=int(m)) for m in re.findall(r'updated\s*<\s*-(\d+)m', where, flags=re.IGNORECASE)]
+
+    def predicate(raw: Dict[str, Any]) -> bool:
+        fields = raw['fields']
+        if keys and raw['key'] not in keys:
+            return False
+        if assignees:
+            assignee = fields.get('assignee') or {}
+            if assignee.get('emailAddress') not in assignees:
+                return False
+        if statuses and fields['status']['name'] not in statuses:
+            return False
+        if issue_types and fields['issuetype']['name'] not in issue_types:
+            return False
+        if updated_after or updated_before:
+            updated = _parse_jira_time(fields.get('updated'))
+            if any(updated < bound for bound in updated_after) or any(updated >= bound for bound in updated_before):
+                return False
+        if cutoff is not None:
+            updated = _parse_jira_time(fields.get('updated'))
+            created = _parse_jira_time(fields.get('created'))
+            if not ((updated and updated >= cutoff) or (created and created >= cutoff)):
+                return False
+        return True
+
+    return predicate
+
+
+def _sort_value(raw: Dict[str, Any], field: str) -> Any:
+    if field == 'key':
+        project, _, number = raw['key'].partition('-')
+        return project, int(number)
+    value = raw['fields'].get(field)
+    if field == 'priority':
+        # Priority ids rank Highest as 1, so DESC lists it first
+        return -int(value['id']) if value and value.get('id') else None
+    return value
+
+
+def order_matches(matches: List[Dict[str, Any]], jql: str) -> List[Dict[str, Any]]:
+    """Apply the ORDER BY clause of a JQL string (fields compared as JIRA returns them, empty last)"""
+    parts = re.split(r'\bORDER BY\b', jql, flags=re.IGNORECASE)
+    if len(parts) < 2:
+        return matches
+    ordered = list(matches)
+    for term in reversed([term.split() for term in parts[1].split(',') if term.strip()]):
+        field, descending = term[0].lower(), len(term) > 1 and term[1].upper() == 'DESC'
+        if descending:
+            ordered.sort(key=lambda raw: (_sort_value(raw, field) is not None, _sort_value(raw, field)), reverse=True)
+        else:
+            ordered.sort(key=lambda raw: (_sort_value(raw, field) is None, _sort_value(raw, field)))
+    return ordered
+
+
+class StubState:
+    """Shared, thread-safe state for a stub server instance"""
+
+    def __init__(self, issues: List[Dict[str, Any]], latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 rate_limit: float = 0.0, retry_after: int = 1, max_page_size: int = DEFAULT_MAX_PAGE_SIZE,
+                 cassette: Optional[Dict[str, Any]] = None, seed: int = 7,
+                 groups: Optional[Dict[str, List[str]]] = None, deployment: str = 'Server'):
+        self.issues = sorted(issues, key=lambda raw: raw['fields']['updated'], reverse=True)
+        self.groups = groups if groups is not None else {STUB_GROUP: list(TEAM_MEMBERS.values())}
+        # 'Cloud' serves the token-paged /search/jql and approximate-count endpoints
+        self.deployment = deployment
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.max_page_size = max_page_size
+        self.cassette = cassette or {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._query_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self.stats = {'requests': 0, 'rate_limited': 0, 'replayed': 0, 'bytes_sent': 0}
+
+    def count(self, stat: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[stat] += amount
+
+    def delay(self) -> None:
+        """Sleep for the configured latency plus jitter"""
+        with self._lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        seconds = max(0.0, self.latency_ms + jitter) / 1000.0
+        if seconds:
+            time.sleep(seconds)
+
+    def should_rate_limit(self) -> bool:
+        with self._lock:
+            return self.rate_limit > 0 and self._rng.random() < self.rate_limit
+
+    def search(self, jql: str) -> List[Dict[str, Any]]:
+        """Return issues matching a JQL string, memoized per query"""
+        with self._lock:
+            cached = self._query_cache.get(jql)
+        if cached is None:
+            predicate = compile_jql(jql, groups=self.groups)
+            cached = order_matches([raw for raw in self.issues if predicate(raw)], jql)
+            with self._lock:
+                self._query_cache[jql] = cached
+        return cached
+
+
+def cassette_key(method: str, path: str, query: str) -> str:
+    """Key used to match recorded responses; query parameters are sorted for stability"""
+    params = parse_qs(query, keep_blank_values=True)
+    normalized = '&'.join(f"{k}={','.join(sorted(v))}" for k, v in sorted(params.items()))
+    return f"{method} {path}?{normalized}" if normalized else f"{method} {path}"
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Request handler serving the JIRA REST subset used by the dashboard"""
+
+    server_version = "JiraStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> StubState:
+        return self.server.state
+
+    def log_message(self, format: str, *args) -> None:
+        # Keep load-test output readable
+        pass
+
+    def _send_json(self, payload: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.state.count('bytes_sent', len(body))
+
+    def _read_body(self) -> Dict[str, Any]:
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def do_GET(self) -> None:
+        self._handle('GET', {})
+
+    def do_POST(self) -> None:
+        self._handle('POST', self._read_body())
+
+    def _handle(self, method: str, body: Dict[str, Any]) -> None:
+        state = self.state
+        state.count('requests')
+        state.delay()
+
+        if state.should_rate_limit():
+            state.count('rate_limited')
+            self._send_json(
+                {'errorMessages': ['Rate limit exceeded'], 'errors': {}},
+                status=429,
+                headers={'Retry-After': str(state.retry_after)}
+            )
+            return
+
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/')
+
+        recorded = state.cassette.get(cassette_key(method, path, parts.query))
+        if recorded is not None:
+            state.count('replayed')
+            self._send_json(recorded['body'], status=recorded.get('status', 200))
+            return
+
+        params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        params.update(body)
+
+        if path.endswith('/serverInfo'):
+            self._send_json({
+                **SERVER_INFO,
+                'baseUrl': f"http://{self.headers.get('Host', '')}",
+                'deploymentType': state.deployment
+            })
+        elif path.endswith('/myself'):
+            self._send_json({
+                'name': 'stub.user',
+                'key': 'stub.user',
+                'emailAddress': 'stub.user@example.com',
+                'displayName': 'Stub User',
+                'active': True
+            })
+        elif path.endswith('/field'):
+            self._send_json(FIELDS)
+        elif path.endswith('/project'):
+            self._send_json(PROJECTS)
+        elif path.endswith('/search'):
+            self._search(params)
+        elif path.endswith('/search/jql'):
+            self._search_jql(params)
+        elif path.endswith('/search/approximate-count'):
+            self._send_json({'count': len(state.search(params.get('jql', '')))})
+        elif path.endswith('/group'):
+            self._group(params)
+        else:
+            self._send_json({'errorMessages': [f"No stub for {path}"], 'errors': {}}, status=404)
+
+    def _search(self, params: Dict[str, Any]) -> None:
+        state = self.state
+        jql = params.get('jql', '')
+        start_at = int(params.get('startAt') or 0)
+        requested = int(params.get('maxResults') or 50)
+        page_size = max(0, min(requested, state.max_page_size))
+        matches = state.search(jql)
+        response = search_response(matches, start_at, page_size)
+        if 'changelog' not in (params.get('expand') or ''):
+            response['issues'] = [
+                {name: value for name, value in raw.items() if name != 'changelog'} for raw in response['issues']
+            ]
+        self._send_json(response)
+
+    def _search_jql(self, params: Dict[str, Any]) -> None:
+        """Cloud search: pages are chained with nextPageToken and no total is reported"""
+        state = self.state
+        start_at = int(params.get('nextPageToken') or 0)
+        page_size = max(0, min(int(params.get('maxResults') or 50), state.max_page_size))
+        matches = state.search(params.get('jql', ''))
+        response = search_response(matches, start_at, page_size)
+        issues = response['issues']
+        if 'changelog' not in (params.get('expand') or ''):
+            issues = [{name: value for name, value in raw.items() if name != 'changelog'} for raw in issues]
+        payload = {'issues': issues, 'isLast': start_at + page_size >= len(matches)}
+        if not payload['isLast']:
+            payload['nextPageToken'] = str(start_at + page_size)
+        self._send_json(payload)
+
+    def _group(self, params: Dict[str, Any]) -> None:
+        name = params.get('groupname', '')
+        emails = self.state.groups.get(name)
+        if emails is None:
+            self._send_json({'errorMessages': [f"Group {name} does not exist"], 'errors': {}}, status=404)
+            return
+        users = [
+            {
+                'name': email.split('@')[0],
+                'displayName': email.split('@')[0].replace('.', ' ').title(),
+                'emailAddress': email,
+                'active': True
+            }
+            for email in emails
+        ]
+        self._send_json({
+            'name': name,
+            'users': {'size': len(users), 'items': users, 'max-results': len(users), 'start-index': 0, 'end-index': len(users) - 1}
+        })
+
+
+class StubJiraServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying a StubState"""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], state: StubState):
+        super().__init__(address, StubRequestHandler)
+        self.state = state
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def load_cassette(path: str) -> Dict[str, Any]:
+    """Load a cassette recorded by benchmarks.recorder"""
+    with open(path) as f:
+        return json.load(f).get('interactions', {})
+
+
+def start_stub_server(issue_count: int = 1000, host: str = '127.0.0.1', port: int = 0,
+                      cassette_path: Optional[str] = None, **state_options) -> StubJiraServer:
+    """Start a stub server in a background thread and return it (port 0 picks a free port)"""
+    issues = generate_raw_issues(issue_count, now=datetime.now(timezone.utc), changelog=True)
+    cassette = load_cassette(cassette_path) if cassette_path else None
+    server = StubJiraServer((host, port), StubState(issues, cassette=cassette, **state_options))
+    thread = threading.Thread(target=server.serve_forever, name='jira-stub', daemon=True)
+    thread.start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local JIRA stand-in server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--issues', type=int, default=1000, help="Number of synthetic issues to serve")
+    parser.add_argument('--latency-ms', type=float, default=120.0, help="Mean response latency")
+    parser.add_argument('--jitter-ms', type=float, default=40.0, help="Latency jitter (+/-)")
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="Probability of answering 429")
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds sent with 429")
+    parser.add_argument('--max-page-size', type=int, default=DEFAULT_MAX_PAGE_SIZE)
+    parser.add_argument('--cassette', help="Replay responses recorded by benchmarks.recorder")
+    parser.add_argument('--cloud', action='store_true', help="Behave like JIRA Cloud (token-paged search)")
+    args = parser.parse_args()
+
+    server = start_stub_server(
+        issue_count=args.issues,
+        host=args.host,
+        port=args.port,
+        cassette_path=args.cassette,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+        max_page_size=args.max_page_size,
+        deployment='Cloud' if args.cloud else 'Server'
+    )
+    print(f"JIRA stub serving {args.issues} issues at {server.url} (team: {len(TEAM_MEMBERS)} members)")
+    print(f"Point the dashboard at it with: JIRA_URL={server.url} JIRA_USERNAME=stub JIRA_API_TOKEN=stub")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
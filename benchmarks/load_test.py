@@ -0,0 +1,212 @@
+"""
+Offline load test against the local JIRA stub server
+Simulates N concurrent sessions at the JIRAClient level, through the data service, or through
+the full Streamlit app (streamlit.testing AppTest) and reports throughput and page-time percentiles.
+Usage: python -m benchmarks.load_test --mode client --sessions 8 --iterations 5
+       python -m benchmarks.load_test --mode service --sessions 32 --iterations 5
+       python -m benchmarks.load_test --mode app --sessions 4 --iterations 3
+"""
+import argparse
+import inspect
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional
+
+from benchmarks.jira_stub import start_stub_server, DEFAULT_MAX_PAGE_SIZE
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def summarize(page_times: List[float], wall_time: float, errors: int) -> Dict[str, Any]:
+    """Summary statistics for a load-test run"""
+    return {
+        'pages': len(page_times),
+        'errors': errors,
+        'wall_time_s': wall_time,
+        'throughput_pages_per_s': len(page_times) / wall_time if wall_time else 0.0,
+        'p50_s': percentile(page_times, 50),
+        'p95_s': percentile(page_times, 95),
+        'max_s': max(page_times) if page_times else 0.0,
+        'mean_s': statistics.fmean(page_times) if page_times else 0.0
+    }
+
+
+def client_session(iterations: int, cold: bool) -> List[float]:
+    """One simulated viewer loading every tab's data through JIRAClient"""
+    from config import TEAM_MEMBERS
+    from jira_client import JIRAClient
+
+    client = JIRAClient()
+    members = list(TEAM_MEMBERS.keys())
+
+    def call(name: str, *args):
+        # Cold mode bypasses the result cache so every page hits the server
+        if cold:
+            return inspect.unwrap(getattr(JIRAClient, name))(client, *args)
+        return getattr(client, name)(*args)
+
+    page_times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call('get_team_weekly_activity', 7, members)
+        call('get_enhanced_priority_issues', "current", members)
+        call('get_enhanced_priority_issues', "up_next", members)
+        call('get_last_week_completed', members)
+        page_times.append(time.perf_counter() - start)
+    return page_times
+
+
+def service_session(iterations: int, url: str) -> List[float]:
+    """One simulated viewer loading every tab's data from the data service"""
+    from config import TEAM_MEMBERS
+    from data_service import DataServiceClient
+
+    client = DataServiceClient(url)
+    members = list(TEAM_MEMBERS.keys())
+
+    page_times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        client.get_team_weekly_activity(7, members)
+        client.get_enhanced_priority_issues("current", members)
+        client.get_enhanced_priority_issues("up_next", members)
+        client.get_last_week_completed(members)
+        page_times.append(time.perf_counter() - start)
+    return page_times
+
+
+def app_session(iterations: int, timeout: float) -> List[float]:
+    """One simulated browser session driving the whole Streamlit script"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    page_times = []
+
+    start = time.perf_counter()
+    at.run()
+    page_times.append(time.perf_counter() - start)
+
+    for i in range(iterations):
+        # Alternate between interactions that users perform most often
+        period = [s for s in at.selectbox if s.label == "📅 Time Period"]
+        toggle = [c for c in at.checkbox if c.label == "Show Description"]
+        start = time.perf_counter()
+        if i % 2 == 0 and period:
+            options = period[0].options
+            period[0].select(type(period[0].value)(options[(i // 2 + 1) % len(options)])).run()
+        elif toggle:
+            toggle[0].set_value(not toggle[0].value).run()
+        else:
+            at.run()
+        page_times.append(time.perf_counter() - start)
+
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return page_times
+
+
+def run_load(sessions: int, worker: Callable[[], List[float]]) -> Dict[str, Any]:
+    """Run the worker in N concurrent threads and collect page times"""
+    page_times: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def wrapped():
+        nonlocal errors
+        try:
+            times = worker()
+            with lock:
+                page_times.extend(times)
+        except Exception as e:
+            print(f"Session failed: {e}", file=sys.stderr)
+            with lock:
+                errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        for _ in range(sessions):
+            pool.submit(wrapped)
+    return summarize(page_times, time.perf_counter() - start, errors)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline load test against the JIRA stub server")
+    parser.add_argument('--mode', choices=['client', 'service', 'app'], default='client')
+    parser.add_argument('--sessions', type=int, default=4, help="Concurrent simulated sessions")
+    parser.add_argument('--iterations', type=int, default=3, help="Page loads / interactions per session")
+    parser.add_argument('--issues', type=int, default=2000, help="Synthetic issues served by the stub")
+    parser.add_argument('--latency-ms', type=float, default=120.0)
+    parser.add_argument('--jitter-ms', type=float, default=40.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="Probability of a 429 response")
+    parser.add_argument('--max-page-size', type=int, default=DEFAULT_MAX_PAGE_SIZE)
+    parser.add_argument('--cassette', help="Replay a recorded cassette instead of synthetic data")
+    parser.add_argument('--cold', action='store_true', help="Client mode: bypass the result cache")
+    parser.add_argument('--socket', help="Service mode: serve over this Unix socket instead of TCP")
+    parser.add_argument('--timeout', type=float, default=120.0, help="App mode: script run timeout")
+    parser.add_argument('--output', help="Write the summary as JSON")
+    args = parser.parse_args(argv)
+
+    server = start_stub_server(
+        issue_count=args.issues,
+        cassette_path=args.cassette,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        max_page_size=args.max_page_size
+    )
+    # config reads credentials from the environment when no Streamlit secrets exist
+    os.environ.update({'JIRA_URL': server.url, 'JIRA_USERNAME': 'stub', 'JIRA_API_TOKEN': 'stub'})
+    # The app takes a daily snapshot of the stub issues; it must not land in (and block) the real store
+    snapshot_dir = tempfile.mkdtemp(prefix='jira-load-test-snapshots-')
+    os.environ['SNAPSHOT_DIR'] = snapshot_dir
+
+    if args.mode == 'client':
+        summary = run_load(args.sessions, lambda: client_session(args.iterations, args.cold))
+    elif args.mode == 'service':
+        from data_service import DataService, create_server, service_url
+
+        service_server = create_server(DataService(), port=0, socket_path=args.socket)
+        threading.Thread(target=service_server.serve_forever, daemon=True).start()
+        summary = run_load(args.sessions, lambda: service_session(args.iterations, service_url(service_server)))
+        service_server.shutdown()
+    else:
+        summary = run_load(args.sessions, lambda: app_session(args.iterations, args.timeout))
+
+    summary.update({
+        'mode': args.mode,
+        'sessions': args.sessions,
+        'iterations': args.iterations,
+        'server': dict(server.state.stats)
+    })
+    server.shutdown()
+    shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+    print(f"Mode: {args.mode}  sessions: {args.sessions}  pages: {summary['pages']}  errors: {summary['errors']}")
+    print(f"Throughput: {summary['throughput_pages_per_s']:.2f} pages/s")
+    print(f"Page time   P50: {summary['p50_s'] * 1000:.0f} ms  P95: {summary['p95_s'] * 1000:.0f} ms  max: {summary['max_s'] * 1000:.0f} ms")
+    print(f"Stub server: {summary['server']}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=2)
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
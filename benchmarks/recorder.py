@@ -0,0 +1,111 @@
+"""
+Recording proxy for the JIRA stub server
+Forwards requests to a real JIRA instance and captures responses into a cassette for replay.
+Usage: python -m benchmarks.recorder --target https://your-domain.atlassian.net --cassette cassette.json
+       then run the dashboard with JIRA_URL=http://127.0.0.1:8766 and replay with
+       python -m benchmarks.jira_stub --cassette cassette.json
+"""
+import argparse
+import json
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any
+from urllib.parse import urlsplit
+
+import requests
+
+from benchmarks.jira_stub import cassette_key
+
+# Headers that must not be copied from the upstream response
+HOP_BY_HOP_HEADERS = {'connection', 'keep-alive', 'transfer-encoding', 'content-encoding', 'content-length'}
+
+
+class Cassette:
+    """Thread-safe collection of recorded interactions, saved as JSON"""
+
+    def __init__(self, path: str, target: str):
+        self.path = path
+        self.target = target
+        self.interactions: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, status: int, body: Any) -> None:
+        with self._lock:
+            self.interactions[key] = {'status': status, 'body': body}
+            self._save()
+
+    def _save(self) -> None:
+        with open(self.path, 'w') as f:
+            json.dump({
+                'target': self.target,
+                'recorded_at': datetime.now(timezone.utc).isoformat(),
+                'interactions': self.interactions
+            }, f)
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    """Proxy handler that forwards to the target and records JSON responses"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._forward('GET')
+
+    def do_POST(self) -> None:
+        self._forward('POST')
+
+    def _forward(self, method: str) -> None:
+        cassette: Cassette = self.server.cassette
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        headers = {k: v for k, v in self.headers.items() if k.lower() not in ('host', 'content-length')}
+
+        upstream = requests.request(
+            method,
+            cassette.target.rstrip('/') + self.path,
+            headers=headers,
+            data=body,
+            timeout=60
+        )
+
+        parts = urlsplit(self.path)
+        try:
+            cassette.record(cassette_key(method, parts.path.rstrip('/'), parts.query), upstream.status_code, upstream.json())
+        except ValueError:
+            # Non-JSON responses are proxied but not recorded
+            pass
+
+        content = upstream.content
+        self.send_response(upstream.status_code)
+        for name, value in upstream.headers.items():
+            if name.lower() not in HOP_BY_HOP_HEADERS:
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record real JIRA responses for stub replay")
+    parser.add_argument('--target', required=True, help="Real JIRA base URL")
+    parser.add_argument('--cassette', default='cassette.json', help="Output cassette path")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), RecordingHandler)
+    server.daemon_threads = True
+    server.cassette = Cassette(args.cassette, args.target)
+    print(f"Recording {args.target} via http://{args.host}:{args.port} into {args.cassette}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""
+Micro-benchmark runner for extraction, filtering and table building
+Usage: python -m benchmarks.run_benchmarks [--scales 100 1000] [--compare benchmarks/results/<sha>.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Any, Optional
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_raw_issues, raw_to_issues
+
+DEFAULT_SCALES = [100, 1000, 10000, 100000]
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Regression threshold used by --compare (current median / baseline median)
+REGRESSION_RATIO = 1.20
+
+
+def _git_commit() -> str:
+    """Return the short hash of the checked-out commit, or 'unknown'"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except Exception:
+        return 'unknown'
+
+
+def _repeats_for_scale(scale: int) -> int:
+    """Fewer repeats for large inputs so a full run stays in minutes"""
+    if scale >= 100000:
+        return 3
+    if scale >= 10000:
+        return 5
+    return 15
+
+
+def time_call(func: Callable[[], Any], repeats: int) -> Dict[str, float]:
+    """Time a zero-argument callable and return summary statistics in seconds"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        'min_s': min(timings),
+        'median_s': statistics.median(timings),
+        'mean_s': statistics.fmean(timings),
+        'repeats': repeats
+    }
+
+
+def build_cases(scale: int) -> Dict[str, Callable[[], Any]]:
+    """Prepare inputs for one scale and return the benchmark cases"""
+    from config import TEAM_MEMBERS
+    from cycle_time import CycleTimeEngine, cycle_time_percentiles
+    from extraction import EXTRACTION_PROCESSES, extract_dataframe_in_processes
+    from jira_client import JIRAClient
+    from rollup import build_rollup
+    from snapshots import build_snapshot, wip_trend, weekly_throughput
+    import table_views
+    from table_views import TABLE_VIEWS, build_table_view, table_page, table_view
+    from utils import (
+        get_summary_metrics, filter_dataframe_by_status, filter_dataframe_by_team_members,
+        format_dataframe_for_display, create_completed_issues_table,
+        status_counts, build_status_distribution_chart, create_status_distribution_chart
+    )
+
+    # Bypass __init__ so no connection is attempted
+    client = JIRAClient.__new__(JIRAClient)
+    issues = raw_to_issues(generate_raw_issues(scale))
+    records = client._extract_issues(issues)
+    df = JIRAClient._records_to_dataframe(records)
+    cube = build_rollup(df)
+    # A month of daily snapshots of the same issues
+    history = pd.concat([build_snapshot(df, date.today() - timedelta(days=d)) for d in range(30)], ignore_index=True)
+    # Issues fetched with their changelogs, as the cycle-time engine requests them
+    changelog_issues = raw_to_issues(generate_raw_issues(scale, changelog=True))
+    engine = CycleTimeEngine()
+    engine.ingest(changelog_issues)
+    cycles = engine.cycle_times(df)
+    members = list(TEAM_MEMBERS.keys())[:3]
+    display_columns = [
+        'key', 'summary', 'status', 'issue_type', 'assignee', 'priority', 'updated', 'due_date',
+        'story_points', 'actual_story_points'
+    ]
+
+    weekly_view = table_view(df, 'weekly_activity', "https://jira.example.com")
+
+    cases = {
+        'extract_issue_data': lambda: client._extract_issues(issues),
+        'dataframe_construction': lambda: pd.DataFrame(records),
+        'records_to_dataframe': lambda: JIRAClient._records_to_dataframe(records),
+        'get_summary_metrics': lambda: get_summary_metrics(df),
+        'build_rollup': lambda: build_rollup(df),
+        'rollup_summary_metrics': lambda: cube.slice_status_filter("In Progress").summary_metrics(),
+        'filter_by_status_completed': lambda: filter_dataframe_by_status(df, "Completed"),
+        'filter_by_status_in_progress': lambda: filter_dataframe_by_status(df, "In Progress"),
+        'filter_by_team_members': lambda: filter_dataframe_by_team_members(df, members, TEAM_MEMBERS),
+        'format_dataframe_for_display': lambda: format_dataframe_for_display(df, display_columns),
+        'create_completed_issues_table': lambda: create_completed_issues_table(df),
+        'weekly_table_view_build': lambda: build_table_view(df, TABLE_VIEWS['weekly_activity'], "https://jira.example.com"),
+        'weekly_table_view_cached': lambda: table_view(df, 'weekly_activity', "https://jira.example.com"),
+        # One page of the paginated table: searched and sorted from scratch, then paged from the memoized order
+        'weekly_table_search_sort': lambda: (
+            table_views._order_cache.clear(), table_views._search_text_cache.clear(), table_views._arrow_cache.clear(),
+            table_page(weekly_view, 1, sort_by='Updated', descending=True, search='bug')
+        ),
+        'weekly_table_page_cached': lambda: table_page(weekly_view, 2, sort_by='Updated', descending=True, search='bug'),
+        'status_chart_build': lambda: build_status_distribution_chart(status_counts(df)),
+        'status_chart_cached': lambda: create_status_distribution_chart(df),
+        'build_snapshot': lambda: build_snapshot(df, date.today()),
+        'snapshot_trends_30d': lambda: (wip_trend(history), weekly_throughput(history)),
+        'parse_changelogs': lambda: CycleTimeEngine().ingest(changelog_issues),
+        'cycle_times': lambda: engine.cycle_times(df),
+        'cycle_time_percentiles': lambda: cycle_time_percentiles(cycles, 'assignee')
+    }
+    if EXTRACTION_PROCESSES > 0:
+        # Wall time including shipping raw JSON to the workers; the first call also starts the pool
+        cases['extract_dataframe_processes'] = lambda: extract_dataframe_in_processes(issues)
+    return cases
+
+
+def run(scales: List[int], only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run every benchmark case at each scale"""
+    results = []
+    for scale in scales:
+        cases = build_cases(scale)
+        repeats = _repeats_for_scale(scale)
+        for name, func in cases.items():
+            if only and name not in only:
+                continue
+            stats = time_call(func, repeats)
+            results.append({'name': name, 'scale': scale, **stats})
+            print(f"{name:<32} n={scale:<7} median={stats['median_s'] * 1000:10.2f} ms  min={stats['min_s'] * 1000:10.2f} ms")
+
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform()
+        },
+        'results': results
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = REGRESSION_RATIO) -> List[Dict[str, Any]]:
+    """Compare median timings against a baseline run and return regressions"""
+    baseline_index = {(r['name'], r['scale']): r for r in baseline.get('results', [])}
+    regressions = []
+    print(f"\nComparison against {baseline.get('meta', {}).get('commit', 'baseline')}:")
+    for result in current['results']:
+        previous = baseline_index.get((result['name'], result['scale']))
+        if previous is None or previous['median_s'] <= 0:
+            continue
+        ratio = result['median_s'] / previous['median_s']
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{result['name']:<32} n={result['scale']:<7} x{ratio:6.2f}{flag}")
+        if ratio > threshold:
+            regressions.append({**result, 'baseline_median_s': previous['median_s'], 'ratio': ratio})
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run dashboard micro-benchmarks")
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES, help="Issue counts to benchmark")
+    parser.add_argument('--only', nargs='+', help="Run only the named cases")
+    parser.add_argument('--output', help="Result JSON path (default: benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', help="Baseline result JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_RATIO, help="Regression ratio for --compare")
+    args = parser.parse_args(argv)
+
+    report = run(args.scales, args.only)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above x{args.threshold:.2f}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Cold-start benchmark for the Streamlit app
+Each run starts a fresh interpreter, the way a new server process starts, and runs main.py once
+through streamlit.testing AppTest against a JIRA stub with a given latency. It reports the time
+from process start to the first paint (header and sidebar rendered) and to the end of the first
+script run.
+Usage: python -m benchmarks.startup --runs 5 --latency-ms 150
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, 'main.py')
+DEFAULT_STUB_PORT = 8790
+
+# Runs in the fresh interpreter; prints one JSON line of wall-clock marks
+CHILD_SCRIPT = r'''
+import json, sys, time
+started = time.time()
+import streamlit
+streamlit_imported = time.time()
+sys.path.insert(0, ROOT)
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(APP_PATH, default_timeout=300)
+script_started = time.time()
+app.run()
+script_finished = time.time()
+import telemetry
+first_paint = [float(line.split()[-1]) for line in telemetry.FIRST_PAINT_DURATION.samples() if '_sum' in line]
+print(json.dumps({
+    'started': started,
+    'streamlit_imported': streamlit_imported,
+    'script_started': script_started,
+    'first_paint': script_started + first_paint[0] if first_paint else None,
+    'script_finished': script_finished,
+    'exceptions': len(app.exception)
+}))
+'''
+
+
+def run_once(jira_url: str, snapshot_dir: str) -> Dict[str, float]:
+    """Start a fresh interpreter, run the app once and return its timings in seconds"""
+    # The app's daily snapshot of the stub issues goes to snapshot_dir, not the real store
+    env = dict(os.environ, JIRA_URL=jira_url, JIRA_USERNAME='stub', JIRA_API_TOKEN='stub', SNAPSHOT_DIR=snapshot_dir)
+    spawned = time.time()
+    script = f"ROOT = {ROOT!r}\nAPP_PATH = {APP_PATH!r}\n{CHILD_SCRIPT}"
+    result = subprocess.run([sys.executable, '-c', script], env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+    marks = json.loads(result.stdout.strip().splitlines()[-1])
+    if marks['exceptions'] or marks['first_paint'] is None:
+        raise RuntimeError(f"App run failed: {result.stderr[-2000:]}")
+    return {
+        'interpreter_s': marks['started'] - spawned,
+        'import_streamlit_s': marks['streamlit_imported'] - marks['started'],
+        'script_to_first_paint_s': marks['first_paint'] - marks['script_started'],
+        'process_to_first_paint_s': marks['first_paint'] - spawned,
+        'process_to_first_run_s': marks['script_finished'] - spawned
+    }
+
+
+def run(runs: int, latency_ms: float, issues: int, port: int = DEFAULT_STUB_PORT) -> Dict[str, Any]:
+    """Cold-start timings over several fresh processes, against a stub in its own process"""
+    stub = subprocess.Popen(
+        [sys.executable, '-m', 'benchmarks.jira_stub', '--port', str(port), '--issues', str(issues),
+         '--latency-ms', str(latency_ms), '--jitter-ms', '0'],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        time.sleep(3)  # Stub startup (synthetic issue generation)
+        with tempfile.TemporaryDirectory(prefix='jira-startup-snapshots-') as snapshot_dir:
+            timings = [run_once(f"http://127.0.0.1:{port}", snapshot_dir) for _ in range(runs)]
+    finally:
+        stub.terminate()
+        stub.wait()
+    return {
+        name: {'median_s': statistics.median(t[name] for t in timings), 'min_s': min(t[name] for t in timings)}
+        for name in timings[0]
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for the Streamlit app")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--latency-ms', type=float, default=150.0, help="Stub JIRA response latency")
+    parser.add_argument('--issues', type=int, default=1000)
+    parser.add_argument('--port', type=int, default=DEFAULT_STUB_PORT, help="Port of the stub JIRA server")
+    parser.add_argument('--output', help="Write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.runs, args.latency_ms, args.issues, args.port)
+    for name, stats in results.items():
+        print(f"{name:<28} median={stats['median_s'] * 1000:10.1f} ms  min={stats['min_s'] * 1000:10.1f} ms")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'runs': args.runs, 'latency_ms': args.latency_ms, 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
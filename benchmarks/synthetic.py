@@ -0,0 +1,155 @@
+"""
+Synthetic JIRA issue generator for benchmarks
+Produces raw REST JSON and jira.resources.Issue objects shaped like real search results
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional
+
+from config import TEAM_MEMBERS
+
+# Options needed by jira.resources.Resource to build an Issue without a live session
+ISSUE_OPTIONS = {
+    'server': 'https://example.atlassian.net',
+    'rest_path': 'api',
+    'rest_api_version': '2',
+    'agile_rest_path': 'agile',
+    'agile_rest_api_version': '1.0'
+}
+
+STATUSES = ['To Do', 'Open', 'Backlog', 'Selected for Development', 'Development',
+            'In Progress', 'In Review', 'Testing', 'Blocked', 'Done', 'Closed']
+ISSUE_TYPES = ['Bug', 'Task', 'Story', 'Epic', 'Enhancement', 'Support', 'Sub-task']
+PRIORITIES = ['Highest', 'High', 'Medium', 'Low', 'Lowest']
+PROJECTS = ['RPA', 'DATA', 'OPS']
+LABELS = ['automation', 'backend', 'frontend', 'urgent', 'tech-debt']
+COMPONENTS = ['API', 'Dashboard', 'ETL', 'Integrations']
+WORDS = ['update', 'invoice', 'pipeline', 'report', 'sync', 'vendor', 'order', 'listing',
+         'retry', 'timeout', 'dashboard', 'export', 'mapping', 'schedule', 'alert']
+
+JIRA_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.000+0000"
+
+# Workflow walked by synthetic changelogs; other statuses branch off it
+WORKFLOW = ['To Do', 'Development', 'In Progress', 'In Review', 'Testing', 'Done']
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """Build a pseudo-random sentence from the word list"""
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _priority(rng: random.Random) -> Dict[str, str]:
+    """Priority with JIRA's default ids (1 = Highest)"""
+    name = rng.choice(PRIORITIES)
+    return {'name': name, 'id': str(PRIORITIES.index(name) + 1)}
+
+
+def make_raw_issue(index: int, rng: random.Random, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Create one issue in the JSON shape returned by /rest/api/2/search"""
+    now = now or datetime.now(timezone.utc)
+    project = rng.choice(PROJECTS)
+    created = now - timedelta(days=rng.randint(1, 60), minutes=rng.randint(0, 1440))
+    updated = min(now, created + timedelta(days=rng.randint(0, 30), minutes=rng.randint(0, 1440)))
+    status = rng.choice(STATUSES)
+    emails = list(TEAM_MEMBERS.values())
+    assignee_email = rng.choice(emails + [None])
+    has_due_date = rng.random() < 0.5
+    is_resolved = status in ('Done', 'Closed')
+
+    fields = {
+        'summary': _sentence(rng, rng.randint(4, 14)),
+        'status': {'name': status},
+        'issuetype': {'name': rng.choice(ISSUE_TYPES)},
+        'reporter': {'displayName': rng.choice(list(TEAM_MEMBERS.keys()))},
+        'assignee': {
+            'emailAddress': assignee_email,
+            'displayName': assignee_email.split('@')[0].replace('.', ' ').title(),
+            'name': assignee_email.split('@')[0]
+        } if assignee_email else None,
+        'priority': _priority(rng),
+        'created': created.strftime(JIRA_TIMESTAMP_FORMAT),
+        'updated': updated.strftime(JIRA_TIMESTAMP_FORMAT),
+        'description': _sentence(rng, rng.randint(0, 80)) if rng.random() < 0.8 else None,
+        'duedate': (created + timedelta(days=rng.randint(1, 30))).strftime("%Y-%m-%d") if has_due_date else None,
+        'resolutiondate': updated.strftime(JIRA_TIMESTAMP_FORMAT) if is_resolved else None,
+        'labels': rng.sample(LABELS, rng.randint(0, 3)),
+        'components': [{'name': name} for name in rng.sample(COMPONENTS, rng.randint(0, 2))],
+        'customfield_10016': float(rng.choice([1, 2, 3, 5, 8, 13])) if rng.random() < 0.7 else None,
+        'customfield_10020': [
+            f"com.atlassian.greenhopper.service.sprint.Sprint@1[id={rng.randint(1, 99)},"
+            f"name=Sprint {rng.randint(1, 40)},state=ACTIVE]"
+        ] if rng.random() < 0.6 else None,
+        'customfield_10014': f"{project}-{rng.randint(1, 200)}" if rng.random() < 0.3 else None,
+        'customfield_11580': float(rng.randint(1, 13)) if is_resolved and rng.random() < 0.5 else None
+    }
+
+    return {
+        'id': str(10000 + index),
+        'key': f"{project}-{index + 1}",
+        'self': f"{ISSUE_OPTIONS['server']}/rest/api/2/issue/{10000 + index}",
+        'fields': fields
+    }
+
+
+def _status_path(status: str) -> List[str]:
+    """Statuses an issue passed through to reach its current status"""
+    if status in WORKFLOW:
+        return WORKFLOW[:WORKFLOW.index(status) + 1]
+    if status == 'Blocked':
+        return ['To Do', 'Development', 'Blocked']
+    if status == 'Closed':
+        return WORKFLOW + ['Closed']
+    return ['To Do', status]
+
+
+def make_changelog(raw: Dict[str, Any], rng: random.Random) -> Dict[str, Any]:
+    """Status-transition changelog (expand=changelog shape) consistent with an issue's dates and status"""
+    fields = raw['fields']
+    created = datetime.strptime(fields['created'], JIRA_TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+    updated = datetime.strptime(fields['updated'], JIRA_TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+    path = _status_path(fields['status']['name'])
+    span = (updated - created).total_seconds()
+    # Transition times spread between created and updated, the last one at updated
+    offsets = sorted(rng.uniform(0, span) for _ in range(len(path) - 2)) + [span]
+    histories = [
+        {
+            'id': str(i + 1),
+            'created': (created + timedelta(seconds=offset)).strftime(JIRA_TIMESTAMP_FORMAT),
+            'items': [{'field': 'status', 'fieldtype': 'jira', 'fromString': from_status, 'toString': to_status}]
+        }
+        for i, (offset, from_status, to_status) in enumerate(zip(offsets, path, path[1:]))
+    ]
+    return {'startAt': 0, 'maxResults': len(histories), 'total': len(histories), 'histories': histories}
+
+
+def generate_raw_issues(count: int, seed: int = 42, now: Optional[datetime] = None,
+                        changelog: bool = False) -> List[Dict[str, Any]]:
+    """Generate a deterministic list of raw issue JSON dictionaries (optionally with changelogs)"""
+    rng = random.Random(seed)
+    # A fixed reference time keeps benchmark inputs identical between runs
+    now = now or datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+    raw_issues = [make_raw_issue(i, rng, now) for i in range(count)]
+    if changelog:
+        # Separate generator so issue fields are the same with or without changelogs
+        changelog_rng = random.Random(seed + 1)
+        for raw in raw_issues:
+            raw['changelog'] = make_changelog(raw, changelog_rng)
+    return raw_issues
+
+
+def raw_to_issues(raw_issues: List[Dict[str, Any]]) -> List[Any]:
+    """Wrap raw JSON in jira.resources.Issue objects, as search_issues returns them"""
+    from jira.resources import Issue
+    return [Issue(ISSUE_OPTIONS, None, raw=raw) for raw in raw_issues]
+
+
+def search_response(raw_issues: List[Dict[str, Any]], start_at: int = 0, max_results: int = 50) -> Dict[str, Any]:
+    """Build a /rest/api/2/search response page for the given issues"""
+    page = raw_issues[start_at:start_at + max_results]
+    return {
+        'expand': 'schema,names',
+        'startAt': start_at,
+        'maxResults': max_results,
+        'total': len(raw_issues),
+        'issues': page
+    }
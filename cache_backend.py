@@ -0,0 +1,423 @@
+"""
+Shared cache backend for JIRA Daily Activity Dashboard
+Redis client that lets dashboard replicas share query results as compact Parquet/JSON payloads,
+plus an in-memory Redis-protocol stand-in server for development and tests
+"""
+import hashlib
+import io
+import json
+import logging
+import secrets
+import socketserver
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+from rollup import RollupCube
+
+logger = logging.getLogger(__name__)
+
+# Socket timeout for backend commands; a slow backend must not stall the dashboard
+BACKEND_TIMEOUT_SECONDS = 2.0
+
+# After a backend failure, queries go straight to JIRA for this long before reconnecting
+BACKEND_RETRY_SECONDS = 30.0
+
+# Connections kept per replica; sessions use them concurrently
+BACKEND_MAX_CONNECTIONS = 16
+
+# How long one replica may hold the load lock for a key, and how long others wait for its result
+LOAD_LOCK_SECONDS = 60.0
+LOAD_WAIT_SECONDS = 30.0
+LOAD_POLL_SECONDS = 0.2
+
+# The shared generation (bumped by a refresh) is re-read at most this often
+GENERATION_CHECK_SECONDS = 5.0
+
+# Bump when the payload format changes so replicas on different versions never share entries
+PAYLOAD_VERSION = 1
+
+DEFAULT_NAMESPACE = "jira-dashboard"
+
+# Deletes a load lock only while it still holds this replica's token, so a lock that expired
+# and was taken over by another replica is left alone
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Payload type tags
+_FRAME = b'F'
+_ROLLUP = b'R'
+_JSON = b'J'
+
+
+class RespError(Exception):
+    """Error reply of the local stand-in server"""
+
+
+def serialize(value: Any) -> Optional[bytes]:
+    """Compact payload for a query result, or None when the value cannot be stored remotely"""
+    try:
+        if isinstance(value, RollupCube):
+            return _ROLLUP + _frame_bytes(value.cells)
+        if isinstance(value, pd.DataFrame):
+            return _FRAME + _frame_bytes(value)
+        return _JSON + json.dumps(value, separators=(',', ':')).encode('utf-8')
+    except (TypeError, ValueError, ImportError) as e:
+        # e.g. mixed-type custom field columns; such results are only cached in-process
+        logger.debug(f"Result of type {type(value).__name__} not stored in the shared cache: {str(e)}")
+        return None
+
+
+def deserialize(payload: bytes) -> Any:
+    """Query result from a payload written by serialize()"""
+    tag, body = payload[:1], payload[1:]
+    if tag == _FRAME:
+        return _read_frame(body)
+    if tag == _ROLLUP:
+        return RollupCube(_read_frame(body))
+    if tag == _JSON:
+        return json.loads(body)
+    raise ValueError(f"Unknown payload type: {tag!r}")
+
+
+def _frame_bytes(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    try:
+        df.to_parquet(buffer, compression='zstd')
+    except Exception as e:
+        # pyarrow raises its own error types for unconvertible columns
+        raise TypeError(str(e)) from e
+    return buffer.getvalue()
+
+
+def _read_frame(body: bytes) -> pd.DataFrame:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(io.BytesIO(body))
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+            # to_pandas gives numpy arrays; the frame that was stored held Python lists
+            df[field.name] = pd.Series(table.column(field.name).to_pylist(), index=df.index, dtype=object)
+    return df
+
+
+class RedisCacheBackend:
+    """Query result cache on any Redis-protocol server (Redis, Valkey, KeyDB or the local stand-in).
+
+    Entries are written with the query TTL, so every replica sees the same expiry. A refresh bumps
+    a shared generation number instead of deleting keys; entries of older generations simply expire.
+    Commands run on a connection pool, so sessions do not wait on each other's cache traffic.
+    """
+
+    def __init__(self, url: str, namespace: str = DEFAULT_NAMESPACE, timeout: float = BACKEND_TIMEOUT_SECONDS):
+        import redis
+
+        try:
+            self.client = redis.Redis.from_url(
+                url,
+                socket_timeout=timeout,
+                socket_connect_timeout=timeout,
+                max_connections=BACKEND_MAX_CONNECTIONS,
+                # RESP2 is spoken by every Redis-protocol server, including older ones and the stand-in
+                protocol=2
+            )
+        except ValueError as e:
+            raise ValueError(f"Unsupported cache backend URL: {url} ({str(e)})") from e
+        self._errors = (redis.RedisError, OSError)
+        self._release_lock = self.client.register_script(RELEASE_LOCK_SCRIPT)
+        options = self.client.connection_pool.connection_kwargs
+        self.url = url
+        self.host = options.get('host', options.get('path', 'localhost'))
+        self.port = options.get('port')
+        self.db = options.get('db', 0)
+        self.namespace = namespace
+
+        self._down_until = 0.0
+        self._generation = 0
+        self._generation_checked_at = 0.0
+
+    def __repr__(self) -> str:
+        return f"RedisCacheBackend({self.host}:{self.port}/{self.db}, namespace={self.namespace!r})"
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _call(self, command, default: Any = None) -> Any:
+        """Result of command(client); default when the backend is unavailable"""
+        if not self.available:
+            return default
+        try:
+            return command(self.client)
+        except self._errors as e:
+            self._down_until = time.monotonic() + BACKEND_RETRY_SECONDS
+            logger.warning(f"Cache backend {self.host}:{self.port} unavailable, "
+                           f"retrying in {BACKEND_RETRY_SECONDS:.0f}s: {str(e)}")
+            return default
+
+    def _pipeline(self, *commands: Tuple[str, ...]) -> Optional[List[Any]]:
+        """Replies of several commands sent in one round trip; None when the backend is unavailable"""
+        def run(client):
+            with client.pipeline(transaction=False) as pipe:
+                for name, *args in commands:
+                    getattr(pipe, name)(*args)
+                return pipe.execute()
+
+        return self._call(run)
+
+    def ping(self) -> bool:
+        return bool(self._call(lambda client: client.ping(), False))
+
+    def _generation_key(self) -> str:
+        return f"{self.namespace}:generation"
+
+    def generation(self) -> int:
+        """Shared generation number, re-read at most every GENERATION_CHECK_SECONDS"""
+        now = time.monotonic()
+        if now - self._generation_checked_at >= GENERATION_CHECK_SECONDS:
+            self._generation_checked_at = now
+            value = self._call(lambda client: client.get(self._generation_key()), self._generation)
+            self._generation = int(value or 0)
+        return self._generation
+
+    def key_name(self, key: Hashable) -> str:
+        """Backend key for a store key, readable by query name"""
+        query = key[0] if isinstance(key, tuple) and key else "value"
+        digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=12).hexdigest()
+        return f"{self.namespace}:v{PAYLOAD_VERSION}:g{self.generation()}:{query}:{digest}"
+
+    def get(self, name: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """Stored value and remaining TTL in seconds, or None on a miss"""
+        replies = self._pipeline(('get', name), ('pttl', name))
+        if replies is None or not isinstance(replies[0], bytes):
+            return None
+        try:
+            value = deserialize(replies[0])
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {name}: {str(e)}")
+            return None
+        remaining_ms = replies[1]
+        return value, (remaining_ms / 1000 if isinstance(remaining_ms, int) and remaining_ms > 0 else None)
+
+    def set(self, name: str, value: Any, ttl: Optional[float]) -> bool:
+        """Store a value with the query TTL; False when not stored"""
+        payload = serialize(value)
+        if payload is None:
+            return False
+        px = int(ttl * 1000) if ttl else None
+        return bool(self._call(lambda client: client.set(name, payload, px=px), False))
+
+    def acquire_load_lock(self, name: str) -> Optional[str]:
+        """Claim the right to load a key from JIRA.
+
+        Returns the lock token to release it with, or None while another replica holds the lock.
+        When the backend is down every replica loads for itself and gets a token too.
+        """
+        token = secrets.token_hex(16)
+        px = int(LOAD_LOCK_SECONDS * 1000)
+        acquired = self._call(lambda client: client.set(f"{name}:loading", token, nx=True, px=px), True)
+        return token if acquired else None
+
+    def release_load_lock(self, name: str, token: str) -> None:
+        """Release a load lock, unless it expired and another replica holds it now"""
+        self._call(lambda client: self._release_lock(keys=[f"{name}:loading"], args=[token], client=client))
+
+    def wait_for(self, name: str, timeout: float = LOAD_WAIT_SECONDS) -> Optional[Tuple[Any, Optional[float]]]:
+        """Wait for another replica to store a key; None if it gives up or the wait times out"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(LOAD_POLL_SECONDS)
+            replies = self._pipeline(('exists', name), ('exists', f"{name}:loading"))
+            if replies is None:
+                return None
+            if replies[0]:
+                return self.get(name)
+            if not replies[1]:
+                return None
+        return None
+
+    def clear(self) -> None:
+        """Invalidate every replica's entries by starting a new generation"""
+        generation = self._call(lambda client: client.incr(self._generation_key()))
+        if isinstance(generation, int):
+            self._generation = generation
+            self._generation_checked_at = time.monotonic()
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def _read_reply(reader: io.BufferedReader) -> Any:
+    """One RESP value; error replies are returned as RespError instances"""
+    line = reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Connection closed")
+    kind, rest = line[:1], line[1:-2]
+    if kind == b'+':
+        return rest.decode('utf-8')
+    if kind == b'-':
+        return RespError(rest.decode('utf-8'))
+    if kind == b':':
+        return int(rest)
+    if kind == b'$':
+        length = int(rest)
+        if length < 0:
+            return None
+        data = reader.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError("Connection closed")
+        return data[:-2]
+    if kind == b'*':
+        length = int(rest)
+        return None if length < 0 else [_read_reply(reader) for _ in range(length)]
+    raise ConnectionError(f"Unexpected RESP data: {line[:20]!r}")
+
+
+class _LocalRespHandler(socketserver.StreamRequestHandler):
+    """Connection handler of the local stand-in server"""
+
+    def handle(self) -> None:
+        while True:
+            try:
+                command = _read_reply(self.rfile)
+            except (ConnectionError, ValueError):
+                return
+            if not isinstance(command, list) or not command:
+                return
+            name = command[0].decode('utf-8').upper()
+            args = [arg.decode('utf-8') if name != 'SET' or i != 1 else arg for i, arg in enumerate(command[1:])]
+            try:
+                reply = self.server.dispatch(name, args)
+            except Exception as e:
+                reply = RespError(f"ERR {str(e)}")
+            self.wfile.write(_encode_reply(reply))
+
+
+def _encode_reply(reply: Any) -> bytes:
+    if isinstance(reply, RespError):
+        return f"-{reply}\r\n".encode('utf-8')
+    if reply is True:
+        return b"+OK\r\n"
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, list):
+        return b"*%d\r\n" % len(reply) + b"".join(_encode_reply(item) for item in reply)
+    data = reply if isinstance(reply, bytes) else str(reply).encode('utf-8')
+    return b"$%d\r\n%s\r\n" % (len(data), data)
+
+
+class LocalRespServer(socketserver.ThreadingTCPServer):
+    """In-memory Redis-protocol stand-in for development and tests.
+
+    Supports the commands the backend uses (GET/SET/PTTL/EXISTS/DEL/INCR/INCRBY); of Lua scripting it
+    only runs RELEASE_LOCK_SCRIPT.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), _LocalRespHandler)
+        self.data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self.data_lock = threading.Lock()
+        # SHA1 -> script text of the scripts loaded with SCRIPT LOAD or run with EVAL
+        self.scripts: Dict[str, str] = {}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def _live(self, key: str) -> Optional[bytes]:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        if item[1] is not None and time.monotonic() >= item[1]:
+            del self.data[key]
+            return None
+        return item[0]
+
+    def dispatch(self, name: str, args: List[Any]) -> Any:
+        with self.data_lock:
+            if name == 'PING':
+                return 'PONG'
+            if name in ('AUTH', 'SELECT'):
+                return True
+            if name == 'GET':
+                return self._live(args[0])
+            if name == 'SET':
+                key, value, options = args[0], args[1], [a.upper() for a in args[2:]]
+                if 'NX' in options and self._live(key) is not None:
+                    return None
+                expires_at = None
+                if 'PX' in options:
+                    expires_at = time.monotonic() + int(options[options.index('PX') + 1]) / 1000
+                elif 'EX' in options:
+                    expires_at = time.monotonic() + int(options[options.index('EX') + 1])
+                self.data[key] = (value if isinstance(value, bytes) else value.encode('utf-8'), expires_at)
+                return True
+            if name == 'PTTL':
+                if self._live(args[0]) is None:
+                    return -2
+                expires_at = self.data[args[0]][1]
+                return -1 if expires_at is None else int((expires_at - time.monotonic()) * 1000)
+            if name == 'EXISTS':
+                return sum(1 for key in args if self._live(key) is not None)
+            if name == 'DEL':
+                return sum(1 for key in args if self.data.pop(key, None) is not None)
+            if name in ('INCR', 'INCRBY'):
+                value = int(self._live(args[0]) or 0) + (int(args[1]) if name == 'INCRBY' else 1)
+                self.data[args[0]] = (str(value).encode('utf-8'), self.data.get(args[0], (None, None))[1])
+                return value
+            if name == 'SCRIPT' and args and args[0].upper() == 'LOAD':
+                return self._load_script(args[1])
+            if name in ('EVAL', 'EVALSHA'):
+                sha = self._load_script(args[0]) if name == 'EVAL' else args[0]
+                if sha not in self.scripts:
+                    return RespError("NOSCRIPT No matching script")
+                return self._run_script(self.scripts[sha], args[2:2 + int(args[1])], args[2 + int(args[1]):])
+            if name == 'FLUSHDB':
+                self.data.clear()
+                return True
+            return RespError(f"ERR unknown command '{name}'")
+
+    def _load_script(self, script: str) -> str:
+        sha = hashlib.sha1(script.encode('utf-8')).hexdigest()
+        self.scripts[sha] = script
+        return sha
+
+    def _run_script(self, script: str, keys: List[str], args: List[str]) -> Any:
+        if script != RELEASE_LOCK_SCRIPT:
+            return RespError("ERR only the load lock release script is supported")
+        if self._live(keys[0]) == args[0].encode('utf-8'):
+            del self.data[keys[0]]
+            return 1
+        return 0
+
+
+def serve_local(host: str = '127.0.0.1', port: int = 6379) -> None:
+    """Run the local stand-in in the foreground"""
+    server = LocalRespServer(host, port)
+    logger.info(f"Local cache backend listening on {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Local Redis-protocol stand-in for the dashboard cache backend")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=6379)
+    options = parser.parse_args()
+    serve_local(options.host, options.port)
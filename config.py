@@ -1,19 +1,46 @@
 """
 Configuration file for JIRA Daily Activity Dashboard
 """
+import logging
 import os
-import streamlit as st
-from typing import Dict, Any
+import sys
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
+from roster import TEAM_ROSTER_FILE, TeamRoster, load_roster, load_roster_file
+
+logger = logging.getLogger(__name__)
+
+# Secrets files read when running without Streamlit (same locations Streamlit reads)
+SECRETS_FILES = [
+    os.path.join(os.getcwd(), ".streamlit", "secrets.toml"),
+    os.path.join(os.path.expanduser("~"), ".streamlit", "secrets.toml")
+]
+
+def _read_secrets_files() -> Dict[str, Any]:
+    """Secrets from the first readable secrets.toml, for headless runs"""
+    try:
+        import tomllib
+    except ImportError:
+        return {}
+    for path in SECRETS_FILES:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return tomllib.load(f)
+    return {}
 
 def get_jira_credentials():
     """Get JIRA credentials from Streamlit secrets or environment variables"""
     try:
-        # Try to get from Streamlit secrets (for cloud deployment)
-        if hasattr(st, 'secrets') and 'jira' in st.secrets:
+        # Try to get from Streamlit secrets (for cloud deployment); headless runs never import Streamlit
+        st = sys.modules.get('streamlit')
+        secrets = st.secrets if st is not None else _read_secrets_files()
+        if 'jira' in secrets:
             return {
-                "JIRA_URL": st.secrets["jira"]["JIRA_URL"],
-                "JIRA_USERNAME": st.secrets["jira"]["JIRA_USERNAME"], 
-                "JIRA_API_TOKEN": st.secrets["jira"]["JIRA_API_TOKEN"]
+                "JIRA_URL": secrets["jira"]["JIRA_URL"],
+                "JIRA_USERNAME": secrets["jira"]["JIRA_USERNAME"], 
+                "JIRA_API_TOKEN": secrets["jira"]["JIRA_API_TOKEN"]
             }
     except Exception:
         pass
@@ -38,12 +65,17 @@ TEAM_MEMBERS = {
     "Shawn Parry": "shawn.parry@spreetail.com"
 }
 
+# Teams shown in the dashboard: from TEAM_ROSTER_FILE or TEAM_GROUP, else the team above
+TEAM_ROSTER = load_roster(TEAM_MEMBERS)
+
 # Application Settings
 APP_CONFIG = {
     "PAGE_TITLE": "JIRA Daily Activity & Priority Dashboard",
     "PAGE_ICON": "📊",
     "LAYOUT": "wide",
-    "INITIAL_SIDEBAR_STATE": "expanded"
+    "INITIAL_SIDEBAR_STATE": "expanded",
+    # Build only the selected view instead of executing every st.tabs tab on each rerun
+    "LAZY_NAVIGATION": True
 }
 
 # Date and Time Settings
@@ -85,14 +117,98 @@ ISSUE_TYPE_ICONS = {
     "New Feature": "🚀"
 }
 
-def get_config() -> Dict[str, Any]:
-    """Get complete application configuration"""
-    return {
-        "jira": get_jira_credentials(),  # Always get fresh credentials
-        "team_members": TEAM_MEMBERS,
-        "app": APP_CONFIG,
-        "date": DATE_CONFIG,
-        "jql": JQL_QUERIES,
-        "colors": STATUS_COLORS,
-        "icons": ISSUE_TYPE_ICONS
-    } 
\ No newline at end of file
+# Seconds between checks of the config files for changes; 0 disables hot reload
+CONFIG_WATCH_SECONDS = float(os.getenv("CONFIG_WATCH_SECONDS", "5"))
+
+_config: Optional[Mapping[str, Any]] = None
+_config_lock = threading.Lock()
+# Config files changed since the last reload; applied by the next get_config() on a session's script thread
+_pending_changes: List[str] = []
+
+def load_config() -> Mapping[str, Any]:
+    """Build a read-only configuration snapshot"""
+    return MappingProxyType({
+        "jira": MappingProxyType(get_jira_credentials()),
+        # Read-only view of the roster's members, which group resolution fills in place
+        "team_members": MappingProxyType(TEAM_ROSTER.members),
+        "teams": TEAM_ROSTER,
+        "app": MappingProxyType(APP_CONFIG),
+        "date": MappingProxyType(DATE_CONFIG),
+        "jql": MappingProxyType(JQL_QUERIES),
+        "colors": MappingProxyType(STATUS_COLORS),
+        "icons": MappingProxyType(ISSUE_TYPE_ICONS)
+    })
+
+def watched_files() -> List[str]:
+    """Files whose changes reload the configuration"""
+    return SECRETS_FILES + ([TEAM_ROSTER_FILE] if TEAM_ROSTER_FILE else [])
+
+def _file_versions(paths: List[str]) -> Dict[str, Optional[int]]:
+    versions = {}
+    for path in paths:
+        try:
+            versions[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            versions[path] = None
+    return versions
+
+def reload_config(changed: Optional[List[str]] = None) -> Mapping[str, Any]:
+    """Publish a new snapshot with fresh credentials, re-reading the roster file if it changed.
+    
+    Cached query results are kept. A roster file that fails to load keeps the previous roster.
+    """
+    global TEAM_ROSTER, _config
+    roster = TEAM_ROSTER
+    if TEAM_ROSTER_FILE and (changed is None or TEAM_ROSTER_FILE in changed):
+        roster = TeamRoster(load_roster_file(TEAM_ROSTER_FILE))
+    with _config_lock:
+        TEAM_ROSTER = roster
+        _config = load_config()
+    return _config
+
+def _watch_config_files() -> None:
+    """Record changed config files; only stats them, st.secrets is never read from this thread"""
+    global _pending_changes
+    versions = _file_versions(watched_files())
+    while True:
+        time.sleep(CONFIG_WATCH_SECONDS)
+        current = _file_versions(watched_files())
+        changed = [path for path in current if current[path] != versions.get(path)]
+        if not changed:
+            continue
+        versions = current
+        with _config_lock:
+            _pending_changes = list(dict.fromkeys(_pending_changes + changed))
+
+def _can_reload() -> bool:
+    """Whether this thread may re-read st.secrets: a script thread, or any thread without Streamlit"""
+    st = sys.modules.get('streamlit')
+    if st is None:
+        return True
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    return get_script_run_ctx(suppress_warning=True) is not None
+
+def _apply_pending_changes() -> None:
+    global _pending_changes
+    with _config_lock:
+        changed, _pending_changes = _pending_changes, []
+    if not changed:
+        return
+    try:
+        reload_config(changed)
+        logger.info(f"Reloaded configuration after changes to {', '.join(changed)}")
+    except Exception as e:
+        logger.error(f"Failed to reload configuration, keeping the previous one: {str(e)}")
+
+def get_config() -> Mapping[str, Any]:
+    """Get complete application configuration (loaded once; reloaded when its files change)"""
+    global _config
+    if _pending_changes and _can_reload():
+        _apply_pending_changes()
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = load_config()
+                if CONFIG_WATCH_SECONDS > 0:
+                    threading.Thread(target=_watch_config_files, name="config-watch", daemon=True).start()
+    return _config
@@ -0,0 +1,203 @@
+"""
+Cycle-time engine for JIRA Daily Activity Dashboard
+Parses status transitions from issue changelogs once per issue version and answers cycle-time
+and time-in-status questions in vectorized passes over all parsed issues.
+"""
+import logging
+import threading
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+import perf
+from rollup import COMPLETED_STATUSES
+
+logger = logging.getLogger(__name__)
+
+# The cycle starts when work first enters one of these statuses...
+CYCLE_START_STATUSES = ["Development", "In Progress"]
+# ...and ends at the last time it reaches one of these (reopened work counts until it is done again)
+CYCLE_END_STATUSES = COMPLETED_STATUSES
+
+# Issues per changelog request (key IN (...) search with expand=changelog)
+CHANGELOG_BATCH_SIZE = 100
+
+CYCLE_PERCENTILES = (50, 85, 95)
+
+INTERVAL_COLUMNS = ['key', 'status', 'entered', 'left']
+
+# (key, status, entered, left); left is None for the current status
+Interval = Tuple[str, str, datetime, Optional[datetime]]
+
+
+def _timestamp(value: Any) -> Optional[datetime]:
+    """UTC datetime of a JIRA timestamp; fromisoformat is far cheaper per value than pd.to_datetime"""
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            parsed = None
+        if parsed is not None:
+            return parsed.astimezone(timezone.utc) if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    timestamp = pd.to_datetime(value, errors='coerce', utc=True)
+    return None if pd.isna(timestamp) else timestamp.to_pydatetime()
+
+
+def parse_status_intervals(issue) -> List[Interval]:
+    """Time intervals an issue spent in each status, from its changelog"""
+    created = _timestamp(getattr(issue.fields, 'created', None))
+    transitions = []
+    for history in getattr(getattr(issue, 'changelog', None), 'histories', None) or []:
+        at = _timestamp(getattr(history, 'created', None))
+        for item in getattr(history, 'items', []):
+            if getattr(item, 'field', None) == 'status' and at is not None:
+                transitions.append((at, getattr(item, 'fromString', None), getattr(item, 'toString', None)))
+    transitions.sort(key=lambda transition: transition[0])
+
+    if not transitions:
+        status = getattr(getattr(issue.fields, 'status', None), 'name', None)
+        return [(issue.key, status, created, None)] if status and created is not None else []
+
+    intervals = []
+    entered, status = created if created is not None else transitions[0][0], transitions[0][1]
+    for at, _, to_status in transitions:
+        if status:
+            intervals.append((issue.key, status, entered, at))
+        entered, status = at, to_status
+    intervals.append((issue.key, status, entered, None))
+    return intervals
+
+
+def finished_issues(df: pd.DataFrame) -> pd.DataFrame:
+    """Issues of df currently in a cycle end status"""
+    if df.empty or 'status' not in df.columns:
+        return df
+    return df[df['status'].isin(CYCLE_END_STATUSES)]
+
+
+class CycleTimeEngine:
+    """Status intervals per issue, keyed by (key, updated) so each changelog is fetched and parsed once"""
+
+    def __init__(self):
+        # key -> (updated of the parsed version, intervals)
+        self._issues: Dict[str, Tuple[datetime, List[Interval]]] = {}
+        self._lock = threading.Lock()
+        self._frame: Optional[pd.DataFrame] = None
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def stale_keys(self, df: pd.DataFrame) -> List[str]:
+        """Keys of issues not parsed yet or updated since they were parsed"""
+        if df.empty or 'key' not in df.columns:
+            return []
+        with self._lock:
+            parsed = pd.Series({key: updated for key, (updated, _) in self._issues.items()}, dtype='datetime64[ns, UTC]')
+        known = parsed.reindex(df['key'].to_numpy())
+        updated = pd.to_datetime(df['updated'], errors='coerce', utc=True).to_numpy()
+        stale = known.isna().to_numpy() | (updated > known.to_numpy())
+        return list(dict.fromkeys(df['key'].to_numpy()[stale]))
+
+    def ingest(self, issues: Iterable[Any]) -> int:
+        """Parse the changelogs of issues returned with expand=changelog; returns how many were parsed"""
+        parsed = {}
+        for issue in issues:
+            updated = _timestamp(getattr(issue.fields, 'updated', None))
+            parsed[issue.key] = (updated, parse_status_intervals(issue))
+        with self._lock:
+            self._issues.update(parsed)
+            self._frame = None
+        return len(parsed)
+
+    def refresh(self, jira, df: pd.DataFrame, executor: Optional[Executor] = None) -> int:
+        """Fetch and parse changelogs of the finished issues in df that are new or whose updated advanced.
+
+        Only finished issues get a cycle time, so open issues cost no changelog request; batches run on executor.
+        """
+        df = finished_issues(df)
+        stale = self.stale_keys(df)
+        batches = [stale[start:start + CHANGELOG_BATCH_SIZE] for start in range(0, len(stale), CHANGELOG_BATCH_SIZE)]
+
+        @perf.in_current_rerun
+        def fetch(batch: List[str]):
+            return batch, jira.search_issues(
+                f"key in ({', '.join(batch)})",
+                maxResults=len(batch),
+                fields='status,created,updated',
+                expand='changelog'
+            )
+
+        with perf.span("jira.search_issues changelog", "jira"):
+            for batch, issues in (executor.map(fetch, batches) if executor else map(fetch, batches)):
+                self.ingest(issues)
+                # Issues the search no longer returns (deleted, moved) are recorded without intervals
+                missing = set(batch) - {issue.key for issue in issues}
+                if missing:
+                    versions = df.drop_duplicates('key').set_index('key')['updated']
+                    with self._lock:
+                        for key in missing:
+                            self._issues[key] = (_timestamp(versions.get(key)), [])
+                        self._frame = None
+        if stale:
+            logger.info(f"Parsed changelogs of {len(stale)} new or updated issues")
+        return len(stale)
+
+    def intervals(self) -> pd.DataFrame:
+        """All parsed status intervals as one frame, rebuilt only after new changelogs were parsed"""
+        with self._lock:
+            if self._frame is None:
+                rows = [interval for _, intervals in self._issues.values() for interval in intervals]
+                frame = pd.DataFrame(rows, columns=INTERVAL_COLUMNS)
+                frame['entered'] = pd.to_datetime(frame['entered'], utc=True)
+                frame['left'] = pd.to_datetime(frame['left'], utc=True)
+                self._frame = frame
+            return self._frame
+
+    def cycle_times(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cycle time (first start status -> last done status) of the finished issues in df"""
+        columns = ['key', 'issue_type', 'assignee', 'started', 'completed', 'cycle_days']
+        df = finished_issues(df)
+        if df.empty:
+            return pd.DataFrame(columns=columns)
+        intervals = self.intervals()
+        intervals = intervals[intervals['key'].isin(df['key'])]
+
+        starts = intervals.loc[intervals['status'].isin(CYCLE_START_STATUSES)].groupby('key')['entered'].min()
+        ends = intervals.loc[intervals['status'].isin(CYCLE_END_STATUSES)].groupby('key')['entered'].max()
+        cycles = pd.DataFrame({'started': starts, 'completed': ends}).dropna()
+        cycles = cycles[cycles['completed'] >= cycles['started']]
+        cycles['cycle_days'] = (cycles['completed'] - cycles['started']).dt.total_seconds() / 86400
+
+        issue_info = df.drop_duplicates('key').set_index('key')[['issue_type', 'assignee']]
+        return cycles.join(issue_info, how='inner').rename_axis('key').reset_index()[columns]
+
+    def time_in_status(self, keys: Sequence[str], now: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Days each issue spent per status (the current status counts until now)"""
+        intervals = self.intervals()
+        intervals = intervals[intervals['key'].isin(keys)]
+        if intervals.empty:
+            return pd.DataFrame()
+        now = now or pd.Timestamp.now(tz='UTC')
+        days = (intervals['left'].fillna(now) - intervals['entered']).dt.total_seconds() / 86400
+        return days.groupby([intervals['key'], intervals['status']]).sum().unstack(fill_value=0.0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._issues.clear()
+            self._frame = None
+
+
+def cycle_time_percentiles(cycles: pd.DataFrame, by: str, percentiles: Sequence[int] = CYCLE_PERCENTILES) -> pd.DataFrame:
+    """Issue count and cycle-time percentiles (days) per value of a column, e.g. assignee or issue_type"""
+    if cycles.empty:
+        return pd.DataFrame(columns=[by, 'issues'] + [f"p{p}" for p in percentiles])
+    grouped = cycles.groupby(by, observed=True)['cycle_days']
+    table = grouped.quantile([p / 100 for p in percentiles]).unstack()
+    table.columns = [f"p{p}" for p in percentiles]
+    table.insert(0, 'issues', grouped.size())
+    return table.sort_values('issues', ascending=False).rename_axis(by).reset_index()
+
+
+CYCLE_TIMES = CycleTimeEngine()
@@ -0,0 +1,413 @@
+"""
+Standalone data service for JIRA Daily Activity Dashboard
+Long-running process that owns the JIRA connection, the query cache and refresh scheduling,
+and serves query results to thin dashboard frontends as Arrow IPC streams.
+Usage: python data_service.py --port 8780
+       python data_service.py --socket /tmp/jira-data.sock
+"""
+import argparse
+import http.client
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlencode, urlparse
+
+import pandas as pd
+
+import data_store
+from rollup import RollupCube, build_rollup
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8780
+
+# Query methods served, with their parameters (in JIRAClient order) and result kind
+SERVICE_QUERIES: Dict[str, Tuple[List[str], str]] = {
+    'get_weekly_activity': (['days_back'], 'frame'),
+    'get_team_weekly_activity': (['days_back', 'selected_members'], 'frame'),
+    'get_priority_issues': (['priority_type'], 'frame'),
+    'get_my_issues': ([], 'frame'),
+    'get_projects': ([], 'json'),
+    'get_team_priority_issues': (['priority_type', 'selected_members'], 'frame'),
+    'get_enhanced_priority_issues': (['priority_type', 'selected_members'], 'frame'),
+    'get_last_week_completed': (['selected_members'], 'frame'),
+    'get_team_weekly_rollup': (['days_back', 'selected_members'], 'rollup'),
+    'get_last_week_completed_rollup': (['selected_members'], 'rollup'),
+    'get_team_snapshot_issues': (['selected_members', 'resolved_since'], 'frame'),
+    'get_cycle_times': (['days_back', 'selected_members'], 'frame'),
+    'get_group_members': (['group'], 'json')
+}
+
+# Parameters that take a list of values (repeated in the query string)
+LIST_PARAMETERS = {'selected_members'}
+INT_PARAMETERS = {'days_back'}
+
+ARROW_STREAM_MIME = 'application/vnd.apache.arrow.stream'
+
+# Results of recently requested queries are reloaded before they expire, so viewers never wait on JIRA
+REFRESH_CHECK_SECONDS = 30
+REFRESH_AHEAD_SECONDS = 60
+ACTIVE_QUERY_SECONDS = 15 * 60
+
+# Client-side timeout; a cold query may page through several thousand issues
+CLIENT_TIMEOUT_SECONDS = 120.0
+
+EMPTY_RESULTS = {
+    'frame': pd.DataFrame,
+    'json': list,
+    'rollup': lambda: build_rollup(pd.DataFrame())
+}
+
+
+def _arrow_stream(df: pd.DataFrame) -> bytes:
+    """Frame as an Arrow IPC stream (mixed-type object columns are sent as text)"""
+    import pyarrow as pa
+
+    from exporters import arrow_schema
+
+    df, schema = arrow_schema(df)
+    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _read_arrow_stream(body: bytes) -> pd.DataFrame:
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(body).read_all().to_pandas()
+
+
+def encode_result(value: Any) -> Tuple[str, str, bytes]:
+    """Result kind, content type and body for a query result"""
+    if isinstance(value, RollupCube):
+        return 'rollup', ARROW_STREAM_MIME, _arrow_stream(value.cells)
+    if isinstance(value, pd.DataFrame):
+        return 'frame', ARROW_STREAM_MIME, _arrow_stream(value)
+    return 'json', 'application/json', json.dumps(value, default=str).encode('utf-8')
+
+
+def decode_result(kind: str, body: bytes) -> Any:
+    """Query result from a response body written by encode_result"""
+    if kind == 'rollup':
+        return RollupCube(_read_arrow_stream(body))
+    if kind == 'frame':
+        return _read_arrow_stream(body)
+    return json.loads(body)
+
+
+def parse_arguments(name: str, query: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Keyword arguments of a query from its URL parameters"""
+    parameters, _ = SERVICE_QUERIES[name]
+    unknown = set(query) - set(parameters)
+    if unknown:
+        raise ValueError(f"Unknown parameters for {name}: {', '.join(sorted(unknown))}")
+    kwargs = {}
+    for parameter in parameters:
+        if parameter not in query:
+            continue
+        values = [value for value in query[parameter] if value]
+        if parameter in LIST_PARAMETERS:
+            kwargs[parameter] = values
+        elif values:
+            kwargs[parameter] = int(values[-1]) if parameter in INT_PARAMETERS else values[-1]
+    return kwargs
+
+
+class DataService:
+    """Owns one JIRAClient and answers queries from the shared store, refreshing active results ahead of expiry"""
+
+    def __init__(self):
+        self._client = None
+        self._client_lock = threading.Lock()
+        # (query, frozen arguments) -> when it was last requested
+        self._recent: Dict[Tuple[str, Tuple], float] = {}
+        self._recent_lock = threading.Lock()
+        self._stop = threading.Event()
+        self.started_at = time.time()
+
+    @property
+    def client(self):
+        """JIRA client, connected on first use, after a failed connection and after a credentials reload"""
+        if self._client is None or self._client.credentials_changed():
+            with self._client_lock:
+                if self._client is None or self._client.credentials_changed():
+                    from jira_client import JIRAClient
+                    self._client = JIRAClient()
+        return self._client
+
+    def call(self, name: str, kwargs: Dict[str, Any]) -> Any:
+        if name not in SERVICE_QUERIES:
+            raise KeyError(name)
+        frozen = tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(kwargs.items()))
+        with self._recent_lock:
+            self._recent[(name, frozen)] = time.monotonic()
+        return getattr(self.client, name)(**kwargs)
+
+    def refresh_active_queries(self) -> int:
+        """Reload recently requested results that expire soon; returns the number of queries checked"""
+        cutoff = time.monotonic() - ACTIVE_QUERY_SECONDS
+        with self._recent_lock:
+            for stale in [call for call, seen in self._recent.items() if seen < cutoff]:
+                del self._recent[stale]
+            calls = list(self._recent)
+
+        # A failed refresh leaves the current result in place until it expires
+        with data_store.refresh_ahead(REFRESH_AHEAD_SECONDS), data_store.raise_query_errors():
+            for name, frozen in calls:
+                kwargs = {k: list(v) if isinstance(v, tuple) else v for k, v in frozen}
+                try:
+                    getattr(self.client, name)(**kwargs)
+                except Exception as e:
+                    logger.warning(f"Background refresh of {name} failed: {str(e)}")
+        return len(calls)
+
+    def _refresh_forever(self) -> None:
+        while not self._stop.wait(REFRESH_CHECK_SECONDS):
+            self.refresh_active_queries()
+
+    def start_refresher(self) -> None:
+        threading.Thread(target=self._refresh_forever, name="data-service-refresh", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def clear(self) -> None:
+        """Drop cached results so the next requests reload from JIRA"""
+        data_store.STORE.clear()
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            'status': 'ok',
+            'jira_connected': self._client is not None,
+            'uptime_s': time.time() - self.started_at,
+            'active_queries': len(self._recent),
+            'cache': data_store.STORE.stats()
+        }
+
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """GET /query/<name>, GET /health, POST /refresh"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self) -> None:
+        super().setup()
+        if self.connection.family != socket.AF_UNIX:
+            # Headers and body are separate writes; don't let Nagle hold back the body
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send(self, status: int, content_type: str, body: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        self._send(status, 'application/json', json.dumps(payload, default=str).encode('utf-8'))
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == '/health':
+            self._send_json(200, self.server.service.health())
+            return
+        if not url.path.startswith('/query/'):
+            self._send_json(404, {'error': f"Not found: {url.path}"})
+            return
+
+        name = url.path[len('/query/'):]
+        if name not in SERVICE_QUERIES:
+            self._send_json(404, {'error': f"Unknown query: {name}"})
+            return
+        try:
+            kwargs = parse_arguments(name, parse_qs(url.query, keep_blank_values=True))
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        start = time.perf_counter()
+        try:
+            kind, content_type, body = encode_result(self.server.service.call(name, kwargs))
+        except Exception as e:
+            logger.error(f"Query {name} failed: {str(e)}")
+            self._send_json(500, {'error': str(e)})
+            return
+        self._send(200, content_type, body, {
+            'X-Result-Kind': kind,
+            'Server-Timing': f"query;dur={(time.perf_counter() - start) * 1000:.1f}"
+        })
+
+    def do_POST(self) -> None:
+        if urlparse(self.path).path != '/refresh':
+            self._send_json(404, {'error': f"Not found: {self.path}"})
+            return
+        self.server.service.clear()
+        self._send_json(200, {'status': 'cleared'})
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        return request, ('local', 0)
+
+
+def create_server(service: DataService, host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                  socket_path: Optional[str] = None) -> socketserver.BaseServer:
+    """HTTP server for the service on a TCP port or a Unix socket"""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _UnixHTTPServer(socket_path, _ServiceHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), _ServiceHandler)
+        server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def service_url(server: socketserver.BaseServer) -> str:
+    """URL clients use to reach a server returned by create_server"""
+    if isinstance(server, _UnixHTTPServer):
+        return f"unix://{quote(server.server_address)}"
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class DataServiceClient:
+    """Thin stand-in for JIRAClient that fetches query results from a data service.
+
+    Accepts http://host:port or unix:///path/to/socket. Like JIRAClient, a failed query is
+    logged and answered with an empty result.
+    """
+
+    def __init__(self, url: str, timeout: float = CLIENT_TIMEOUT_SECONDS):
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'unix'):
+            raise ValueError(f"Unsupported data service URL: {url}")
+        self.url = url
+        self.timeout = timeout
+        self._parsed = parsed
+        self._local = threading.local()
+        self.health()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        # One keep-alive connection per thread
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if self._parsed.scheme == 'unix':
+                connection = _UnixHTTPConnection(self._parsed.path, self.timeout)
+            else:
+                connection = http.client.HTTPConnection(self._parsed.hostname, self._parsed.port or DEFAULT_PORT,
+                                                        timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def _request(self, method: str, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, path)
+                response = connection.getresponse()
+                return response.status, dict(response.getheaders()), response.read()
+            except (http.client.HTTPException, OSError):
+                # Stale keep-alive connection: reconnect once
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+
+    def health(self) -> Dict[str, Any]:
+        """Service status; raises when the service is unreachable"""
+        status, _, body = self._request('GET', '/health')
+        if status != 200:
+            raise ConnectionError(f"Data service unhealthy ({status})")
+        return json.loads(body)
+
+    def refresh(self) -> None:
+        """Ask the service to drop its cached results"""
+        try:
+            self._request('POST', '/refresh')
+        except (http.client.HTTPException, OSError) as e:
+            logger.error(f"Failed to refresh data service: {str(e)}")
+
+    def query(self, name: str, *args, **kwargs) -> Any:
+        parameters, kind = SERVICE_QUERIES[name]
+        kwargs.update(zip(parameters, args))
+        params = [
+            (parameter, value)
+            for parameter, values in kwargs.items() if values is not None
+            for value in (values if parameter in LIST_PARAMETERS else [values])
+        ]
+        path = f"/query/{name}" + (f"?{urlencode(params)}" if params else "")
+        try:
+            status, headers, body = self._request('GET', path)
+            if status != 200:
+                raise RuntimeError(json.loads(body).get('error', status))
+            return decode_result(headers.get('X-Result-Kind', kind), body)
+        except Exception as e:
+            logger.error(f"Data service query {name} failed: {str(e)}")
+            return EMPTY_RESULTS[kind]()
+
+    def __getattr__(self, name: str):
+        if name in SERVICE_QUERIES:
+            return lambda *args, **kwargs: self.query(name, *args, **kwargs)
+        raise AttributeError(name)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import telemetry
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="JIRA dashboard data service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=int(os.getenv('DATA_SERVICE_PORT', DEFAULT_PORT)))
+    parser.add_argument('--socket', help="Listen on a Unix socket instead of a TCP port")
+    parser.add_argument('--no-refresh', action='store_true', help="Disable background refresh of active queries")
+    args = parser.parse_args(argv)
+
+    service = DataService()
+    server = create_server(service, args.host, args.port, args.socket)
+    telemetry.ensure_exporter()
+    if not args.no_refresh:
+        service.start_refresher()
+    logger.info(f"Data service listening on {service_url(server)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
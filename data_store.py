@@ -0,0 +1,444 @@
+"""
+Shared in-process data store for JIRA Daily Activity Dashboard
+Query results are loaded once per process, kept within a byte budget and handed to every session as zero-copy views
+"""
+import functools
+import inspect
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+import telemetry
+from cache_backend import RedisCacheBackend, DEFAULT_NAMESPACE
+
+logger = logging.getLogger(__name__)
+
+# Memory budget for stored query results (override with DATA_CACHE_MAX_BYTES)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Eviction policy when over budget (override with DATA_CACHE_POLICY)
+EVICTION_POLICIES = ('lru', 'lfu')
+DEFAULT_POLICY = 'lru'
+
+# Refresh-ahead window of the current thread (see refresh_ahead)
+_refresh_local = threading.local()
+
+# Shared queries running on the current thread, and whether failures are raised (see raise_query_errors)
+_query_local = threading.local()
+
+# pandas 3 always uses Copy-on-Write
+_PANDAS_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3
+
+
+def _copy_on_write() -> bool:
+    """Whether shallow copies are isolated from writes (pandas 3, or pandas 2 with the option enabled)"""
+    return _PANDAS_COPY_ON_WRITE or pd.get_option('mode.copy_on_write') is True
+
+
+def share(value: Any) -> Any:
+    """View of a stored value that callers may modify without affecting the store"""
+    if isinstance(value, pd.DataFrame):
+        # With Copy-on-Write a shallow copy shares all column data until one side writes; without it
+        # the frame is copied, as the process-wide pandas option is left to the application
+        return value.copy(deep=not _copy_on_write())
+    if isinstance(value, (list, dict)):
+        return value.copy()
+    return value
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate in-memory size of a stored value in bytes"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    cells = getattr(value, 'cells', None)
+    if isinstance(cells, pd.DataFrame):
+        # Rollup cubes and other wrappers around a frame
+        return int(cells.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+def _describe_key(key: Hashable) -> Tuple[str, str]:
+    """Query name and readable arguments of a store key"""
+    if not isinstance(key, tuple) or not key:
+        return str(key), ""
+    arguments = [
+        f"{part[0]}={part[1]}" if isinstance(part, tuple) and len(part) == 2 else str(part)
+        for part in key[1:]
+    ]
+    return str(key[0]), ", ".join(arguments)
+
+
+class StoreEntry:
+    """One stored query result with its size and usage statistics"""
+
+    def __init__(self, value: Any, ttl: Optional[float]):
+        self.value = value
+        self.size = estimate_size(value)
+        self.stored_at = time.monotonic()
+        self.last_access = self.stored_at
+        self.expires_at = self.stored_at + ttl if ttl else None
+        self.hits = 0
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+
+class _KeyLock:
+    """Per-key load lock with the number of threads holding or waiting on it"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class SharedDataStore:
+    """Process-wide result store with a byte budget, LRU/LFU eviction and per-key single-flight loading"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, policy: str = DEFAULT_POLICY,
+                 backend: Optional[RedisCacheBackend] = None):
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        self.max_bytes = max_bytes
+        self.policy = policy
+        # Optional cache shared with other replicas, consulted before running a loader
+        self.backend = backend
+        self._generation: Optional[int] = None
+        # Insertion order doubles as recency order: hits move entries to the end
+        self._entries: "OrderedDict[Hashable, StoreEntry]" = OrderedDict()
+        # Only keys being loaded have a lock; it lives as long as a thread holds or waits on it
+        self._key_locks: Dict[Hashable, _KeyLock] = {}
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.backend_hits = 0
+        self.evictions = 0
+        self.rejected = 0
+
+    @contextmanager
+    def _key_lock(self, key: Hashable):
+        """Hold the load lock of key; it is dropped once no thread holds or waits on it"""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, _KeyLock())
+            key_lock.users += 1
+        try:
+            with key_lock.lock:
+                yield
+        finally:
+            with self._lock:
+                key_lock.users -= 1
+                if not key_lock.users:
+                    del self._key_locks[key]
+
+    def _remove(self, key: Hashable, reason: str) -> None:
+        """Drop an entry (caller holds the store lock)"""
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+        if reason == 'budget':
+            self.evictions += 1
+        telemetry.DATA_CACHE_EVICTIONS.inc(reason=reason)
+
+    def _lookup(self, key: Hashable, ahead: float = 0.0) -> Optional[StoreEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expired:
+                self._remove(key, 'expired')
+                self._publish()
+                return None
+            if ahead and entry.expires_at is not None and entry.expires_at - time.monotonic() < ahead:
+                # Due for a refresh; other callers keep getting this entry until the reload replaces it
+                return None
+            entry.hits += 1
+            entry.last_access = time.monotonic()
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _victim(self) -> Hashable:
+        """Key to evict next under the configured policy (caller holds the store lock)"""
+        if self.policy == 'lfu':
+            # Least hits first; among equals, the least recently used
+            return min(self._entries.items(), key=lambda item: (item[1].hits, item[1].last_access))[0]
+        return next(iter(self._entries))
+
+    def _insert(self, key: Hashable, entry: StoreEntry) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key, 'replaced')
+            if entry.size > self.max_bytes:
+                # Larger than the whole budget: serve it once without caching
+                self.rejected += 1
+                logger.warning(f"Result for {_describe_key(key)[0]} ({entry.size} bytes) exceeds the cache budget")
+                return
+            for expired_key in [k for k, e in self._entries.items() if e.expired]:
+                self._remove(expired_key, 'expired')
+            while self._entries and self.total_bytes + entry.size > self.max_bytes:
+                self._remove(self._victim(), 'budget')
+            self._entries[key] = entry
+            self.total_bytes += entry.size
+            self._publish()
+
+    def _publish(self) -> None:
+        """Export the current footprint as gauges (caller holds the store lock)"""
+        telemetry.DATA_CACHE_BYTES.set(self.total_bytes)
+        telemetry.DATA_CACHE_ENTRIES.set(len(self._entries))
+
+    def _sync_generation(self) -> None:
+        """Drop local entries when another replica refreshed the shared cache"""
+        generation = self.backend.generation()
+        if generation != self._generation:
+            if self._generation is not None:
+                self._clear_local()
+                logger.info(f"Shared cache generation changed to {generation}, local results dropped")
+            self._generation = generation
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float],
+              refreshing: bool = False) -> StoreEntry:
+        """Load a missing key from the shared backend, or run loader and publish its result there"""
+        if self.backend is None:
+            entry = StoreEntry(loader(), ttl)
+            with self._lock:
+                self.misses += 1
+            return entry
+
+        name = self.backend.key_name(key)
+        # A refresh must reload from JIRA rather than take the entry that is about to expire
+        shared = None if refreshing else self.backend.get(name)
+        token = None
+        if shared is None and not refreshing:
+            # Only one replica loads a given key; the others wait for its result
+            token = self.backend.acquire_load_lock(name)
+            if token is None:
+                shared = self.backend.wait_for(name)
+        if shared is not None:
+            value, remaining = shared
+            telemetry.DATA_CACHE_BACKEND_REQUESTS.inc(result='hit')
+            with self._lock:
+                self.backend_hits += 1
+            # Expire with the shared entry rather than restarting the TTL locally
+            return StoreEntry(value, remaining or ttl)
+
+        try:
+            entry = StoreEntry(loader(), ttl)
+            with self._lock:
+                self.misses += 1
+            stored = self.backend.set(name, entry.value, ttl)
+            telemetry.DATA_CACHE_BACKEND_REQUESTS.inc(result='stored' if stored else 'not_stored')
+            return entry
+        finally:
+            if token is not None:
+                self.backend.release_load_lock(name, token)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Return a shared view of the value for key, running loader once across concurrent callers"""
+        if self.backend is not None:
+            self._sync_generation()
+        ahead = getattr(_refresh_local, 'seconds', 0.0)
+        entry = self._lookup(key, ahead)
+        if entry is None:
+            # Only one session loads a given key; the others wait and reuse its result
+            with self._key_lock(key):
+                entry = self._lookup(key, ahead)
+                if entry is None:
+                    entry = self._load(key, loader, ttl, refreshing=bool(ahead))
+                    self._insert(key, entry)
+        return share(entry.value)
+
+    def _clear_local(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+            self._publish()
+
+    def clear(self) -> None:
+        """Drop every stored result, in this process and in the shared backend"""
+        self._clear_local()
+        if self.backend is not None:
+            self.backend.clear()
+            self._generation = self.backend.generation()
+        logger.info("Shared data store cleared")
+
+    def configure(self, max_bytes: Optional[int] = None, policy: Optional[str] = None) -> None:
+        """Change the budget or eviction policy, evicting immediately if over budget"""
+        with self._lock:
+            if policy is not None:
+                if policy not in EVICTION_POLICIES:
+                    raise ValueError(f"Unknown eviction policy: {policy}")
+                self.policy = policy
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            while self._entries and self.total_bytes > self.max_bytes:
+                self._remove(self._victim(), 'budget')
+            self._publish()
+
+    def stats(self) -> Dict[str, Any]:
+        """Footprint and effectiveness counters of the store"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.backend_hits
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'policy': self.policy,
+                'backend': repr(self.backend) if self.backend is not None else None,
+                'hits': self.hits,
+                'misses': self.misses,
+                'backend_hits': self.backend_hits,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'rejected': self.rejected
+            }
+
+    def entries_dataframe(self) -> pd.DataFrame:
+        """One row per stored result: query, arguments, size, hits, age and remaining TTL"""
+        now = time.monotonic()
+        with self._lock:
+            rows = [
+                {
+                    'query': _describe_key(key)[0],
+                    'arguments': _describe_key(key)[1],
+                    'bytes': entry.size,
+                    'hits': entry.hits,
+                    'age_s': now - entry.stored_at,
+                    'ttl_left_s': entry.expires_at - now if entry.expires_at is not None else None
+                }
+                for key, entry in self._entries.items()
+            ]
+        return pd.DataFrame(rows, columns=['query', 'arguments', 'bytes', 'hits', 'age_s', 'ttl_left_s'])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@contextmanager
+def refresh_ahead(seconds: float):
+    """Within the block, stored results expiring in less than seconds are reloaded instead of served"""
+    previous = getattr(_refresh_local, 'seconds', 0.0)
+    _refresh_local.seconds = seconds
+    try:
+        yield
+    finally:
+        _refresh_local.seconds = previous
+
+
+def render_cache_panel(store: SharedDataStore) -> None:
+    """Render the collapsible Data Cache panel with the store footprint and its entries"""
+    import streamlit as st
+
+    stats = store.stats()
+    title = f"🗄️ Data Cache ({stats['bytes'] / 1024 / 1024:.1f} / {stats['max_bytes'] / 1024 / 1024:.0f} MB, {stats['entries']} entries)"
+    with st.expander(title, expanded=False):
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Hit Rate", f"{stats['hit_rate'] * 100:.0f}%")
+        col2.metric("Shared Hits", stats['backend_hits'])
+        col3.metric("Misses", stats['misses'])
+        col4.metric("Evictions", stats['evictions'])
+        col5.metric("Policy", stats['policy'].upper())
+        if stats['backend']:
+            st.caption(f"Shared backend: {stats['backend']}")
+
+        entries_df = store.entries_dataframe()
+        if not entries_df.empty:
+            st.dataframe(
+                entries_df.assign(kb=entries_df['bytes'] / 1024).drop(columns=['bytes']),
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "kb": st.column_config.NumberColumn("Size (KB)", format="%.1f"),
+                    "age_s": st.column_config.NumberColumn("Age (s)", format="%.0f"),
+                    "ttl_left_s": st.column_config.NumberColumn("TTL Left (s)", format="%.0f")
+                }
+            )
+
+
+def _backend_from_env() -> Optional[RedisCacheBackend]:
+    """Shared backend configured by DATA_CACHE_BACKEND_URL (e.g. redis://cache:6379/0), if any"""
+    url = os.getenv("DATA_CACHE_BACKEND_URL", "")
+    if not url:
+        return None
+    try:
+        return RedisCacheBackend(url, namespace=os.getenv("DATA_CACHE_NAMESPACE", DEFAULT_NAMESPACE))
+    except (ValueError, ImportError) as e:
+        logger.error(f"Shared cache backend disabled: {str(e)}")
+        return None
+
+
+STORE = SharedDataStore(
+    max_bytes=int(os.getenv("DATA_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+    policy=os.getenv("DATA_CACHE_POLICY", DEFAULT_POLICY),
+    backend=_backend_from_env()
+)
+
+
+def _normalize_argument(value: Any) -> Hashable:
+    """Hashable cache-key form of a query argument; member lists are order-insensitive"""
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(value)) if value else "all"
+    return value
+
+
+class QueryError(Exception):
+    """A shared query failed; result, if any, is the partial result to serve instead of the fallback"""
+
+    def __init__(self, message: str, result: Any = None):
+        super().__init__(message)
+        self.result = result
+
+
+@contextmanager
+def raise_query_errors():
+    """Within the block, failed shared queries raise QueryError instead of returning their fallback"""
+    previous = getattr(_query_local, 'strict', False)
+    _query_local.strict = True
+    try:
+        yield
+    finally:
+        _query_local.strict = previous
+
+
+def shared_query(ttl: Optional[float] = None, store: Optional[SharedDataStore] = None,
+                 fallback: Callable[[], Any] = pd.DataFrame) -> Callable:
+    """Serve a JIRAClient query from the shared store instead of st.cache_data.
+
+    Like st.cache_data with an underscored _self, the client instance is not part of the key,
+    so every session shares one result per argument combination. A query signals failure by
+    raising QueryError: nothing is stored or shared, and the caller gets fallback() instead.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = list(bound.arguments.items())[1:]  # Skip the client instance
+            key: Tuple = (func.__qualname__,) + tuple((name, _normalize_argument(value)) for name, value in arguments)
+            depth = getattr(_query_local, 'depth', 0)
+            _query_local.depth = depth + 1
+            try:
+                return (STORE if store is None else store).get_or_load(key, lambda: func(*args, **kwargs), ttl)
+            except QueryError as e:
+                # Inside another query the failure propagates, so the enclosing result is not stored either
+                if depth or getattr(_query_local, 'strict', False):
+                    raise
+                return e.result if e.result is not None else fallback()
+            finally:
+                _query_local.depth = depth
+
+        return wrapper
+
+    return decorator
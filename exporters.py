@@ -0,0 +1,194 @@
+"""
+Report export subsystem for JIRA Daily Activity Dashboard
+Chunked CSV, Parquet, Excel and Arrow IPC writers that run in a worker thread with bounded memory
+"""
+import importlib.util
+import logging
+import re
+import tempfile
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, BinaryIO
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Rows converted per chunk (one CSV block, Parquet row group or Arrow record batch)
+EXPORT_CHUNK_ROWS = 5000
+
+# Exports larger than this spill from memory to a temporary file
+EXPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
+# Concurrent exports across all sessions
+EXPORT_WORKERS = 2
+
+# Low-cardinality columns stored dictionary-encoded in Parquet and Arrow exports
+DICTIONARY_COLUMNS = ['status', 'assignee', 'issue_type', 'priority', 'reporter', 'sprint']
+
+EXPORT_FORMATS = {
+    'csv': {'label': 'CSV', 'extension': 'csv', 'mime': 'text/csv', 'module': None},
+    'parquet': {'label': 'Parquet', 'extension': 'parquet', 'mime': 'application/vnd.apache.parquet', 'module': 'pyarrow'},
+    'xlsx': {'label': 'Excel', 'extension': 'xlsx', 'mime': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'module': 'xlsxwriter'},
+    'arrow': {'label': 'Arrow IPC', 'extension': 'arrow', 'mime': 'application/vnd.apache.arrow.file', 'module': 'pyarrow'}
+}
+
+# Formats that hold one sheet per file; multi-sheet reports are zipped
+SINGLE_SHEET_FORMATS = {'csv', 'parquet', 'arrow'}
+
+_executor = ThreadPoolExecutor(max_workers=EXPORT_WORKERS, thread_name_prefix="export")
+
+
+def available_formats() -> List[str]:
+    """Export formats whose writer dependencies are installed"""
+    return [
+        fmt for fmt, spec in EXPORT_FORMATS.items()
+        if spec['module'] is None or importlib.util.find_spec(spec['module']) is not None
+    ]
+
+
+def iter_frame_chunks(df: pd.DataFrame, chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield consecutive row slices of a dataframe (at least one, even when empty)"""
+    if df.empty:
+        yield df
+        return
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def _safe_sheet_name(name: str) -> str:
+    """Sheet or file stem without characters Excel and file systems reject"""
+    return re.sub(r'[\[\]:*?/\\]', '_', name)[:31] or "Sheet"
+
+
+def _dictionary_encode(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert low-cardinality columns to categoricals so every chunk shares one dictionary"""
+    # All-null columns have no value type to build a dictionary from
+    columns = [col for col in DICTIONARY_COLUMNS if col in df.columns and df[col].notna().any()]
+    if not columns:
+        return df
+    return df.astype({col: 'category' for col in columns})
+
+
+def arrow_schema(df: pd.DataFrame):
+    """Arrow schema inferred over the whole frame so chunk schemas never drift"""
+    import pyarrow as pa
+
+    try:
+        return df, pa.Schema.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        # Mixed-type object columns (e.g. custom fields) are exported as text
+        mixed = {col: 'string' for col in df.columns if df[col].dtype == object}
+        df = df.astype(mixed)
+        return df, pa.Schema.from_pandas(df, preserve_index=False)
+
+
+def write_csv(df: pd.DataFrame, sink: BinaryIO, chunk_rows: int = EXPORT_CHUNK_ROWS) -> None:
+    """Write a dataframe as UTF-8 CSV, one chunk at a time"""
+    for i, chunk in enumerate(iter_frame_chunks(df, chunk_rows)):
+        sink.write(chunk.to_csv(index=False, header=(i == 0)).encode('utf-8'))
+
+
+def write_parquet(df: pd.DataFrame, sink: BinaryIO, chunk_rows: int = EXPORT_CHUNK_ROWS) -> None:
+    """Write a dataframe as Parquet with one row group per chunk"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    df, schema = arrow_schema(_dictionary_encode(df))
+    with pq.ParquetWriter(sink, schema, compression='zstd', use_dictionary=True) as writer:
+        for chunk in iter_frame_chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_arrow(df: pd.DataFrame, sink: BinaryIO, chunk_rows: int = EXPORT_CHUNK_ROWS) -> None:
+    """Write a dataframe as an Arrow IPC file with one record batch per chunk"""
+    import pyarrow as pa
+
+    df, schema = arrow_schema(_dictionary_encode(df))
+    with pa.ipc.new_file(sink, schema) as writer:
+        for chunk in iter_frame_chunks(df, chunk_rows):
+            writer.write_batch(pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_excel(sheets: Dict[str, pd.DataFrame], sink: BinaryIO, chunk_rows: int = EXPORT_CHUNK_ROWS) -> None:
+    """Write one Excel sheet per dataframe, streaming rows in chunks"""
+    import xlsxwriter
+
+    # constant_memory flushes each row once the next one starts, so rows are written strictly in order
+    workbook = xlsxwriter.Workbook(sink, {
+        'constant_memory': True,
+        'remove_timezone': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm'
+    })
+    try:
+        for name, df in sheets.items():
+            worksheet = workbook.add_worksheet(_safe_sheet_name(name))
+            worksheet.write_row(0, 0, [str(col) for col in df.columns])
+            row = 1
+            for chunk in iter_frame_chunks(df, chunk_rows):
+                values = chunk.astype(object).where(chunk.notna(), None)
+                for record in values.itertuples(index=False, name=None):
+                    worksheet.write_row(row, 0, record)
+                    row += 1
+    finally:
+        workbook.close()
+
+
+SINGLE_SHEET_WRITERS = {
+    'csv': write_csv,
+    'parquet': write_parquet,
+    'arrow': write_arrow
+}
+
+
+def write_report(sheets: Dict[str, pd.DataFrame], fmt: str, sink: BinaryIO) -> None:
+    """Write a report of named sheets in the given format (multi-sheet CSV/Parquet/Arrow are zipped)"""
+    if fmt == 'xlsx':
+        write_excel(sheets, sink)
+        return
+
+    writer = SINGLE_SHEET_WRITERS[fmt]
+    if len(sheets) == 1:
+        writer(next(iter(sheets.values())), sink)
+        return
+
+    extension = EXPORT_FORMATS[fmt]['extension']
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, df in sheets.items():
+            with archive.open(f"{_safe_sheet_name(name)}.{extension}", 'w', force_zip64=True) as member:
+                writer(df, member)
+
+
+def report_file_spec(fmt: str, base_name: str, multi_sheet: bool = True) -> Dict[str, str]:
+    """File name and MIME type of an exported report"""
+    spec = EXPORT_FORMATS[fmt]
+    if fmt in SINGLE_SHEET_FORMATS and multi_sheet:
+        return {'file_name': f"{base_name}.zip", 'mime': 'application/zip'}
+    return {'file_name': f"{base_name}.{spec['extension']}", 'mime': spec['mime']}
+
+
+def _run_export(sheets: Dict[str, pd.DataFrame], fmt: str) -> BinaryIO:
+    """Produce an export into a spooled file (in memory up to EXPORT_SPOOL_BYTES, then on disk)"""
+    sink = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+    try:
+        write_report(sheets, fmt, sink)
+    except Exception:
+        sink.close()
+        raise
+    size = sink.tell()
+    sink.seek(0)
+    logger.info(f"Exported {sum(len(df) for df in sheets.values())} rows as {fmt} ({size} bytes)")
+    return sink
+
+
+def submit_export(sheets: Dict[str, pd.DataFrame], fmt: str) -> Future:
+    """Start an export on the worker pool; the future resolves to a readable file object"""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    return _executor.submit(_run_export, sheets, fmt)
+
+
+def export_report(sheets: Dict[str, pd.DataFrame], fmt: str) -> bytes:
+    """Export a report on the worker pool and return its bytes, as st.download_button accepts them"""
+    with submit_export(sheets, fmt).result() as spool:
+        return spool.read()
@@ -0,0 +1,381 @@
+"""
+Issue extraction for JIRA Daily Activity Dashboard
+Turns JIRA search results into issue rows, Arrow tables and DataFrames. Rows are assembled into an
+Arrow table first (timestamps are parsed by Arrow) and the DataFrame's text columns reference its
+buffers. Very large pulls can be extracted in a pool of worker processes: the raw issue JSON is
+shipped to the workers, which return Arrow record batches that are concatenated without copying,
+so the work runs outside the server's GIL.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import perf
+import telemetry
+
+logger = logging.getLogger(__name__)
+
+# Date columns converted to timezone-aware datetimes after extraction
+DATE_COLUMNS = ['created', 'updated', 'due_date', 'resolution_date']
+
+# Worker processes for extracting very large pulls; 0 keeps all extraction in-process
+EXTRACTION_PROCESSES = int(os.getenv("EXTRACTION_PROCESSES", "0"))
+
+# Pulls with fewer issues are extracted in-process (shipping them costs more than it saves)
+EXTRACTION_PROCESS_MIN_ISSUES = int(os.getenv("EXTRACTION_PROCESS_MIN_ISSUES", "10000"))
+
+# Issues per worker task, each returned as one record batch
+EXTRACTION_CHUNK_ISSUES = 2000
+
+# Columns of the rows built by extract_issue_data, in order
+ISSUE_COLUMNS = [
+    'key', 'summary', 'status', 'issue_type', 'reporter', 'created', 'updated', 'description',
+    'assignee', 'priority', 'due_date', 'resolution_date', 'labels', 'components', 'story_points',
+    'sprint', 'epic_link', 'eta_custom', 'impact_custom', 'actual_story_points'
+]
+
+# Custom fields of unknown type travel as text so every batch shares one schema
+TEXT_COLUMNS = ['eta_custom', 'impact_custom']
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def extract_issue_data(issue) -> Dict[str, Any]:
+    """Extract relevant data from JIRA issue"""
+    try:
+        # Basic issue information
+        data = {
+            'key': issue.key,
+            'summary': issue.fields.summary,
+            'status': issue.fields.status.name if issue.fields.status else 'Unknown',
+            'issue_type': issue.fields.issuetype.name if issue.fields.issuetype else 'Unknown',
+            'reporter': issue.fields.reporter.displayName if issue.fields.reporter else 'Unknown',
+            'created': issue.fields.created,
+            'updated': issue.fields.updated,
+            'description': issue.fields.description[:200] + '...' if issue.fields.description and len(issue.fields.description) > 200 else issue.fields.description or '',
+        }
+        
+        # Assignee field - handle different User object formats
+        assignee_value = 'Unassigned'
+        try:
+            if issue.fields.assignee:
+                if hasattr(issue.fields.assignee, 'emailAddress'):
+                    assignee_value = issue.fields.assignee.emailAddress
+                elif hasattr(issue.fields.assignee, 'name'):
+                    assignee_value = issue.fields.assignee.name
+                elif hasattr(issue.fields.assignee, 'displayName'):
+                    assignee_value = issue.fields.assignee.displayName
+                else:
+                    assignee_value = str(issue.fields.assignee)
+        except (AttributeError, TypeError):
+            assignee_value = 'Unassigned'
+        data['assignee'] = assignee_value
+        
+        # Priority field - handle PropertyHolder objects
+        priority_value = 'None'
+        try:
+            if hasattr(issue.fields, 'priority') and issue.fields.priority:
+                if hasattr(issue.fields.priority, 'name'):
+                    priority_value = issue.fields.priority.name
+                elif hasattr(issue.fields.priority, 'value'):
+                    priority_value = issue.fields.priority.value
+                else:
+                    priority_value = str(issue.fields.priority)
+        except (AttributeError, TypeError):
+            priority_value = 'None'
+        data['priority'] = priority_value
+        
+        # Due date
+        data['due_date'] = getattr(issue.fields, 'duedate', None)
+        
+        # Resolution date (if resolved)
+        data['resolution_date'] = getattr(issue.fields, 'resolutiondate', None)
+        
+        # Labels
+        data['labels'] = ', '.join(issue.fields.labels) if issue.fields.labels else ''
+        
+        # Components
+        components = []
+        if hasattr(issue.fields, 'components') and issue.fields.components:
+            components = [comp.name for comp in issue.fields.components]
+        data['components'] = ', '.join(components)
+        
+        # Story points (if available) - handle different custom field formats
+        story_points = 0
+        # Try common story points custom field IDs (added customfield_10015 based on JIRA verification)
+        for field_id in ['customfield_10015', 'customfield_10016', 'customfield_10002', 'customfield_10004']:
+            try:
+                field_value = getattr(issue.fields, field_id, None)
+                if field_value is not None:
+                    # Convert to numeric value
+                    if isinstance(field_value, (int, float)):
+                        story_points = field_value
+                        break
+                    elif hasattr(field_value, 'value'):
+                        # Handle select field objects
+                        story_points = float(field_value.value) if field_value.value else 0
+                        break
+                    elif isinstance(field_value, str) and field_value.replace('.', '').isdigit():
+                        # Handle string numbers
+                        story_points = float(field_value)
+                        break
+            except (AttributeError, ValueError, TypeError):
+                continue
+        data['story_points'] = story_points
+        
+        # Sprint information (if available)
+        sprint_name = 'No Sprint'
+        for field_id in ['customfield_10020', 'customfield_10001', 'customfield_10005']:
+            try:
+                sprint_field = getattr(issue.fields, field_id, None)
+                if sprint_field and len(sprint_field) > 0:
+                    sprint_str = str(sprint_field[0])
+                    if 'name=' in sprint_str:
+                        sprint_name = sprint_str.split('name=')[1].split(',')[0]
+                        break
+            except (AttributeError, TypeError, IndexError):
+                continue
+        data['sprint'] = sprint_name
+        
+        # Epic link (if available)
+        epic_link = ''
+        for field_id in ['customfield_10014', 'customfield_10003', 'customfield_10006']:
+            try:
+                epic_field = getattr(issue.fields, field_id, None)
+                if epic_field:
+                    epic_link = str(epic_field)
+                    break
+            except (AttributeError, TypeError):
+                continue
+        data['epic_link'] = epic_link
+        
+        # Try to extract ETA field (common custom field names)
+        eta_value = None
+        for field_id in ['customfield_10030', 'customfield_10031', 'customfield_10032', 'customfield_10033']:
+            try:
+                eta_field = getattr(issue.fields, field_id, None)
+                if eta_field:
+                    eta_value = str(eta_field)
+                    break
+            except (AttributeError, TypeError):
+                continue
+        data['eta_custom'] = eta_value
+        
+        # Try to extract Impact field (common custom field names)
+        impact_value = None
+        for field_id in ['customfield_10040', 'customfield_10041', 'customfield_10042', 'customfield_10043']:
+            try:
+                impact_field = getattr(issue.fields, field_id, None)
+                if impact_field:
+                    if hasattr(impact_field, 'value'):
+                        impact_value = impact_field.value
+                    elif hasattr(impact_field, 'name'):
+                        impact_value = impact_field.name
+                    else:
+                        impact_value = str(impact_field)
+                    break
+            except (AttributeError, TypeError):
+                continue
+        data['impact_custom'] = impact_value
+        
+        # Extract actual story points from JIRA custom fields (not time tracking)
+        actual_story_points = None
+        try:
+            # Extract actual story points from JIRA custom fields directly
+            # RPA project (ID 11232) uses customfield_11580 for "Story Points actual"
+            # Other projects (ID 11236) use customfield_11642 for "Story point actual"
+            for field_id in ['customfield_11580', 'customfield_11642']:
+                try:
+                    field_value = getattr(issue.fields, field_id, None)
+                    if field_value is not None:
+                        # Convert to numeric value
+                        if isinstance(field_value, (int, float)):
+                            actual_story_points = field_value
+                            break
+                        elif hasattr(field_value, 'value'):
+                            # Handle select field objects
+                            actual_story_points = float(field_value.value) if field_value.value else None
+                            break
+                        elif isinstance(field_value, str) and field_value.replace('.', '').isdigit():
+                            # Handle string numbers
+                            actual_story_points = float(field_value)
+                            break
+                except (AttributeError, ValueError, TypeError):
+                    continue
+                    
+        except (AttributeError, TypeError) as e:
+            # Log the error for debugging
+            logger.debug(f"Error extracting actual story points for {issue.key}: {str(e)}")
+            pass
+        
+        data['actual_story_points'] = actual_story_points
+        
+        return data
+        
+    except Exception as e:
+        logger.error(f"Error extracting data from issue {issue.key}: {str(e)}")
+        return {
+            'key': getattr(issue, 'key', 'Unknown'),
+            'summary': 'Error loading issue data',
+            'status': 'Unknown',
+            'issue_type': 'Unknown',
+            'priority': 'None',
+            'assignee': 'Unknown',
+            'reporter': 'Unknown',
+            'created': None,
+            'updated': None,
+            'description': '',
+            'due_date': None,
+            'resolution_date': None,
+            'labels': '',
+            'components': '',
+            'story_points': 0,
+            'sprint': 'Unknown',
+            'epic_link': '',
+            'eta_custom': None,
+            'impact_custom': None,
+            'actual_story_points': None
+        }
+
+
+def extract_issues(issues) -> List[Dict[str, Any]]:
+    """Extract row dictionaries for a list of JIRA issues"""
+    with perf.span("extract issue data", "data"), telemetry.EXTRACTION_DURATION.time():
+        return [extract_issue_data(issue) for issue in issues]
+
+
+def parse_timestamps(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    """UTC timestamps of JIRA date values; Arrow parses ISO timestamps with fractions and +hhmm offsets"""
+    timestamp = pa.timestamp('us', tz='UTC')
+    try:
+        return pc.cast(values, timestamp)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        pass
+    try:
+        # Dates without an offset (due dates are YYYY-MM-DD) are taken as UTC
+        return pc.assume_timezone(pc.cast(values, pa.timestamp('us')), 'UTC')
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        # Mixed or malformed values; pandas coerces the ones it cannot parse to null
+        return pa.chunked_array([pa.array(pd.to_datetime(values.to_pandas(), errors='coerce', utc=True), type=timestamp)])
+
+
+def _text_array(values: List[Any]) -> pa.Array:
+    return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
+
+def records_to_table(records: List[Dict[str, Any]], schema: Optional[pa.Schema] = None) -> pa.Table:
+    """Arrow table of extracted records with parsed date columns; columns follow the first record.
+
+    Without a schema, column types are inferred. Columns of mixed value types become text.
+    """
+    # Dates arrive as JIRA's ISO strings and are parsed below, once the rows are columns
+    read_schema = schema and pa.schema([
+        (field.name, pa.string() if field.name in DATE_COLUMNS else field.type) for field in schema
+    ])
+    try:
+        table = pa.Table.from_pylist(records, schema=read_schema)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        columns = list(records[0]) if records else []
+        arrays = []
+        for col in columns:
+            values = [record.get(col) for record in records]
+            try:
+                field_type = read_schema.field(col).type if read_schema and col not in TEXT_COLUMNS else None
+                arrays.append(_text_array(values) if col in TEXT_COLUMNS else pa.array(values, type=field_type))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arrays.append(_text_array(values))
+        table = pa.table(dict(zip(columns, arrays)))
+    for index, col in enumerate(table.column_names):
+        if col in DATE_COLUMNS:
+            table = table.set_column(index, col, parse_timestamps(table[col]))
+        elif col in TEXT_COLUMNS and not pa.types.is_string(table[col].type):
+            table = table.set_column(index, col, pc.cast(table[col], pa.string()))
+    return table.select(schema.names).cast(schema) if schema is not None else table
+
+
+def table_to_dataframe(table: pa.Table) -> pd.DataFrame:
+    """Issue DataFrame of an extraction table; text columns keep referencing the table's buffers"""
+    df = table.to_pandas()
+    for col in TEXT_COLUMNS:
+        if col in df.columns:
+            # Custom fields stay object columns with None, as the rows carried them
+            df[col] = df[col].astype(object).where(df[col].notna(), None)
+    return df
+
+
+def records_to_dataframe(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build an issue DataFrame from extracted records and convert date columns"""
+    with perf.span("build arrow table", "data"):
+        table = records_to_table(records)
+    with perf.span("build dataframe", "data"):
+        return table_to_dataframe(table)
+
+
+def issue_schema() -> pa.Schema:
+    """Arrow schema of the issue rows built by extract_issue_data"""
+    types = {col: pa.timestamp('us', tz='UTC') for col in DATE_COLUMNS}
+    types.update({'story_points': pa.float64(), 'actual_story_points': pa.float64()})
+    return pa.schema([(col, types.get(col, pa.string())) for col in ISSUE_COLUMNS])
+
+
+def extract_record_batch(raw_issues: List[Dict[str, Any]]) -> pa.RecordBatch:
+    """Worker task: issue rows of raw search JSON as one Arrow record batch"""
+    from jira.resources import Issue
+
+    records = [extract_issue_data(Issue({}, None, raw=raw)) for raw in raw_issues]
+    return records_to_table(records, issue_schema()).combine_chunks().to_batches()[0]
+
+
+def _extraction_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Workers fork from a server process with this module preloaded: they start fast and,
+            # unlike forks of the threaded app, inherit no locks held by its other threads
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            context = multiprocessing.get_context(method)
+            if method == 'forkserver':
+                context.set_forkserver_preload([__name__])
+            _pool = ProcessPoolExecutor(EXTRACTION_PROCESSES, mp_context=context)
+            logger.info(f"Started {EXTRACTION_PROCESSES} extraction worker processes")
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def extract_dataframe_in_processes(issues: List[Any]) -> pd.DataFrame:
+    """Issue DataFrame built by the worker processes from the issues' raw JSON"""
+    chunks = [
+        [issue.raw for issue in issues[start:start + EXTRACTION_CHUNK_ISSUES]]
+        for start in range(0, len(issues), EXTRACTION_CHUNK_ISSUES)
+    ]
+    with perf.span(f"extract issues in {EXTRACTION_PROCESSES} processes", "data"), telemetry.EXTRACTION_DURATION.time():
+        batches = list(_extraction_pool().map(extract_record_batch, chunks))
+    with perf.span("build dataframe", "data"):
+        # Batches share one schema, so the table references their buffers without copying
+        return table_to_dataframe(pa.Table.from_batches(batches, schema=issue_schema()))
+
+
+def issues_to_dataframe(issues) -> pd.DataFrame:
+    """Issue DataFrame of search results; very large pulls are extracted in worker processes when enabled"""
+    if EXTRACTION_PROCESSES > 0 and len(issues) >= EXTRACTION_PROCESS_MIN_ISSUES:
+        try:
+            return extract_dataframe_in_processes(issues)
+        except Exception as e:
+            logger.error(f"Process extraction failed, extracting in-process: {str(e)}")
+            _reset_pool()
+    return records_to_dataframe(extract_issues(issues))
@@ -2,30 +2,77 @@
 JIRA Client for Daily Activity Dashboard
 Handles all JIRA API interactions and data processing
 """
-import streamlit as st
-from jira import JIRA
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 import logging
+import os
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from config import get_config
+from jql import team_searches, merge_results
+from sharding import SHARD_MIN_WINDOW_DAYS, sharded_search
+import perf
+import telemetry
+from rollup import RollupCube, build_rollup
+from data_store import QueryError, shared_query
+from cycle_time import CYCLE_TIMES
+from extraction import extract_issue_data, extract_issues, issues_to_dataframe, records_to_dataframe
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Search calls running at the same time (team batches, sharded window slices)
+SEARCH_WORKERS = int(os.getenv("JIRA_SEARCH_WORKERS", "8"))
+
+# Issues returned by the team activity search of windows too short to be sharded
+ACTIVITY_MAX_RESULTS = 1000
+
+_search_executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="jira-search")
+
+# Sessions connecting at the same time; the app renders while its connection opens
+_connect_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jira-connect")
+
+def connect_in_background(connect: Callable[[], Any]) -> Future:
+    """Run a client constructor on a background thread; the future resolves to the client"""
+    return _connect_executor.submit(perf.in_current_rerun(connect))
+
+def _show_error(message: str) -> None:
+    """Show an error on the running Streamlit page; headless runs (CLI, data service) only log it"""
+    st = sys.modules.get('streamlit')
+    if st is None:
+        return
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    if get_script_run_ctx(suppress_warning=True) is not None:
+        st.error(message)
+
 class JIRAClient:
     """JIRA API client with caching and error handling"""
     
     def __init__(self):
-        self.config = get_config()
         self.jira = None
+        self.deployment_type = None
+        self._credentials = None
         self._connect()
     
+    @property
+    def config(self):
+        """Current configuration snapshot; follows reloads without reconnecting"""
+        return get_config()
+    
+    def credentials_changed(self) -> bool:
+        """Whether the JIRA credentials were reloaded with new values since this client connected"""
+        return self._credentials is not None and self._credentials != self.config['jira']
+    
     def _connect(self) -> None:
         """Establish connection to JIRA"""
         try:
+            # Imported on first connection, which runs on a background thread while the app renders
+            from jira import JIRA
+            
             jira_config = self.config['jira']
+            self._credentials = jira_config
             self.jira = JIRA(
                 server=jira_config['JIRA_URL'],
                 basic_auth=(
@@ -33,98 +80,113 @@ class JIRAClient:
                     jira_config['JIRA_API_TOKEN']
                 )
             )
+            # Attribute response payload sizes to the running query for the Performance panel
+            self.jira._session.hooks['response'].append(perf.record_response)
+            # 'Cloud' or 'Server'; Cloud search pages by token and reports no totals
+            self.deployment_type = self.jira.server_info().get('deploymentType', 'Server')
             logger.info("Successfully connected to JIRA")
+            # Teams configured by JIRA group get their members on the first connection
+            if self.config['teams'].unresolved_groups():
+                self.config['teams'].resolve_groups(self.get_group_members)
         except Exception as e:
             logger.error(f"Failed to connect to JIRA: {str(e)}")
-            st.error(f"Failed to connect to JIRA: {str(e)}")
+            _show_error(f"Failed to connect to JIRA: {str(e)}")
             raise
     
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    def _member_emails(self, selected_members: Optional[List[str]]) -> List[str]:
+        """Email addresses of the selected team members that are in the roster"""
+        team_config = self.config['team_members']
+        return [team_config[member] for member in (selected_members or []) if member in team_config]
+    
+    def _search_team(self, base_jql: str, member_emails: List[str], order_by: str, max_results: Optional[int],
+                     label: str, window_days: Optional[int] = None, **search_options) -> list:
+        """Search base_jql restricted to the members' issues; large selections run as concurrent batches.
+        
+        max_results None fetches every page of each search. With window_days, every issue updated in
+        that window is returned (max_results does not apply), fetched as concurrent updated-time slices.
+        """
+        searches = team_searches(base_jql, member_emails, order_by, self.config['teams'].groups())
+        if window_days:
+            logger.info(f"{label} JQL: {searches[0]} ({len(searches)} searches, sharded over {window_days} days)")
+            search = perf.in_current_rerun(
+                lambda query, start_at, page_size: self.jira.search_issues(
+                    query, startAt=start_at, maxResults=page_size, **search_options
+                )
+            )
+            count = None
+            if self.deployment_type == 'Cloud':
+                # Cloud search pages by token without totals; slices are sized by approximate counts
+                count = perf.in_current_rerun(self.jira.approximate_issue_count)
+            with perf.span("jira.search_issues sharded", "jira"):
+                return sharded_search(search, searches, window_days, _search_executor, count=count)
+        
+        if len(searches) == 1:
+            logger.info(f"{label} JQL: {searches[0]}")
+            with perf.span("jira.search_issues", "jira"):
+                return self.jira.search_issues(searches[0], maxResults=max_results, **search_options)
+        
+        logger.info(f"{label} JQL split into {len(searches)} searches for {len(member_emails)} assignees")
+        search = perf.in_current_rerun(
+            lambda query: self.jira.search_issues(query, maxResults=max_results, **search_options)
+        )
+        with perf.span(f"jira.search_issues x{len(searches)}", "jira"):
+            results = list(_search_executor.map(search, searches))
+        return merge_results(results, order_by, max_results)
+    
+    @perf.timed_query
+    @shared_query(ttl=300)  # Cache for 5 minutes
+    @perf.cache_miss
     def get_weekly_activity(_self, days_back: int = 7) -> pd.DataFrame:
         """Get JIRA issues updated in the last N days"""
         try:
             jql = _self.config['jql']['WEEKLY_ACTIVITY'].format(days=days_back)
-            issues = _self.jira.search_issues(
-                jql,
-                maxResults=1000,
-                expand='changelog'
-            )
-            
-            data = []
-            for issue in issues:
-                issue_data = _self._extract_issue_data(issue)
-                data.append(issue_data)
+            with perf.span("jira.search_issues", "jira"):
+                issues = _self.jira.search_issues(
+                    jql,
+                    maxResults=1000
+                )
             
-            df = pd.DataFrame(data)
-            if not df.empty:
-                # Convert date columns
-                date_columns = ['created', 'updated', 'due_date', 'resolution_date']
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
+            df = issues_to_dataframe(issues)
             
-            logger.info(f"Retrieved {len(data)} issues for weekly activity")
+            logger.info(f"Retrieved {len(df)} issues for weekly activity")
             return df
             
         except Exception as e:
             logger.error(f"Error fetching weekly activity: {str(e)}")
-            st.error(f"Error fetching weekly activity: {str(e)}")
-            return pd.DataFrame()
+            _show_error(f"Error fetching weekly activity: {str(e)}")
+            raise QueryError(f"Error fetching weekly activity: {e}") from e
     
-    @st.cache_data(ttl=300, hash_funcs={"builtins.list": lambda x: str(sorted(x)) if x else "all"})  # Cache for 5 minutes with proper team member hashing
+    @perf.timed_query
+    @shared_query(ttl=300)  # Cache for 5 minutes
+    @perf.cache_miss
     def get_team_weekly_activity(_self, days_back: int = 7, selected_members: List[str] = None) -> pd.DataFrame:
         """Get JIRA issues updated in the last N days filtered by team members"""
         try:
-            # Build JQL with team member filter
             base_jql = f"updated >= -{days_back}d OR created >= -{days_back}d"
-            
-            if selected_members:
-                # Get email addresses for selected members
-                team_config = _self.config['team_members']
-                member_emails = []
-                for member in selected_members:
-                    if member in team_config:
-                        member_emails.append(team_config[member])
-                
-                if member_emails:
-                    # Create assignee filter
-                    assignee_filter = " OR ".join([f'assignee = "{email}"' for email in member_emails])
-                    jql = f"({base_jql}) AND ({assignee_filter}) ORDER BY updated DESC"
-                else:
-                    jql = f"{base_jql} ORDER BY updated DESC"
-            else:
-                jql = f"{base_jql} ORDER BY updated DESC"
-            
-            logger.info(f"Team activity JQL: {jql}")
-            
-            issues = _self.jira.search_issues(
-                jql,
-                maxResults=1000,
-                expand='changelog'
+            # Long windows are fetched whole as updated-time slices; shorter ones keep the result cap
+            sharded = 0 < SHARD_MIN_WINDOW_DAYS <= days_back
+            issues = _self._search_team(
+                base_jql,
+                _self._member_emails(selected_members),
+                "ORDER BY updated DESC",
+                max_results=ACTIVITY_MAX_RESULTS,
+                label="Team activity",
+                window_days=days_back if sharded else None
             )
             
-            data = []
-            for issue in issues:
-                issue_data = _self._extract_issue_data(issue)
-                data.append(issue_data)
-            
-            df = pd.DataFrame(data)
-            if not df.empty:
-                # Convert date columns
-                date_columns = ['created', 'updated', 'due_date', 'resolution_date']
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
+            df = issues_to_dataframe(issues)
             
-            logger.info(f"Retrieved {len(data)} team issues for weekly activity")
+            logger.info(f"Retrieved {len(df)} team issues for weekly activity")
             return df
             
         except Exception as e:
             logger.error(f"Error fetching team weekly activity: {str(e)}")
-            st.error(f"Error fetching team weekly activity: {str(e)}")
-            return pd.DataFrame()
+            _show_error(f"Error fetching team weekly activity: {str(e)}")
+            raise QueryError(f"Error fetching team weekly activity: {e}") from e
     
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    @perf.timed_query
+    @shared_query(ttl=300)  # Cache for 5 minutes
+    @perf.cache_miss
     def get_priority_issues(_self, priority_type: str = "current") -> pd.DataFrame:
         """Get priority issues based on priority field"""
         try:
@@ -135,256 +197,55 @@ class JIRAClient:
             
             logger.info(f"Priority {priority_type} JQL: {jql}")
             
-            issues = _self.jira.search_issues(
-                jql,
-                maxResults=50,  # Limit to top 50 priority issues
-                expand='changelog'
-            )
-            
-            data = []
-            for issue in issues:
-                issue_data = _self._extract_issue_data(issue)
-                data.append(issue_data)
+            with perf.span("jira.search_issues", "jira"):
+                issues = _self.jira.search_issues(
+                    jql,
+                    maxResults=50  # Limit to top 50 priority issues
+                )
             
-            df = pd.DataFrame(data)
-            if not df.empty:
-                # Convert date columns
-                date_columns = ['created', 'updated', 'due_date', 'resolution_date']
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
+            df = issues_to_dataframe(issues)
             
             logger.info(f"Retrieved {len(df)} {priority_type} priority issues")
             return df
             
         except Exception as e:
             logger.error(f"Error fetching {priority_type} priority issues: {str(e)}")
-            return pd.DataFrame()
+            raise QueryError(f"Error fetching {priority_type} priority issues: {e}") from e
     
-    @st.cache_data(ttl=300)
+    @perf.timed_query
+    @shared_query(ttl=300)
+    @perf.cache_miss
     def get_my_issues(_self) -> pd.DataFrame:
         """Get issues assigned to current user"""
         try:
             jql = _self.config['jql']['MY_ISSUES']
-            issues = _self.jira.search_issues(jql, maxResults=100)
-            
-            data = []
-            for issue in issues:
-                issue_data = _self._extract_issue_data(issue)
-                data.append(issue_data)
+            with perf.span("jira.search_issues", "jira"):
+                issues = _self.jira.search_issues(jql, maxResults=100)
             
-            df = pd.DataFrame(data)
-            if not df.empty:
-                # Convert date columns
-                date_columns = ['created', 'updated', 'due_date', 'resolution_date']
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
+            df = issues_to_dataframe(issues)
             
-            logger.info(f"Retrieved {len(data)} issues assigned to current user")
+            logger.info(f"Retrieved {len(df)} issues assigned to current user")
             return df
             
         except Exception as e:
             logger.error(f"Error fetching my issues: {str(e)}")
-            st.error(f"Error fetching my issues: {str(e)}")
-            return pd.DataFrame()
+            _show_error(f"Error fetching my issues: {str(e)}")
+            raise QueryError(f"Error fetching my issues: {e}") from e
+    
+    @staticmethod
+    def _extract_issues(issues) -> List[Dict[str, Any]]:
+        """Extract row dictionaries for a list of JIRA issues"""
+        return extract_issues(issues)
     
-    def _extract_issue_data(self, issue) -> Dict[str, Any]:
+    @staticmethod
+    def _records_to_dataframe(records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Build an issue DataFrame from extracted records and convert date columns"""
+        return records_to_dataframe(records)
+    
+    @staticmethod
+    def _extract_issue_data(issue) -> Dict[str, Any]:
         """Extract relevant data from JIRA issue"""
-        try:
-            # Basic issue information
-            data = {
-                'key': issue.key,
-                'summary': issue.fields.summary,
-                'status': issue.fields.status.name if issue.fields.status else 'Unknown',
-                'issue_type': issue.fields.issuetype.name if issue.fields.issuetype else 'Unknown',
-                'reporter': issue.fields.reporter.displayName if issue.fields.reporter else 'Unknown',
-                'created': issue.fields.created,
-                'updated': issue.fields.updated,
-                'description': issue.fields.description[:200] + '...' if issue.fields.description and len(issue.fields.description) > 200 else issue.fields.description or '',
-            }
-            
-            # Assignee field - handle different User object formats
-            assignee_value = 'Unassigned'
-            try:
-                if issue.fields.assignee:
-                    if hasattr(issue.fields.assignee, 'emailAddress'):
-                        assignee_value = issue.fields.assignee.emailAddress
-                    elif hasattr(issue.fields.assignee, 'name'):
-                        assignee_value = issue.fields.assignee.name
-                    elif hasattr(issue.fields.assignee, 'displayName'):
-                        assignee_value = issue.fields.assignee.displayName
-                    else:
-                        assignee_value = str(issue.fields.assignee)
-            except (AttributeError, TypeError):
-                assignee_value = 'Unassigned'
-            data['assignee'] = assignee_value
-            
-            # Priority field - handle PropertyHolder objects
-            priority_value = 'None'
-            try:
-                if hasattr(issue.fields, 'priority') and issue.fields.priority:
-                    if hasattr(issue.fields.priority, 'name'):
-                        priority_value = issue.fields.priority.name
-                    elif hasattr(issue.fields.priority, 'value'):
-                        priority_value = issue.fields.priority.value
-                    else:
-                        priority_value = str(issue.fields.priority)
-            except (AttributeError, TypeError):
-                priority_value = 'None'
-            data['priority'] = priority_value
-            
-            # Due date
-            data['due_date'] = getattr(issue.fields, 'duedate', None)
-            
-            # Resolution date (if resolved)
-            data['resolution_date'] = getattr(issue.fields, 'resolutiondate', None)
-            
-            # Labels
-            data['labels'] = ', '.join(issue.fields.labels) if issue.fields.labels else ''
-            
-            # Components
-            components = []
-            if hasattr(issue.fields, 'components') and issue.fields.components:
-                components = [comp.name for comp in issue.fields.components]
-            data['components'] = ', '.join(components)
-            
-            # Story points (if available) - handle different custom field formats
-            story_points = 0
-            # Try common story points custom field IDs (added customfield_10015 based on JIRA verification)
-            for field_id in ['customfield_10015', 'customfield_10016', 'customfield_10002', 'customfield_10004']:
-                try:
-                    field_value = getattr(issue.fields, field_id, None)
-                    if field_value is not None:
-                        # Convert to numeric value
-                        if isinstance(field_value, (int, float)):
-                            story_points = field_value
-                            break
-                        elif hasattr(field_value, 'value'):
-                            # Handle select field objects
-                            story_points = float(field_value.value) if field_value.value else 0
-                            break
-                        elif isinstance(field_value, str) and field_value.replace('.', '').isdigit():
-                            # Handle string numbers
-                            story_points = float(field_value)
-                            break
-                except (AttributeError, ValueError, TypeError):
-                    continue
-            data['story_points'] = story_points
-            
-            # Sprint information (if available)
-            sprint_name = 'No Sprint'
-            for field_id in ['customfield_10020', 'customfield_10001', 'customfield_10005']:
-                try:
-                    sprint_field = getattr(issue.fields, field_id, None)
-                    if sprint_field and len(sprint_field) > 0:
-                        sprint_str = str(sprint_field[0])
-                        if 'name=' in sprint_str:
-                            sprint_name = sprint_str.split('name=')[1].split(',')[0]
-                            break
-                except (AttributeError, TypeError, IndexError):
-                    continue
-            data['sprint'] = sprint_name
-            
-            # Epic link (if available)
-            epic_link = ''
-            for field_id in ['customfield_10014', 'customfield_10003', 'customfield_10006']:
-                try:
-                    epic_field = getattr(issue.fields, field_id, None)
-                    if epic_field:
-                        epic_link = str(epic_field)
-                        break
-                except (AttributeError, TypeError):
-                    continue
-            data['epic_link'] = epic_link
-            
-            # Try to extract ETA field (common custom field names)
-            eta_value = None
-            for field_id in ['customfield_10030', 'customfield_10031', 'customfield_10032', 'customfield_10033']:
-                try:
-                    eta_field = getattr(issue.fields, field_id, None)
-                    if eta_field:
-                        eta_value = str(eta_field)
-                        break
-                except (AttributeError, TypeError):
-                    continue
-            data['eta_custom'] = eta_value
-            
-            # Try to extract Impact field (common custom field names)
-            impact_value = None
-            for field_id in ['customfield_10040', 'customfield_10041', 'customfield_10042', 'customfield_10043']:
-                try:
-                    impact_field = getattr(issue.fields, field_id, None)
-                    if impact_field:
-                        if hasattr(impact_field, 'value'):
-                            impact_value = impact_field.value
-                        elif hasattr(impact_field, 'name'):
-                            impact_value = impact_field.name
-                        else:
-                            impact_value = str(impact_field)
-                        break
-                except (AttributeError, TypeError):
-                    continue
-            data['impact_custom'] = impact_value
-            
-            # Extract actual story points from JIRA custom fields (not time tracking)
-            actual_story_points = None
-            try:
-                # Extract actual story points from JIRA custom fields directly
-                # RPA project (ID 11232) uses customfield_11580 for "Story Points actual"
-                # Other projects (ID 11236) use customfield_11642 for "Story point actual"
-                for field_id in ['customfield_11580', 'customfield_11642']:
-                    try:
-                        field_value = getattr(issue.fields, field_id, None)
-                        if field_value is not None:
-                            # Convert to numeric value
-                            if isinstance(field_value, (int, float)):
-                                actual_story_points = field_value
-                                break
-                            elif hasattr(field_value, 'value'):
-                                # Handle select field objects
-                                actual_story_points = float(field_value.value) if field_value.value else None
-                                break
-                            elif isinstance(field_value, str) and field_value.replace('.', '').isdigit():
-                                # Handle string numbers
-                                actual_story_points = float(field_value)
-                                break
-                    except (AttributeError, ValueError, TypeError):
-                        continue
-                        
-            except (AttributeError, TypeError) as e:
-                # Log the error for debugging
-                logger.debug(f"Error extracting actual story points for {issue.key}: {str(e)}")
-                pass
-            
-            data['actual_story_points'] = actual_story_points
-            
-            return data
-            
-        except Exception as e:
-            logger.error(f"Error extracting data from issue {issue.key}: {str(e)}")
-            return {
-                'key': getattr(issue, 'key', 'Unknown'),
-                'summary': 'Error loading issue data',
-                'status': 'Unknown',
-                'issue_type': 'Unknown',
-                'priority': 'None',
-                'assignee': 'Unknown',
-                'reporter': 'Unknown',
-                'created': None,
-                'updated': None,
-                'description': '',
-                'due_date': None,
-                'resolution_date': None,
-                'labels': '',
-                'components': '',
-                'story_points': 0,
-                'sprint': 'Unknown',
-                'epic_link': '',
-                'eta_custom': None,
-                'impact_custom': None,
-                'actual_story_points': None
-            }
+        return extract_issue_data(issue)
     
     def get_user_info(self) -> Dict[str, str]:
         """Get current user information"""
@@ -403,7 +264,9 @@ class JIRAClient:
                 'email': self.config['jira']['JIRA_USERNAME']
             }
     
-    @st.cache_data(ttl=3600)  # Cache for 1 hour
+    @perf.timed_query
+    @shared_query(ttl=3600, fallback=list)  # Cache for 1 hour
+    @perf.cache_miss
     def get_projects(_self) -> List[Dict[str, str]]:
         """Get list of projects"""
         try:
@@ -411,34 +274,28 @@ class JIRAClient:
             return [{'key': p.key, 'name': p.name} for p in projects]
         except Exception as e:
             logger.error(f"Error fetching projects: {str(e)}")
-            return []
+            raise QueryError(f"Error fetching projects: {e}") from e
     
+    @perf.timed_query
+    @perf.cache_miss
     def search_issues_custom(self, jql: str, max_results: int = 100) -> pd.DataFrame:
         """Search issues with custom JQL"""
         try:
-            issues = self.jira.search_issues(jql, maxResults=max_results)
-            
-            data = []
-            for issue in issues:
-                issue_data = self._extract_issue_data(issue)
-                data.append(issue_data)
+            with perf.span("jira.search_issues", "jira"):
+                issues = self.jira.search_issues(jql, maxResults=max_results)
             
-            df = pd.DataFrame(data)
-            if not df.empty:
-                # Convert date columns
-                date_columns = ['created', 'updated', 'due_date', 'resolution_date']
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
+            df = issues_to_dataframe(issues)
             
             return df
             
         except Exception as e:
             logger.error(f"Error with custom JQL search: {str(e)}")
-            st.error(f"Error with custom JQL search: {str(e)}")
+            _show_error(f"Error with custom JQL search: {str(e)}")
             return pd.DataFrame()
     
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    @perf.timed_query
+    @shared_query(ttl=300)  # Cache for 5 minutes
+    @perf.cache_miss
     def get_team_priority_issues(_self, priority_type: str = "current", selected_members: List[str] = None) -> pd.DataFrame:
         """Get priority issues filtered by team members"""
         try:
@@ -450,53 +307,26 @@ class JIRAClient:
                 base_jql = "status in ('To Do', 'Open', 'Backlog', 'Selected for Development')"
                 order_by = "ORDER BY created ASC"
             
-            # Build JQL with team member filter
-            if selected_members:
-                # Get email addresses for selected members
-                team_config = _self.config['team_members']
-                member_emails = []
-                for member in selected_members:
-                    if member in team_config:
-                        member_emails.append(team_config[member])
-                
-                if member_emails:
-                    # Create assignee filter
-                    assignee_filter = " OR ".join([f'assignee = "{email}"' for email in member_emails])
-                    jql = f"({base_jql}) AND ({assignee_filter}) {order_by}"
-                else:
-                    jql = f"{base_jql} {order_by}"
-            else:
-                jql = f"{base_jql} {order_by}"
-            
-            logger.info(f"Team priority {priority_type} JQL: {jql}")
-            
-            issues = _self.jira.search_issues(
-                jql,
-                maxResults=50,  # Limit to top 50 priority issues
-                expand='changelog'
+            issues = _self._search_team(
+                base_jql,
+                _self._member_emails(selected_members),
+                order_by,
+                max_results=50,  # Limit to top 50 priority issues
+                label=f"Team priority {priority_type}"
             )
             
-            data = []
-            for issue in issues:
-                issue_data = _self._extract_issue_data(issue)
-                data.append(issue_data)
-            
-            df = pd.DataFrame(data)
-            if not df.empty:
-                # Convert date columns
-                date_columns = ['created', 'updated', 'due_date', 'resolution_date']
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
+            df = issues_to_dataframe(issues)
             
             logger.info(f"Retrieved {len(df)} team {priority_type} priority issues")
             return df
             
         except Exception as e:
             logger.error(f"Error fetching team {priority_type} priority issues: {str(e)}")
-            return pd.DataFrame()
+            raise QueryError(f"Error fetching team {priority_type} priority issues: {e}") from e
     
-    @st.cache_data(ttl=60, hash_funcs={"builtins.list": lambda x: str(sorted(x)) if x else "all"})  # Cache for 1 minute with proper team member hashing
+    @perf.timed_query
+    @shared_query(ttl=60)  # Cache for 1 minute
+    @perf.cache_miss
     def get_enhanced_priority_issues(_self, priority_type: str = "current", selected_members: List[str] = None) -> pd.DataFrame:
         """Get priority issues with enhanced criteria for Development status and To Do items"""
         try:
@@ -510,47 +340,22 @@ class JIRAClient:
                 base_jql = 'status in ("To Do", "Open", "Backlog", "Selected for Development")'
                 order_by = "ORDER BY priority DESC, created ASC"
             
-            # Build JQL with team member filter
-            if selected_members:
-                # Get email addresses for selected members
-                team_config = _self.config['team_members']
-                member_emails = []
-                for member in selected_members:
-                    if member in team_config:
-                        member_emails.append(team_config[member])
-                
-                if member_emails:
-                    # Create assignee filter
-                    assignee_filter = " OR ".join([f'assignee = "{email}"' for email in member_emails])
-                    jql = f"({base_jql}) AND ({assignee_filter}) {order_by}"
-                else:
-                    jql = f"{base_jql} {order_by}"
-            else:
-                jql = f"{base_jql} {order_by}"
-            
-            logger.info(f"Enhanced priority {priority_type} JQL: {jql}")
-            
-            issues = _self.jira.search_issues(
-                jql,
-                maxResults=50,  # Limit to top 50 priority issues
-                expand='changelog,worklog'  # Also expand worklog to get time tracking data
+            issues = _self._search_team(
+                base_jql,
+                _self._member_emails(selected_members),
+                order_by,
+                max_results=50,  # Limit to top 50 priority issues
+                label=f"Enhanced priority {priority_type}",
+                expand='worklog'  # Also expand worklog to get time tracking data
             )
             
-            data = []
-            for issue in issues:
-                issue_data = _self._extract_issue_data(issue)
+            data = _self._extract_issues(issues)
+            for rank, issue_data in enumerate(data, start=1):
                 # Add rank number based on priority and due date
-                issue_data['rank'] = len(data) + 1
-                data.append(issue_data)
+                issue_data['rank'] = rank
             
-            df = pd.DataFrame(data)
+            df = _self._records_to_dataframe(data)
             if not df.empty:
-                # Convert date columns
-                date_columns = ['created', 'updated', 'due_date', 'resolution_date']
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
-                
                 # Ensure all required columns exist with proper names
                 df = df.rename(columns={
                     'rank': 'Priority',
@@ -585,58 +390,116 @@ class JIRAClient:
             
         except Exception as e:
             logger.error(f"Error fetching enhanced {priority_type} priority issues: {str(e)}")
-            return pd.DataFrame()
+            raise QueryError(f"Error fetching enhanced {priority_type} priority issues: {e}") from e
     
-    @st.cache_data(ttl=300, hash_funcs={"builtins.list": lambda x: str(sorted(x)) if x else "all"})  # Cache for 5 minutes with proper team member hashing
+    @perf.timed_query
+    @shared_query(ttl=300)  # Cache for 5 minutes
+    @perf.cache_miss
     def get_last_week_completed(_self, selected_members: List[str] = None) -> pd.DataFrame:
         """Get issues completed last week for all relevant issue types"""
         try:
             # Build JQL for last week completed issues - expanded to include all work item types
-            base_jql = "assignee = currentUser() AND status = Done AND updated >= startOfWeek(-1w) AND updated < startOfWeek() AND issueType in (Task, Bug, Enhancement, Support, Epic, Story)"
-            
-            if selected_members:
-                # Get email addresses for selected members
-                team_config = _self.config['team_members']
-                member_emails = []
-                for member in selected_members:
-                    if member in team_config:
-                        member_emails.append(team_config[member])
-                
-                if member_emails:
-                    # Replace currentUser() with actual team member emails
-                    assignee_filter = " OR ".join([f'assignee = "{email}"' for email in member_emails])
-                    base_jql = f"({assignee_filter}) AND status = Done AND updated >= startOfWeek(-1w) AND updated < startOfWeek() AND issueType in (Task, Bug, Enhancement, Support, Epic, Story)"
-                else:
-                    # No valid team members, return empty
-                    return pd.DataFrame()
-            
-            jql = f"{base_jql} ORDER BY updated DESC"
-            
-            logger.info(f"Last week completed JQL: {jql}")
-            
-            issues = _self.jira.search_issues(
-                jql,
-                maxResults=100,
-                expand='changelog'
+            base_jql = "status = Done AND updated >= startOfWeek(-1w) AND updated < startOfWeek() AND issueType in (Task, Bug, Enhancement, Support, Epic, Story)"
+            
+            member_emails = _self._member_emails(selected_members)
+            if selected_members and not member_emails:
+                # No valid team members, return empty
+                return pd.DataFrame()
+            if not member_emails:
+                base_jql = f"assignee = currentUser() AND {base_jql}"
+            
+            issues = _self._search_team(
+                base_jql,
+                member_emails,
+                "ORDER BY updated DESC",
+                max_results=100,
+                label="Last week completed"
             )
             
-            data = []
-            for issue in issues:
-                issue_data = _self._extract_issue_data(issue)
-                data.append(issue_data)
+            df = issues_to_dataframe(issues)
             
-            df = pd.DataFrame(data)
-            if not df.empty:
-                # Convert date columns
-                date_columns = ['created', 'updated', 'due_date', 'resolution_date']
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
-            
-            logger.info(f"Retrieved {len(data)} completed issues from last week")
+            logger.info(f"Retrieved {len(df)} completed issues from last week")
             return df
             
         except Exception as e:
             logger.error(f"Error fetching last week completed issues: {str(e)}")
-            st.error(f"Error fetching last week completed issues: {str(e)}")
-            return pd.DataFrame() 
\ No newline at end of file
+            _show_error(f"Error fetching last week completed issues: {str(e)}")
+            raise QueryError(f"Error fetching last week completed issues: {e}") from e
+    
+    @perf.timed_query
+    @shared_query(ttl=300, fallback=lambda: build_rollup(pd.DataFrame()))  # Same lifetime as the frame it aggregates
+    @perf.cache_miss
+    def get_team_weekly_rollup(_self, days_back: int = 7, selected_members: List[str] = None) -> RollupCube:
+        """Rollup cube of the team weekly activity, built once per fetch"""
+        return build_rollup(_self.get_team_weekly_activity(days_back, selected_members))
+    
+    @perf.timed_query
+    @shared_query(ttl=300, fallback=lambda: build_rollup(pd.DataFrame()))  # Same lifetime as the frame it aggregates
+    @perf.cache_miss
+    def get_last_week_completed_rollup(_self, selected_members: List[str] = None) -> RollupCube:
+        """Rollup cube of last week's completed issues, built once per fetch"""
+        return build_rollup(_self.get_last_week_completed(selected_members))
+    
+    @perf.timed_query
+    @shared_query(ttl=300)  # Cache for 5 minutes
+    @perf.cache_miss
+    def get_team_snapshot_issues(_self, selected_members: List[str] = None,
+                                 resolved_since: Optional[str] = None) -> pd.DataFrame:
+        """Get the team's open issues plus those resolved since a day (default yesterday), for the daily snapshot.
+        
+        The resolution window starts at a fixed day rather than 24 hours back, so resolutions between
+        two snapshots taken at different times of day, or on days without a snapshot, are not lost.
+        """
+        try:
+            resolved_since = resolved_since or (datetime.now() - timedelta(days=1)).date().isoformat()
+            # Every page is fetched: a truncated snapshot would under-count the WIP trend
+            issues = _self._search_team(
+                f'statusCategory != Done OR resolved >= "{resolved_since}"',
+                _self._member_emails(selected_members),
+                "ORDER BY key",
+                max_results=None,
+                label="Snapshot"
+            )
+            
+            df = issues_to_dataframe(issues)
+            
+            logger.info(f"Retrieved {len(df)} issues for the daily snapshot")
+            return df
+            
+        except Exception as e:
+            logger.error(f"Error fetching snapshot issues: {str(e)}")
+            raise QueryError(f"Error fetching snapshot issues: {e}") from e
+    
+    @perf.timed_query
+    @shared_query(ttl=300)  # Same lifetime as the frame it is computed from
+    @perf.cache_miss
+    def get_cycle_times(_self, days_back: int = 7, selected_members: List[str] = None) -> pd.DataFrame:
+        """Cycle times of the team issues finished in the last N days"""
+        df = _self.get_team_weekly_activity(days_back, selected_members)
+        try:
+            # Changelogs are fetched only for issues that are new or were updated since last parsed
+            CYCLE_TIMES.refresh(_self.jira, df, _search_executor)
+        except Exception as e:
+            logger.error(f"Error fetching changelogs for cycle times: {str(e)}")
+            # Served without being stored, so the missing changelogs are fetched again next time
+            raise QueryError(f"Error fetching changelogs for cycle times: {e}", CYCLE_TIMES.cycle_times(df)) from e
+        return CYCLE_TIMES.cycle_times(df)
+    
+    @perf.timed_query
+    @shared_query(ttl=3600, fallback=dict)  # Group membership changes rarely
+    @perf.cache_miss
+    def get_group_members(_self, group: str) -> Dict[str, str]:
+        """Active members of a JIRA group as display name -> email"""
+        try:
+            with perf.span("jira.group_members", "jira"):
+                users = _self.jira.group_members(group)
+            members = {
+                user['fullname'] or user['name']: user['email']
+                for user in users.values()
+                if user.get('active', True) and user.get('email') and user['email'] != 'hidden'
+            }
+            logger.info(f"Retrieved {len(members)} members of group {group}")
+            return members
+        except Exception as e:
+            logger.error(f"Error fetching members of group {group}: {str(e)}")
+            raise QueryError(f"Error fetching members of group {group}: {e}") from e
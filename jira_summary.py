@@ -0,0 +1,154 @@
+"""
+Headless reports for JIRA Daily Activity Dashboard
+Runs the dashboard's queries without the Streamlit runtime and writes them as report files,
+for cron jobs that pre-generate reports in bulk:
+
+    python -m jira_summary report --view weekly --days 14 --out weekly.parquet
+    python -m jira_summary report --view all --team Data --out reports/data_%Y%m%d.xlsx
+"""
+import argparse
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAYS_BACK = 7
+
+# View name -> (sheet name, query); sheet names may use {days}
+REPORT_VIEWS: Dict[str, tuple] = {
+    'weekly': ("Team Activity ({days}d)", lambda client, days, members: client.get_team_weekly_activity(days, members)),
+    'current': ("Current Priorities", lambda client, days, members: client.get_enhanced_priority_issues("current", members)),
+    'up-next': ("Up Next Priorities", lambda client, days, members: client.get_enhanced_priority_issues("up_next", members)),
+    'completed': ("Last Week Completed", lambda client, days, members: client.get_last_week_completed(members)),
+    'snapshot': ("Open Issues", lambda client, days, members: client.get_team_snapshot_issues(members)),
+    'cycle-times': ("Cycle Times ({days}d)", lambda client, days, members: client.get_cycle_times(days, members))
+}
+
+
+def output_format(path: str, fmt: Optional[str]) -> str:
+    """Export format named on the command line, else the one matching the output file extension"""
+    # Imported here so --help does not pay for pandas
+    from exporters import EXPORT_FORMATS
+
+    if fmt:
+        return fmt
+    extension = os.path.splitext(path)[1].lstrip('.').lower()
+    for name, spec in EXPORT_FORMATS.items():
+        if spec['extension'] == extension:
+            return name
+    raise ValueError(f"Cannot tell the format of {path}; pass --format")
+
+
+def select_members(roster, members: List[str], teams: List[str]) -> List[str]:
+    """Members named on the command line plus those of the named teams; everyone when none are named"""
+    unknown = [team for team in teams if team not in roster.teams]
+    if unknown:
+        raise ValueError(f"Unknown team(s): {', '.join(unknown)}")
+    # Unknown names would silently widen the search to everyone's issues
+    unknown = [member for member in members if member not in roster.members]
+    if unknown:
+        raise ValueError(f"Unknown team member(s): {', '.join(unknown)}")
+    selected = list(dict.fromkeys(members + roster.members_of(teams)))
+    return selected or list(roster.members.keys())
+
+
+def build_sheets(client, views: List[str], days_back: int, members: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+    """Named report sheets of the requested views, and the views whose query failed"""
+    from data_store import QueryError, raise_query_errors
+
+    sheets, failed = {}, []
+    for view in views:
+        sheet_name, query = REPORT_VIEWS[view]
+        start = time.perf_counter()
+        try:
+            # Failed queries raise here rather than returning the empty frame the dashboard shows
+            with raise_query_errors():
+                df = query(client, days_back, members)
+        except QueryError as e:
+            failed.append(view)
+            logger.error(f"View {view} failed: {str(e)}")
+            continue
+        sheets[sheet_name.format(days=days_back)] = df
+        logger.info(f"View {view}: {len(df)} rows in {time.perf_counter() - start:.1f}s")
+        if not len(df):
+            logger.warning(f"View {view} returned no rows")
+    return sheets, failed
+
+
+def write_sheets(sheets: Dict[str, Any], fmt: str, path: str) -> None:
+    """Write a report atomically, so readers of the output never see a partial file"""
+    from exporters import write_report
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    partial = f"{path}.partial"
+    try:
+        with open(partial, 'wb') as sink:
+            write_report(sheets, fmt, sink)
+        os.replace(partial, path)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+
+def run_report(args: argparse.Namespace) -> int:
+    from config import get_config
+    from jira_client import JIRAClient
+
+    views = list(REPORT_VIEWS) if 'all' in args.view else list(dict.fromkeys(args.view))
+    path = datetime.now().strftime(args.out)
+    try:
+        fmt = output_format(path, args.format)
+        client = JIRAClient()
+        members = select_members(get_config()['teams'], args.member, args.team)
+    except Exception as e:
+        logger.error(f"Report not generated: {str(e)}")
+        return 1
+
+    logger.info(f"Building {', '.join(views)} for {len(members)} members over {args.days} days")
+    sheets, failed = build_sheets(client, views, args.days, members)
+    if failed:
+        # Keeping the previous report beats replacing it with empty or partial sheets
+        logger.error(f"Report not written, {len(failed)} view(s) failed: {', '.join(failed)}")
+        return 1
+    try:
+        write_sheets(sheets, fmt, path)
+    except Exception as e:
+        logger.error(f"Failed to write report {path}: {str(e)}")
+        return 1
+    logger.info(f"Wrote {sum(len(df) for df in sheets.values())} rows in {len(sheets)} sheets to {path}")
+    return 0
+
+
+COMMANDS: Dict[str, Callable[[argparse.Namespace], int]] = {
+    'report': run_report
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    parser = argparse.ArgumentParser(prog="jira_summary", description="JIRA dashboard reports without the Streamlit UI")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    report = commands.add_parser('report', help="Run dashboard queries and write them to a report file")
+    report.add_argument('--view', action='append', choices=list(REPORT_VIEWS) + ['all'],
+                        help="View to include; repeat for several sheets (default: weekly)")
+    report.add_argument('--days', type=int, default=DEFAULT_DAYS_BACK, help="Activity window in days")
+    report.add_argument('--member', action='append', default=[], help="Team member name; repeatable")
+    report.add_argument('--team', action='append', default=[], help="Roster team name; repeatable")
+    report.add_argument('--out', required=True,
+                        help="Output file; strftime codes are expanded, e.g. weekly_%%Y%%m%%d.parquet")
+    # exporters.EXPORT_FORMATS, listed here so parsing arguments does not import pandas
+    report.add_argument('--format', choices=['csv', 'parquet', 'xlsx', 'arrow'],
+                        help="Export format (default: from the --out extension); several CSV/Parquet/Arrow sheets are zipped")
+    args = parser.parse_args(argv)
+    args.view = args.view or ['weekly']
+    return COMMANDS[args.command](args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+"""
+JQL building for JIRA Daily Activity Dashboard
+Builds the team-filtered searches of every query in one place. Large assignee sets are split
+into bounded batches, and fully selected teams are matched through their JIRA group.
+"""
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Assignees per search; larger selections are split into several searches run concurrently
+ASSIGNEE_BATCH_SIZE = int(os.getenv("JQL_ASSIGNEE_BATCH_SIZE", "50"))
+
+# Upper bound on the characters of one assignee clause (search JQL travels in the request URL)
+MAX_ASSIGNEE_CLAUSE_CHARS = 2000
+
+_ORDER_TERM_RE = re.compile(r'^\s*(\w+)(?:\s+(ASC|DESC))?\s*$', re.IGNORECASE)
+
+
+def quote(value: str) -> str:
+    """JQL string literal"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def assignee_in(emails: Sequence[str]) -> str:
+    return f"assignee in ({', '.join(quote(email) for email in emails)})"
+
+
+def members_of(group: str) -> str:
+    return f"assignee in membersOf({quote(group)})"
+
+
+def assignee_batches(emails: Sequence[str], batch_size: int = ASSIGNEE_BATCH_SIZE,
+                     max_chars: int = MAX_ASSIGNEE_CLAUSE_CHARS) -> List[List[str]]:
+    """Split emails into batches bounded by count and by clause length"""
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    length = 0
+    for email in emails:
+        item_length = len(quote(email)) + 2
+        if batch and (len(batch) >= batch_size or length + item_length > max_chars):
+            batches.append(batch)
+            batch, length = [], 0
+        batch.append(email)
+        length += item_length
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def team_searches(base_jql: str, emails: Sequence[str], order_by: str = "",
+                  groups: Optional[Dict[str, Iterable[str]]] = None) -> List[str]:
+    """JQL of each search needed to run base_jql restricted to the given assignees.
+
+    Groups whose members are all selected are matched with one membersOf() clause; the
+    remaining assignees are split into batches. Without assignees base_jql is not restricted.
+    """
+    suffix = f" {order_by}" if order_by else ""
+    emails = list(dict.fromkeys(emails))
+    if not emails:
+        return [f"{base_jql}{suffix}"]
+
+    selected = set(emails)
+    group_clauses, covered = [], set()
+    for group, members in (groups or {}).items():
+        members = set(members)
+        if members and members <= selected:
+            group_clauses.append(members_of(group))
+            covered |= members
+
+    batches = assignee_batches([email for email in emails if email not in covered])
+    clauses = [assignee_in(batch) for batch in batches]
+    if group_clauses:
+        # Group clauses are short; they share the first search
+        clauses = [" OR ".join(group_clauses + clauses[:1])] + clauses[1:]
+    return [f"({base_jql}) AND ({clause}){suffix}" for clause in clauses]
+
+
+def _sort_value(issue: Any, field: str) -> Any:
+    if field == 'key':
+        project, _, number = issue.key.partition('-')
+        return project, int(number) if number.isdigit() else 0
+    value = getattr(issue.fields, field, None)
+    if field == 'priority':
+        # Lower priority ids are higher priorities, so DESC lists Highest first
+        priority_id = str(getattr(value, 'id', ''))
+        return -int(priority_id) if priority_id.isdigit() else None
+    return value
+
+
+def order_issues(issues: List[Any], order_by: str) -> List[Any]:
+    """Sort search result issues by a JQL ORDER BY clause (empty values last)"""
+    clause = re.sub(r'^\s*ORDER\s+BY\s+', '', order_by, flags=re.IGNORECASE)
+    terms = [_ORDER_TERM_RE.match(term) for term in clause.split(',') if term.strip()]
+    ordered = list(issues)
+    # Stable sorts from the last term to the first give a multi-key sort
+    for term in reversed([term for term in terms if term]):
+        field, descending = term.group(1).lower(), (term.group(2) or '').upper() == 'DESC'
+        if descending:
+            ordered.sort(key=lambda issue: (_sort_value(issue, field) is not None, _sort_value(issue, field)), reverse=True)
+        else:
+            ordered.sort(key=lambda issue: (_sort_value(issue, field) is None, _sort_value(issue, field)))
+    return ordered
+
+
+def merge_results(results: Iterable[List[Any]], order_by: str, max_results: Optional[int] = None) -> List[Any]:
+    """Issues of several searches as one result: deduplicated (newest version kept), ordered and truncated"""
+    merged = {}
+    for issues in results:
+        for issue in issues:
+            current = merged.get(issue.key)
+            if current is None or (getattr(issue.fields, 'updated', None) or '') > (getattr(current.fields, 'updated', None) or ''):
+                merged[issue.key] = issue
+    # Issue key breaks ties, so the merge is deterministic whatever order the searches finished in
+    ordered = order_issues(sorted(merged.values(), key=lambda issue: _sort_value(issue, 'key')), order_by)
+    return ordered if max_results is None else ordered[:max_results]
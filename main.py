@@ -2,24 +2,43 @@
 JIRA Daily Activity & Priority Dashboard
 Main Streamlit Application
 """
+import functools
+import time
+
+# Script start, for the time to first paint (includes the module imports on a cold start)
+SCRIPT_STARTED = time.perf_counter()
+
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import pandas as pd
 from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
-import time
+from typing import Dict, List
 import logging
+import os
 
 # Import custom modules
 from config import get_config
-from jira_client import JIRAClient
+import perf
+import telemetry
+import exporters
+import data_store
+import snapshots
+from cycle_time import cycle_time_percentiles
+from jira_client import JIRAClient, connect_in_background
+from data_service import DataServiceClient
+from rollup import RollupCube
+from table_views import rows_in, table_view
 from utils import (
     format_date, get_status_color, create_status_badge, create_priority_badge,
     filter_dataframe_by_status, create_status_distribution_chart, 
     create_issue_type_chart, create_activity_timeline_chart, 
     create_assignee_workload_chart, create_team_workload_chart,
+    cached_figure, build_status_distribution_chart, build_issue_type_chart,
+    build_activity_timeline_chart, build_team_workload_chart, team_workload_counts,
+    build_wip_trend_chart, build_throughput_trend_chart,
     format_dataframe_for_display, get_summary_metrics, 
-    create_metrics_cards, export_to_csv, create_jira_issue_link,
+    create_metrics_cards, export_to_csv, render_csv_download_button, render_paged_table, PAGED_TABLE_CONTROLS, supports_deferred_download, create_jira_issue_link,
     filter_dataframe_by_team_members, truncate_text, get_issue_type_icon,
     create_priority_table, create_completed_issues_table
 )
@@ -40,6 +59,29 @@ DEFAULT_ISSUE_TYPES = {
     'last_week_completed': ['Task', 'Bug', 'Enhancement', 'Support', 'Epic', 'Story']
 }
 
+# Session state keys of the paginated issue tables
+PAGED_TABLES = ['weekly_issues_table', 'current_priorities_table', 'up_next_priorities_table', 'completed_issues_table']
+
+# Tab widgets whose values must survive switching views in lazy navigation mode
+PERSISTENT_WIDGET_KEYS = [
+    'weekly_days_back', 'weekly_status_filter', 'weekly_show_description', 'trend_history_days',
+    'weekly_show_cycle_times'
+] + [f"issue_filter_{tab_name}" for tab_name in DEFAULT_ISSUE_TYPES] + [
+    f"{table}_{control}" for table in PAGED_TABLES for control in PAGED_TABLE_CONTROLS
+]
+
+# Team activity window included in the exported report
+REPORT_DAYS_BACK = 30
+
+# Activity windows offered in the weekly view (days)
+ACTIVITY_WINDOW_OPTIONS = [7, 14, 21, 30, 90, 180, 365]
+
+# History windows offered by the trend charts (days of daily snapshots)
+TREND_HISTORY_OPTIONS = [30, 90, 180, 365]
+
+# Larger selections are summarized by count in the sidebar
+MAX_LISTED_MEMBERS = 10
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
@@ -163,25 +205,83 @@ def initialize_session_state():
         st.session_state.jira_client = None
     if 'last_refresh' not in st.session_state:
         st.session_state.last_refresh = None
-    if 'config' not in st.session_state:
-        st.session_state.config = get_config()
+    # The memoized snapshot is cheap to fetch; fetching it each run picks up reloaded config
+    st.session_state.config = get_config()
     
     # Initialize issue type filters for each tab if not exists
     if 'issue_type_filters' not in st.session_state:
         st.session_state.issue_type_filters = DEFAULT_ISSUE_TYPES.copy()
 
+def preserve_view_state():
+    """Keep widget values of views that are not rendered in this run.
+    
+    Streamlit drops the state of widgets that were not rendered in a run; re-assigning
+    the values through the Session State API keeps them until the view is shown again.
+    """
+    for key in PERSISTENT_WIDGET_KEYS:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
+
+def connect_client():
+    """Create this session's client: a data service client when DATA_SERVICE_URL is set, else a JIRA connection"""
+    service_url = os.getenv("DATA_SERVICE_URL", "")
+    if service_url:
+        with perf.span("connect to data service", "jira"):
+            client = DataServiceClient(service_url)
+            # Teams configured by JIRA group get their members through the service
+            if config['teams'].unresolved_groups():
+                config['teams'].resolve_groups(client.get_group_members)
+        return client
+    with perf.span("connect to JIRA", "jira"):
+        return JIRAClient()
+
+def start_jira_connection():
+    """Start connecting on a background thread, so the page renders while the connection opens"""
+    if st.session_state.jira_client is None and st.session_state.get('jira_connection') is None:
+        st.session_state.jira_connection = connect_in_background(connect_client)
+
 def get_jira_client():
-    """Get or create JIRA client instance"""
+    """Get or create JIRA client instance (a data service client when DATA_SERVICE_URL is set)"""
+    client = st.session_state.jira_client
+    if isinstance(client, JIRAClient) and client.credentials_changed():
+        # Reconnect with the reloaded credentials
+        st.session_state.jira_client = None
     if st.session_state.jira_client is None:
+        start_jira_connection()
+        connection = st.session_state.jira_connection
         try:
-            with st.spinner("Connecting to JIRA..."):
-                st.session_state.jira_client = JIRAClient()
-                st.session_state.last_refresh = datetime.now()
+            if not connection.done():
+                target = "data service" if os.getenv("DATA_SERVICE_URL", "") else "JIRA"
+                with st.spinner(f"Connecting to {target}..."):
+                    connection.result()
+            st.session_state.jira_client = connection.result()
+            st.session_state.last_refresh = datetime.now()
         except Exception as e:
             st.error(f"Failed to connect to JIRA: {str(e)}")
             return None
+        finally:
+            # A failed connection is retried on the next rerun
+            st.session_state.jira_connection = None
+    # Group teams of a reloaded roster get their members through the open connection
+    roster = get_config()['teams']
+    if roster.unresolved_groups():
+        roster.resolve_groups(st.session_state.jira_client.get_group_members)
     return st.session_state.jira_client
 
+def clear_cached_data():
+    """Drop cached JIRA query results shared by all sessions, plus Streamlit's data cache"""
+    data_store.STORE.clear()
+    if isinstance(st.session_state.get('jira_client'), DataServiceClient):
+        st.session_state.jira_client.refresh()
+    st.cache_data.clear()
+
+def rerun_view():
+    """Rerun only the current view's fragment, or the whole app outside a fragment rerun"""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
 def render_issue_type_filter(tab_name: str, description: str = ""):
     """Render issue type filter display and controls for a specific tab"""
     with st.expander(f"🏷️ Issue Type Filter - {tab_name.replace('_', ' ').title()}", expanded=False):
@@ -212,71 +312,100 @@ def render_issue_type_filter(tab_name: str, description: str = ""):
         # Available issue types (comprehensive list)
         all_issue_types = ['Bug', 'Task', 'Story', 'Epic', 'Enhancement', 'Support', 'Sub-task', 'Improvement', 'New Feature']
         
+        widget_key = f"issue_filter_{tab_name}"
+        # Once the key is in session state (kept across views by preserve_view_state), it alone sets the value;
+        # passing a default as well makes Streamlit warn on every rerun
         new_filters = st.multiselect(
             "Select issue types to include:",
             options=all_issue_types,
-            default=current_filters,
+            default=None if widget_key in st.session_state else current_filters,
             help=f"Choose which issue types to display in the {tab_name.replace('_', ' ').title()} tab",
-            key=f"issue_filter_{tab_name}"
+            key=widget_key
         )
         
         col1, col2, col3 = st.columns([1, 1, 2])
         
         with col1:
             if st.button(f"Update Filter", key=f"update_filter_{tab_name}"):
+                # Issue types are filtered locally, so the shared query results stay valid
                 st.session_state.issue_type_filters[tab_name] = new_filters
-                st.cache_data.clear()  # Clear cache to force refresh
                 st.success("✅ Filter updated! Data will refresh automatically.")
-                st.rerun()
+                rerun_view()
         
         with col2:
-            if st.button(f"Reset to Default", key=f"reset_filter_{tab_name}"):
-                st.session_state.issue_type_filters[tab_name] = DEFAULT_ISSUE_TYPES[tab_name].copy()
-                st.cache_data.clear()  # Clear cache to force refresh
+            if st.button(f"Reset to Default", key=f"reset_filter_{tab_name}",
+                         on_click=reset_issue_type_filter, args=(tab_name,)):
                 st.success("✅ Filter reset to default!")
-                st.rerun()
+                rerun_view()
         
         with col3:
             if not new_filters:
                 st.warning("⚠️ Select at least one issue type")
 
+def reset_issue_type_filter(tab_name: str):
+    """Restore a tab's default issue types; runs as a button callback, before the multiselect is created"""
+    st.session_state.issue_type_filters[tab_name] = DEFAULT_ISSUE_TYPES[tab_name].copy()
+    st.session_state[f"issue_filter_{tab_name}"] = DEFAULT_ISSUE_TYPES[tab_name].copy()
+
+def get_issue_type_filter(tab_name: str) -> List[str]:
+    """Issue types currently selected for the specified tab"""
+    return st.session_state.issue_type_filters.get(tab_name, DEFAULT_ISSUE_TYPES[tab_name])
+
 def filter_dataframe_by_issue_types(df: pd.DataFrame, tab_name: str) -> pd.DataFrame:
     """Filter dataframe by the current issue type filter for the specified tab"""
     if df.empty:
         return df
     
     # Get current filters for this tab
-    current_filters = st.session_state.issue_type_filters.get(tab_name, DEFAULT_ISSUE_TYPES[tab_name])
+    current_filters = get_issue_type_filter(tab_name)
     
     # Check if the dataframe has an issue_type column
     if 'issue_type' in df.columns:
         # Filter by issue types
-        filtered_df = df[df['issue_type'].isin(current_filters)]
+        filtered_df = rows_in(df, 'issue_type', current_filters)
         return filtered_df
     elif 'Issue Type' in df.columns:
         # Handle renamed column case
-        filtered_df = df[df['Issue Type'].isin(current_filters)]
+        filtered_df = rows_in(df, 'Issue Type', current_filters)
         return filtered_df
     else:
         # If no issue type column, return original dataframe
         return df
 
 def render_header():
-    """Render application header"""
+    """Render application header; returns the slot of the refresh info, filled once connected"""
     st.markdown('<div class="main-header">📊 JIRA Daily Activity & Priority Dashboard</div>', unsafe_allow_html=True)
-    
-    # Show last refresh info without the refresh button
+    return st.empty()
+
+def render_refresh_info(slot):
+    """Show last refresh info without the refresh button"""
     if st.session_state.last_refresh:
-        st.markdown(f'<div class="refresh-info">Last refreshed: {st.session_state.last_refresh.strftime("%Y-%m-%d %H:%M:%S")}</div>', unsafe_allow_html=True)
+        slot.markdown(f'<div class="refresh-info">Last refreshed: {st.session_state.last_refresh.strftime("%Y-%m-%d %H:%M:%S")}</div>', unsafe_allow_html=True)
 
 def render_global_sidebar():
-    """Render global sidebar with unified team member filter"""
+    """Render global sidebar with unified team member filter.
+    
+    Returns the selected members and the sidebar slot of the report export, which needs the
+    JIRA connection and is filled by main() once it is open.
+    """
     with st.sidebar:
         st.header("🌐 Global Filters")
         
         # Get team members from config
+        roster = st.session_state.config['teams']
         team_members = list(st.session_state.config['team_members'].keys())
         
+        if len(roster.team_names()) > 1:
+            # Teams narrow the member list; picking a whole team lets queries match it by JIRA group
+            st.subheader("🏢 Filter by Team(s)")
+            selected_teams = st.multiselect(
+                "Select teams:",
+                options=roster.team_names(),
+                default=roster.team_names(),
+                key="global_team_group_filter"
+            )
+            team_members = roster.members_of(selected_teams)
+        
         # Global team member filter
         st.subheader("👥 Filter by Team Member(s)")
         selected_members = st.multiselect(
@@ -291,6 +420,8 @@ def render_global_sidebar():
         if selected_members:
             if len(selected_members) == len(team_members):
                 st.info("📊 **Showing data for:** All Team Members")
+            elif len(selected_members) > MAX_LISTED_MEMBERS:
+                st.info(f"📊 **Showing data for:** {len(selected_members)} team members")
             else:
                 st.info(f"📊 **Showing data for:** {', '.join(selected_members)}")
         else:
@@ -302,7 +433,7 @@ def render_global_sidebar():
         st.subheader("🔄 Data Management")
         if st.button("🔄 Refresh All Data (Including Priority)", type="primary", key="global_refresh"):
             # Clear all cached data including priority data
-            st.cache_data.clear()
+            clear_cached_data()
             # Reset JIRA client to force reconnection
             st.session_state.jira_client = None
             st.success("✅ All data refreshed! Changes from JIRA should now be visible.")
@@ -314,6 +445,10 @@ def render_global_sidebar():
         
         st.markdown("---")
         
+        report_export_slot = st.container()
+        
+        st.markdown("---")
+        
         # Help section
         st.subheader("ℹ️ How It Works")
         st.markdown("""
@@ -328,21 +463,154 @@ def render_global_sidebar():
         """)
         
         if st.button("🔄 Force Refresh", help="Clear cache and fetch fresh data from JIRA"):
-            # Clear all Streamlit cache
-            st.cache_data.clear()
+            # Clear all cached query results
+            clear_cached_data()
             st.rerun()
         
         # Debug info for selected team members
-        if st.checkbox("🔍 Debug Info", help="Show selected team members for troubleshooting"):
+        if st.checkbox("🔍 Debug Info", help="Show selected team members and the Performance panel for troubleshooting", key="debug_info"):
             st.write("**Selected Members:**", selected_members)
             st.write("**Total Selected:**", len(selected_members))
         
-        return selected_members
+        return selected_members, report_export_slot
+
+def load_report_sheets(jira_client, selected_members) -> Dict[str, pd.DataFrame]:
+    """Fetch the data of every dashboard tab as named report sheets"""
+    return {
+        f"Team Activity ({REPORT_DAYS_BACK}d)": jira_client.get_team_weekly_activity(REPORT_DAYS_BACK, selected_members),
+        "Current Priorities": jira_client.get_enhanced_priority_issues("current", selected_members),
+        "Up Next Priorities": jira_client.get_enhanced_priority_issues("up_next", selected_members),
+        "Last Week Completed": jira_client.get_last_week_completed(selected_members)
+    }
+
+def render_report_export(selected_members):
+    """Render the multi-format report export; data is only fetched and written when downloading"""
+    st.subheader("📦 Export Report")
+    formats = exporters.available_formats()
+    fmt = st.selectbox(
+        "Format",
+        options=formats,
+        format_func=lambda f: exporters.EXPORT_FORMATS[f]['label'],
+        help=f"One sheet per tab with {REPORT_DAYS_BACK}-day team activity. CSV, Parquet and Arrow reports are zipped.",
+        key="report_export_format"
+    )
+    jira_client = get_jira_client()
+    if jira_client is None or not selected_members:
+        return
+    
+    spec = exporters.report_file_spec(fmt, f"jira_team_report_{datetime.now().strftime('%Y%m%d')}")
+    build_report = lambda: exporters.export_report(load_report_sheets(jira_client, selected_members), fmt)
+    
+    if supports_deferred_download():
+        st.download_button(
+            label=f"📥 Download {exporters.EXPORT_FORMATS[fmt]['label']} Report",
+            data=build_report,
+            file_name=spec['file_name'],
+            mime=spec['mime'],
+            key="report_export_download"
+        )
+    elif st.button("📦 Prepare Report", key="report_export_prepare"):
+        with st.spinner("Building report..."):
+            st.download_button(
+                label=f"📥 Download {exporters.EXPORT_FORMATS[fmt]['label']} Report",
+                data=build_report(),
+                file_name=spec['file_name'],
+                mime=spec['mime'],
+                key="report_export_download"
+            )
+
+def render_trends(jira_client, selected_members):
+    """Render WIP and throughput trends from the daily snapshot store"""
+    # The first session of the day stores today's snapshot in the background
+    snapshots.ensure_daily_snapshot(jira_client)
+    
+    with st.expander("📆 Trends", expanded=False):
+        history_days = st.selectbox(
+            "History",
+            options=TREND_HISTORY_OPTIONS,
+            # The preserved session state value applies once set; a non-default index as well would warn
+            index=None if "trend_history_days" in st.session_state else 1,
+            format_func=lambda days: f"Last {days} days",
+            key="trend_history_days"
+        )
+        team_config = st.session_state.config['team_members']
+        assignees = [team_config[member] for member in selected_members if member in team_config]
+        with perf.span("load snapshot trends", "data"):
+            wip, throughput = snapshots.load_trends(history_days, assignees)
+        
+        if wip.empty and throughput.empty:
+            st.info("📭 No snapshot history yet. A snapshot of the team's issues is stored once per day.")
+            return
+        
+        trend_col1, trend_col2 = st.columns(2)
+        with trend_col1, perf.span("wip trend chart", "chart"):
+            wip_fig = cached_figure("wip_trend", wip, build_wip_trend_chart)
+            st.plotly_chart(wip_fig, use_container_width=True)
+        with trend_col2, perf.span("throughput trend chart", "chart"):
+            throughput_fig = cached_figure("throughput_trend", throughput, build_throughput_trend_chart)
+            st.plotly_chart(throughput_fig, use_container_width=True)
+
+def render_cycle_times(jira_client, days_back, selected_members):
+    """Render cycle-time percentiles of the finished issues by team member and issue type"""
+    with st.expander("⏱️ Cycle Time", expanded=False):
+        # The expander body runs on every rerun even when collapsed; changelogs are read only on request
+        if not st.toggle("Compute cycle times", key="weekly_show_cycle_times",
+                         help="Reads the changelogs of the finished issues from JIRA"):
+            st.caption("Turn on to read the changelogs of the finished issues in this window.")
+            return
+        with st.spinner("Reading issue changelogs..."):
+            cycles = jira_client.get_cycle_times(days_back, selected_members)
+        
+        if cycles.empty:
+            st.info("📭 No issues went from In Progress to Done in the selected period.")
+            return
+        
+        st.caption(f"Days from first In Progress to Done for {len(cycles)} finished issues")
+        names = {email: name for name, email in st.session_state.config['team_members'].items()}
+        by_member = cycle_time_percentiles(cycles.assign(assignee=cycles['assignee'].map(names).fillna(cycles['assignee'])), 'assignee')
+        by_type = cycle_time_percentiles(cycles, 'issue_type')
+        
+        cycle_col1, cycle_col2 = st.columns(2)
+        with cycle_col1:
+            st.markdown("**👥 By Team Member**")
+            st.dataframe(by_member.rename(columns={'assignee': 'Team Member', 'issues': 'Issues'}).round(1), hide_index=True, use_container_width=True)
+        with cycle_col2:
+            st.markdown("**🏷️ By Issue Type**")
+            st.dataframe(by_type.rename(columns={'issue_type': 'Issue Type', 'issues': 'Issues'}).round(1), hide_index=True, use_container_width=True)
+
+def profiled_fragment(func):
+    """Profile a fragment body: a span of the full rerun, or a profile of its own when only the fragment reruns"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        name = f"fragment: {func.__name__}"
+        if perf.current_profile() is not None:
+            # Running as part of main(), whose profile covers it
+            with perf.span(name, "app"):
+                return func(*args, **kwargs)
+
+        # Fragment reruns skip main(), so they are profiled here
+        perf.start_rerun()
+        try:
+            with perf.span(name, "app"):
+                result = func(*args, **kwargs)
+        finally:
+            profile = perf.finish_rerun()
+            telemetry.FRAGMENT_RERUN_DURATION.observe(profile.total_seconds)
+        if st.session_state.get("debug_info"):
+            perf.render_performance_panel(profile, "this fragment rerun")
+        return result
+
+    return wrapper
 
 def show_weekly_activity(selected_members):
     """Display weekly activity tab with global team filtering"""
     st.header("📈 Weekly JIRA Issue Activity")
-    
+    render_weekly_activity_content(selected_members)
+
+@st.fragment
+@profiled_fragment
+def render_weekly_activity_content(selected_members):
+    """Interactive part of the weekly activity tab; its widgets rerun only this fragment"""
     # Add issue type filter display
     render_issue_type_filter(
         "weekly_activity", 
@@ -367,9 +635,10 @@ def show_weekly_activity(selected_members):
         # Date range
         days_back = st.selectbox(
             "📅 Time Period",
-            options=[7, 14, 21, 30],
+            options=ACTIVITY_WINDOW_OPTIONS,
             index=0,
-            help="Number of days to look back for activity"
+            help="Number of days to look back for activity; long windows are fetched in concurrent slices",
+            key="weekly_days_back"
         )
     
     with col2:
@@ -377,7 +646,8 @@ def show_weekly_activity(selected_members):
         status_filter = st.selectbox(
             "📊 Status Filter",
             options=["All", "In Progress", "Completed", "Blocked"],
-            index=0
+            index=0,
+            key="weekly_status_filter"
         )
     
     # Fetch data using global team filter
@@ -392,22 +662,32 @@ def show_weekly_activity(selected_members):
         return
     
     # Apply issue type filter first
-    df = filter_dataframe_by_issue_types(df, "weekly_activity")
+    with perf.span("filter by issue type", "data"):
+        df = filter_dataframe_by_issue_types(df, "weekly_activity")
     
     if df.empty:
         st.warning(f"📭 No issues found matching the selected issue types.")
         return
     
     # Apply status filter
-    filtered_df = filter_dataframe_by_status(df, status_filter)
+    with perf.span("filter by status", "data"):
+        filtered_df = filter_dataframe_by_status(df, status_filter)
     
     if filtered_df.empty:
         st.warning(f"📭 No issues found with status: {status_filter}")
         return
     
+    # Metrics and charts are answered from the rollup cube built once per fetch
+    with perf.span("slice rollup", "data"):
+        cube = jira_client.get_team_weekly_rollup(
+            days_back=days_back,
+            selected_members=selected_members
+        ).slice(issue_types=get_issue_type_filter("weekly_activity")).slice_status_filter(status_filter)
+    
     # Display metrics
     st.subheader("📊 Summary Metrics")
-    metrics = get_summary_metrics(filtered_df)
+    with perf.span("summary metrics", "data"):
+        metrics = cube.summary_metrics()
     create_metrics_cards(metrics)
     
     # Additional team metrics
@@ -418,7 +698,7 @@ def show_weekly_activity(selected_members):
         avg_issues_per_member = metrics['total_issues'] / len(selected_members) if selected_members else 0
         st.metric("📋 Avg Issues/Member", f"{avg_issues_per_member:.1f}")
     with col3:
-            total_story_points = filtered_df['story_points'].sum()
+            total_story_points = cube.total('story_points')
             st.metric("⭐ Total Story Points", f"{total_story_points:.0f}")
     
     # Charts
@@ -428,22 +708,30 @@ def show_weekly_activity(selected_members):
     
     with chart_col1:
         # Status distribution
-        status_fig = create_status_distribution_chart(filtered_df)
-        st.plotly_chart(status_fig, use_container_width=True)
+        with perf.span("status distribution chart", "chart"):
+            status_fig = cached_figure("status_distribution", cube.counts_by('status'), build_status_distribution_chart)
+            st.plotly_chart(status_fig, use_container_width=True)
         
         # Activity timeline
-        timeline_fig = create_activity_timeline_chart(filtered_df)
-        st.plotly_chart(timeline_fig, use_container_width=True)
+        with perf.span("activity timeline chart", "chart"):
+            timeline_fig = cached_figure("activity_timeline", cube.daily_counts(), build_activity_timeline_chart)
+            st.plotly_chart(timeline_fig, use_container_width=True)
     
     with chart_col2:
         # Issue type distribution
-        type_fig = create_issue_type_chart(filtered_df)
-        st.plotly_chart(type_fig, use_container_width=True)
+        with perf.span("issue type chart", "chart"):
+            type_fig = cached_figure("issue_type", cube.counts_by('issue_type'), build_issue_type_chart)
+            st.plotly_chart(type_fig, use_container_width=True)
         
         # Team member workload (only for selected members)
         if len(selected_members) > 1:
-            workload_fig = create_team_workload_chart(filtered_df, st.session_state.config['team_members'])
-            st.plotly_chart(workload_fig, use_container_width=True)
+            with perf.span("team workload chart", "chart"):
+                workload = team_workload_counts(cube.counts_by('assignee'), st.session_state.config['team_members'])
+                workload_fig = cached_figure("team_workload", workload, build_team_workload_chart)
+                st.plotly_chart(workload_fig, use_container_width=True)
+    
+    render_cycle_times(jira_client, days_back, selected_members)
+    render_trends(jira_client, selected_members)
     
     # Issues Details section - properly organized under Weekly JIRA Issue Activity
     st.subheader("📋 Issues Details")
@@ -453,65 +741,56 @@ def show_weekly_activity(selected_members):
     with col1:
         st.write(f"**{len(filtered_df)} issues found**")
     with col2:
-        show_description = st.checkbox("Show Description", value=False)
+        show_description = st.checkbox("Show Description", value=False, key="weekly_show_description")
     with col3:
         # Export button
-        csv_data = export_to_csv(filtered_df, f"team_activity_{days_back}d.csv")
-        st.download_button(
+        render_csv_download_button(
+            filtered_df,
             label="📥 Export CSV",
-            data=csv_data,
             file_name=f"team_activity_{days_back}d_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv"
+            key="weekly_export_csv"
         )
     
-    # Prepare display columns - ensure jira_link is available in the dataframe
-    display_columns = [
-        'key', 'summary', 'status', 'issue_type', 'assignee', 'priority', 'updated', 'due_date',
-        'story_points', 'actual_story_points', 'assigned_to'
-    ]
-    if show_description:
-        display_columns.insert(2, 'description')
-    
-    # Format and display table
-    display_df = format_dataframe_for_display(filtered_df, display_columns)
-    
-    # Add JIRA Link column
-    if not display_df.empty and 'Issue Key' in display_df.columns:
-        jira_base_url = st.session_state.config['jira']['JIRA_URL']
-        display_df['JIRA Link'] = display_df['Issue Key'].apply(
-            lambda x: f"{jira_base_url}/browse/{x}" if pd.notna(x) else ""
+    # Format table (memoized per data version)
+    with perf.span("format weekly table", "data"):
+        display_df = table_view(
+            filtered_df,
+            "weekly_activity",
+            jira_url=st.session_state.config['jira']['JIRA_URL'],
+            hidden=[] if show_description else ["Description"]
         )
     
     # Make the table interactive
-    st.dataframe(
-        display_df,
-        use_container_width=True,
-        height=400,
-        column_config={
-            "Issue Key": st.column_config.TextColumn(
-                "Issue Key",
-                help="JIRA issue identifier",
-                width="medium"
-            ),
-            "JIRA Link": st.column_config.LinkColumn(
-                "JIRA Link",
-                help="Click to open in JIRA",
-                width="small"
-            ),
-            "Est. Story Points": st.column_config.NumberColumn(
-                "Est. Story Points",
-                help="Estimated effort in story points",
-                format="%.1f",
-                width="small"
-            ),
-            "Act. Story Points": st.column_config.NumberColumn(
-                "Act. Story Points", 
-                help="Actual effort logged from JIRA",
-                format="%.1f",
-                width="small"
-            )
-        }
-    )
+    with perf.span("render weekly table", "render"):
+        render_paged_table(
+            display_df,
+            key="weekly_issues_table",
+            height=400,
+            column_config={
+                "Issue Key": st.column_config.TextColumn(
+                    "Issue Key",
+                    help="JIRA issue identifier",
+                    width="medium"
+                ),
+                "JIRA Link": st.column_config.LinkColumn(
+                    "JIRA Link",
+                    help="Click to open in JIRA",
+                    width="small"
+                ),
+                "Est. Story Points": st.column_config.NumberColumn(
+                    "Est. Story Points",
+                    help="Estimated effort in story points",
+                    format="%.1f",
+                    width="small"
+                ),
+                "Act. Story Points": st.column_config.NumberColumn(
+                    "Act. Story Points", 
+                    help="Actual effort logged from JIRA",
+                    format="%.1f",
+                    width="small"
+                )
+            }
+        )
     
     # Add totals for story points with improved UI - positioned at the end of Issues Details
     st.markdown("### 📊 Story Points Summary")
@@ -537,12 +816,6 @@ def render_priority_dashboard_tab(selected_members):
     """Render the Priority Dashboard tab with enhanced criteria and global team filtering"""
     st.header("🎯 Priority Dashboard")
     
-    # Add issue type filter display
-    render_issue_type_filter(
-        "priority_dashboard", 
-        "Displays issues in Development status (Current) and To Do/Backlog status (Up Next). Supports all issue types including Epics, Stories, Tasks, and Bugs."
-    )
-    
     jira_client = get_jira_client()
     if jira_client is None:
         return
@@ -552,6 +825,23 @@ def render_priority_dashboard_tab(selected_members):
         st.warning("⚠️ Please select at least one team member in the sidebar to view priorities.")
         return
     
+    # Fetch priority data with enhanced criteria and global team filtering
+    with st.spinner("🔄 Fetching priority issues with enhanced criteria..."):
+        current_priorities_df = jira_client.get_enhanced_priority_issues("current", selected_members)
+        up_next_priorities_df = jira_client.get_enhanced_priority_issues("up_next", selected_members)
+    
+    render_priority_dashboard_content(current_priorities_df, up_next_priorities_df)
+
+@st.fragment
+@profiled_fragment
+def render_priority_dashboard_content(current_priorities_df: pd.DataFrame, up_next_priorities_df: pd.DataFrame):
+    """Interactive part of the Priority Dashboard; fragment reruns reuse the fetched frames by reference"""
+    # Add issue type filter display
+    render_issue_type_filter(
+        "priority_dashboard", 
+        "Displays issues in Development status (Current) and To Do/Backlog status (Up Next). Supports all issue types including Epics, Stories, Tasks, and Bugs."
+    )
+    
     # Information about the Priority Dashboard structure
     with st.expander("ℹ️ About Priority Dashboard Structure", expanded=False):
         st.markdown("""
@@ -600,14 +890,10 @@ def render_priority_dashboard_tab(selected_members):
     - Use the "**Refresh All Data**" button in the sidebar for immediate updates
     """)
     
-    # Fetch priority data with enhanced criteria and global team filtering
-    with st.spinner("🔄 Fetching priority issues with enhanced criteria..."):
-        current_priorities_df = jira_client.get_enhanced_priority_issues("current", selected_members)
-        up_next_priorities_df = jira_client.get_enhanced_priority_issues("up_next", selected_members)
-    
     # Apply issue type filtering to both datasets
-    current_priorities_df = filter_dataframe_by_issue_types(current_priorities_df, "priority_dashboard")
-    up_next_priorities_df = filter_dataframe_by_issue_types(up_next_priorities_df, "priority_dashboard")
+    with perf.span("filter by issue type", "data"):
+        current_priorities_df = filter_dataframe_by_issue_types(current_priorities_df, "priority_dashboard")
+        up_next_priorities_df = filter_dataframe_by_issue_types(up_next_priorities_df, "priority_dashboard")
     
     # Current Priorities Section
     st.subheader("🔥 Current Priorities (Due This Week & In Progress)")
@@ -617,99 +903,87 @@ def render_priority_dashboard_tab(selected_members):
         st.success(f"**{len(current_priorities_df)} critical issues** requiring immediate attention this week")
         
         # Create priority table
-        priority_table_df = create_priority_table(current_priorities_df)
-        
-        # Transform JIRA ID column to contain full URLs for linking
-        if not priority_table_df.empty and 'JIRA ID' in priority_table_df.columns:
-            jira_base_url = st.session_state.config['jira']['JIRA_URL']
-            # Create a new column with just the issue keys for display
-            priority_table_df['Issue Key'] = priority_table_df['JIRA ID'].copy()
-            # Transform JIRA ID column to contain full URLs
-            priority_table_df['JIRA ID'] = priority_table_df['JIRA ID'].apply(
-                lambda x: f"{jira_base_url}/browse/{x}" if pd.notna(x) else ""
+        with perf.span("build current priority table", "data"):
+            priority_table_df = table_view(
+                current_priorities_df,
+                "priority",
+                jira_url=st.session_state.config['jira']['JIRA_URL']
             )
-            # Reorder columns to put Issue Key before JIRA ID
-            columns = priority_table_df.columns.tolist()
-            # Remove Issue Key from its current position and insert it before JIRA ID
-            columns.remove('Issue Key')
-            jira_id_index = columns.index('JIRA ID')
-            columns.insert(jira_id_index, 'Issue Key')
-            priority_table_df = priority_table_df[columns]
         
         # Display as interactive table with enhanced column configuration
-        st.dataframe(
-            priority_table_df,
-            use_container_width=True,
-            height=400,
-            column_config={
-                "Priority": st.column_config.NumberColumn(
-                    "Priority",
-                    help="Priority ranking (1 = highest priority)",
-                    format="%d",
-                    width="small"
-                ),
-                "Issue Key": st.column_config.TextColumn(
-                    "Issue Key",
-                    help="JIRA issue identifier",
-                    width="medium"
-                ),
-                "JIRA ID": st.column_config.LinkColumn(
-                    "JIRA Link",
-                    help="Click to open in JIRA",
-                    width="small"
-                ),
-                "Issue Type": st.column_config.TextColumn(
-                    "Issue Type",
-                    help="JIRA issue type (e.g., Story, Task, Bug)",
-                    width="small"
-                ),
-                "Status": st.column_config.TextColumn(
-                    "Status",
-                    help="Current JIRA status",
-                    width="medium"
-                ),
-                "Start Date": st.column_config.DateColumn(
-                    "Start Date",
-                    help="Issue creation date",
-                    width="small"
-                ),
-                "Due Date": st.column_config.DateColumn(
-                    "Due Date",
-                    help="Scheduled due date (within current week)",
-                    width="small"
-                ),
-                "Est. Story Points": st.column_config.NumberColumn(
-                    "Est. Story Points",
-                    help="Estimated effort in story points",
-                    format="%d",
-                    width="small"
-                ),
-                "Act. Story Points": st.column_config.NumberColumn(
-                    "Act. Story Points",
-                    help="Actual effort logged from time tracking and worklogs (8 hours = 1 story point)",
-                    format="%.1f",
-                    width="small"
-                ),
-                "Assigned To": st.column_config.TextColumn(
-                    "Assigned To",
-                    help="Team member assigned to this issue",
-                    width="medium"
-                ),
-                "Description": st.column_config.TextColumn(
-                    "Description",
-                    help="Issue summary/title",
-                    width="large"
-                )
-            }
-        )
+        with perf.span("render current priority table", "render"):
+            render_paged_table(
+                priority_table_df,
+                key="current_priorities_table",
+                height=400,
+                column_config={
+                    "Priority": st.column_config.NumberColumn(
+                        "Priority",
+                        help="Priority ranking (1 = highest priority)",
+                        format="%d",
+                        width="small"
+                    ),
+                    "Issue Key": st.column_config.TextColumn(
+                        "Issue Key",
+                        help="JIRA issue identifier",
+                        width="medium"
+                    ),
+                    "JIRA ID": st.column_config.LinkColumn(
+                        "JIRA Link",
+                        help="Click to open in JIRA",
+                        width="small"
+                    ),
+                    "Issue Type": st.column_config.TextColumn(
+                        "Issue Type",
+                        help="JIRA issue type (e.g., Story, Task, Bug)",
+                        width="small"
+                    ),
+                    "Status": st.column_config.TextColumn(
+                        "Status",
+                        help="Current JIRA status",
+                        width="medium"
+                    ),
+                    "Start Date": st.column_config.DateColumn(
+                        "Start Date",
+                        help="Issue creation date",
+                        width="small"
+                    ),
+                    "Due Date": st.column_config.DateColumn(
+                        "Due Date",
+                        help="Scheduled due date (within current week)",
+                        width="small"
+                    ),
+                    "Est. Story Points": st.column_config.NumberColumn(
+                        "Est. Story Points",
+                        help="Estimated effort in story points",
+                        format="%d",
+                        width="small"
+                    ),
+                    "Act. Story Points": st.column_config.NumberColumn(
+                        "Act. Story Points",
+                        help="Actual effort logged from time tracking and worklogs (8 hours = 1 story point)",
+                        format="%.1f",
+                        width="small"
+                    ),
+                    "Assigned To": st.column_config.TextColumn(
+                        "Assigned To",
+                        help="Team member assigned to this issue",
+                        width="medium"
+                    ),
+                    "Description": st.column_config.TextColumn(
+                        "Description",
+                        help="Issue summary/title",
+                        width="large"
+                    )
+                }
+            )
         
         # Export button for current priorities
-        csv_data = export_to_csv(current_priorities_df, "current_priorities.csv")
-        st.download_button(
+        render_csv_download_button(
+            current_priorities_df,
             label="📥 Export Current Priorities",
-            data=csv_data,
             file_name=f"current_priorities_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv"
+            key="current_priorities_export_csv"
         )
         
         # Add totals for story points with improved UI
@@ -752,99 +1026,87 @@ def render_priority_dashboard_tab(selected_members):
         st.info(f"**{len(up_next_priorities_df)} issues** ready for future work")
         
         # Create up next table
-        up_next_table_df = create_priority_table(up_next_priorities_df)
-        
-        # Transform JIRA ID column to contain full URLs for linking
-        if not up_next_table_df.empty and 'JIRA ID' in up_next_table_df.columns:
-            jira_base_url = st.session_state.config['jira']['JIRA_URL']
-            # Create a new column with just the issue keys for display
-            up_next_table_df['Issue Key'] = up_next_table_df['JIRA ID'].copy()
-            # Transform JIRA ID column to contain full URLs
-            up_next_table_df['JIRA ID'] = up_next_table_df['JIRA ID'].apply(
-                lambda x: f"{jira_base_url}/browse/{x}" if pd.notna(x) else ""
+        with perf.span("build up_next priority table", "data"):
+            up_next_table_df = table_view(
+                up_next_priorities_df,
+                "priority",
+                jira_url=st.session_state.config['jira']['JIRA_URL']
             )
-            # Reorder columns to put Issue Key before JIRA Link
-            columns = up_next_table_df.columns.tolist()
-            # Remove Issue Key from its current position and insert it before JIRA ID
-            columns.remove('Issue Key')
-            jira_id_index = columns.index('JIRA ID')
-            columns.insert(jira_id_index, 'Issue Key')
-            up_next_table_df = up_next_table_df[columns]
         
         # Display as interactive table with same column configuration
-        st.dataframe(
-            up_next_table_df,
-            use_container_width=True,
-            height=300,
-            column_config={
-                "Priority": st.column_config.NumberColumn(
-                    "Priority",
-                    help="Priority ranking (1 = highest priority)",
-                    format="%d",
-                    width="small"
-                ),
-                "Issue Key": st.column_config.TextColumn(
-                    "Issue Key",
-                    help="JIRA issue identifier",
-                    width="medium"
-                ),
-                "JIRA ID": st.column_config.LinkColumn(
-                    "JIRA Link",
-                    help="Click to open in JIRA",
-                    width="small"
-                ),
-                "Issue Type": st.column_config.TextColumn(
-                    "Issue Type",
-                    help="JIRA issue type (e.g., Story, Task, Bug)",
-                    width="small"
-                ),
-                "Status": st.column_config.TextColumn(
-                    "Status",
-                    help="Current JIRA status (To Do category)",
-                    width="medium"
-                ),
-                "Start Date": st.column_config.DateColumn(
-                    "Start Date",
-                    help="Issue creation date",
-                    width="small"
-                ),
-                "Due Date": st.column_config.DateColumn(
-                    "Due Date",
-                    help="Scheduled due date (future or not set)",
-                    width="small"
-                ),
-                "Est. Story Points": st.column_config.NumberColumn(
-                    "Est. Story Points",
-                    help="Estimated effort in story points",
-                    format="%d",
-                    width="small"
-                ),
-                "Act. Story Points": st.column_config.NumberColumn(
-                    "Act. Story Points",
-                    help="Actual effort logged from time tracking and worklogs (8 hours = 1 story point)",
-                    format="%.1f",
-                    width="small"
-                ),
-                "Assigned To": st.column_config.TextColumn(
-                    "Assigned To",
-                    help="Team member assigned to this issue",
-                    width="medium"
-                ),
-                "Description": st.column_config.TextColumn(
-                    "Description",
-                    help="Issue summary/title",
-                    width="large"
-                )
-            }
-        )
+        with perf.span("render up next priority table", "render"):
+            render_paged_table(
+                up_next_table_df,
+                key="up_next_priorities_table",
+                height=300,
+                column_config={
+                    "Priority": st.column_config.NumberColumn(
+                        "Priority",
+                        help="Priority ranking (1 = highest priority)",
+                        format="%d",
+                        width="small"
+                    ),
+                    "Issue Key": st.column_config.TextColumn(
+                        "Issue Key",
+                        help="JIRA issue identifier",
+                        width="medium"
+                    ),
+                    "JIRA ID": st.column_config.LinkColumn(
+                        "JIRA Link",
+                        help="Click to open in JIRA",
+                        width="small"
+                    ),
+                    "Issue Type": st.column_config.TextColumn(
+                        "Issue Type",
+                        help="JIRA issue type (e.g., Story, Task, Bug)",
+                        width="small"
+                    ),
+                    "Status": st.column_config.TextColumn(
+                        "Status",
+                        help="Current JIRA status (To Do category)",
+                        width="medium"
+                    ),
+                    "Start Date": st.column_config.DateColumn(
+                        "Start Date",
+                        help="Issue creation date",
+                        width="small"
+                    ),
+                    "Due Date": st.column_config.DateColumn(
+                        "Due Date",
+                        help="Scheduled due date (future or not set)",
+                        width="small"
+                    ),
+                    "Est. Story Points": st.column_config.NumberColumn(
+                        "Est. Story Points",
+                        help="Estimated effort in story points",
+                        format="%d",
+                        width="small"
+                    ),
+                    "Act. Story Points": st.column_config.NumberColumn(
+                        "Act. Story Points",
+                        help="Actual effort logged from time tracking and worklogs (8 hours = 1 story point)",
+                        format="%.1f",
+                        width="small"
+                    ),
+                    "Assigned To": st.column_config.TextColumn(
+                        "Assigned To",
+                        help="Team member assigned to this issue",
+                        width="medium"
+                    ),
+                    "Description": st.column_config.TextColumn(
+                        "Description",
+                        help="Issue summary/title",
+                        width="large"
+                    )
+                }
+            )
         
         # Export button for up next priorities
-        csv_data = export_to_csv(up_next_priorities_df, "up_next_priorities.csv")
-        st.download_button(
+        render_csv_download_button(
+            up_next_priorities_df,
             label="📥 Export Up Next Priorities",
-            data=csv_data,
             file_name=f"up_next_priorities_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv"
+            key="up_next_priorities_export_csv"
         )
         
         # Add totals for up next story points
@@ -874,14 +1136,6 @@ def render_last_week_completed_tab(selected_members):
     """Render Last Week Completed tab with filtered issues"""
     st.markdown('<div class="tab-header">📋 Last Week Completed</div>', unsafe_allow_html=True)
     
-    # Add issue type filter display
-    render_issue_type_filter(
-        "last_week_completed", 
-        "Shows issues completed last week. Originally filtered to Task, Bug, Enhancement only, now expanded to include Support, Epic, and Story types for complete visibility."
-    )
-    
-    st.markdown("*Issues that were completed during the previous week (Monday to Sunday)*")
-    
     if not selected_members:
         st.warning("⚠️ Please select at least one team member from the sidebar to view completed issues.")
         return
@@ -894,6 +1148,21 @@ def render_last_week_completed_tab(selected_members):
     # Get last week completed issues
     with st.spinner("Loading last week's completed issues..."):
         completed_df = jira_client.get_last_week_completed(selected_members)
+        completed_rollup = jira_client.get_last_week_completed_rollup(selected_members)
+    
+    render_last_week_completed_content(completed_df, completed_rollup)
+
+@st.fragment
+@profiled_fragment
+def render_last_week_completed_content(completed_df: pd.DataFrame, completed_rollup: RollupCube):
+    """Interactive part of the Last Week Completed tab; fragment reruns reuse the fetched frame by reference"""
+    # Add issue type filter display
+    render_issue_type_filter(
+        "last_week_completed", 
+        "Shows issues completed last week. Originally filtered to Task, Bug, Enhancement only, now expanded to include Support, Epic, and Story types for complete visibility."
+    )
+    
+    st.markdown("*Issues that were completed during the previous week (Monday to Sunday)*")
     
     if completed_df.empty:
         st.info("✅ No completed issues found for the selected team members from last week.")
@@ -906,13 +1175,19 @@ def render_last_week_completed_tab(selected_members):
         return
     
     # Apply issue type filtering
-    completed_df = filter_dataframe_by_issue_types(completed_df, "last_week_completed")
+    with perf.span("filter by issue type", "data"):
+        completed_df = filter_dataframe_by_issue_types(completed_df, "last_week_completed")
     
     if completed_df.empty:
         st.info("✅ No completed issues found matching the selected issue type filters.")
         st.markdown("Try adjusting the issue type filter above to include more issue types.")
         return
     
+    # Counts and story points come from the rollup cube instead of rescanning rows
+    with perf.span("slice rollup", "data"):
+        completed_rollup = completed_rollup.slice(issue_types=get_issue_type_filter("last_week_completed"))
+        issue_type_counts = completed_rollup.counts_by('issue_type')
+    
     # Display summary metrics
     st.subheader("📊 Summary")
     col1, col2, col3, col4 = st.columns(4)
@@ -921,12 +1196,12 @@ def render_last_week_completed_tab(selected_members):
         st.markdown(f"""
         <div class='metric-card'>
             <h4 style='margin: 0; color: #28a745;'>✅ Total Completed</h4>
-            <h2 style='margin: 0; color: #28a745;'>{len(completed_df)}</h2>
+            <h2 style='margin: 0; color: #28a745;'>{completed_rollup.total_issues}</h2>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
-        task_count = len(completed_df[completed_df['issue_type'] == 'Task'])
+        task_count = int(issue_type_counts.get('Task', 0))
         st.markdown(f"""
         <div class='metric-card'>
             <h4 style='margin: 0; color: #007bff;'>📋 Tasks</h4>
@@ -935,7 +1210,7 @@ def render_last_week_completed_tab(selected_members):
         """, unsafe_allow_html=True)
     
     with col3:
-        bug_count = len(completed_df[completed_df['issue_type'] == 'Bug'])
+        bug_count = int(issue_type_counts.get('Bug', 0))
         st.markdown(f"""
         <div class='metric-card'>
             <h4 style='margin: 0; color: #dc3545;'>🐛 Bugs</h4>
@@ -944,7 +1219,7 @@ def render_last_week_completed_tab(selected_members):
         """, unsafe_allow_html=True)
     
     with col4:
-        enhancement_count = len(completed_df[completed_df['issue_type'] == 'Enhancement'])
+        enhancement_count = int(issue_type_counts.get('Enhancement', 0))
         st.markdown(f"""
         <div class='metric-card'>
             <h4 style='margin: 0; color: #ffc107;'>⚡ Enhancements</h4>
@@ -953,7 +1228,6 @@ def render_last_week_completed_tab(selected_members):
         """, unsafe_allow_html=True)
     
     # Add additional metrics for the expanded issue types
-    issue_type_counts = completed_df['issue_type'].value_counts()
     if len(issue_type_counts) > 3:  # If we have more than just Task, Bug, Enhancement
         st.markdown("### 📈 Additional Issue Type Breakdown")
         cols = st.columns(min(len(issue_type_counts), 6))  # Max 6 columns
@@ -973,99 +1247,89 @@ def render_last_week_completed_tab(selected_members):
     
     # Create and display the completed issues table
     st.subheader("📋 Completed Issues Details")
-    completed_table_df = create_completed_issues_table(completed_df)
+    with perf.span("build completed table", "data"):
+        completed_table_df = table_view(
+            completed_df,
+            "last_week_completed",
+            jira_url=st.session_state.config['jira']['JIRA_URL']
+        )
     
     if not completed_table_df.empty:
-        # Transform JIRA ID column to contain full URLs for linking
-        jira_base_url = st.session_state.config['jira']['JIRA_URL']
-        # Create a new column with just the issue keys for display
-        completed_table_df['Issue Key'] = completed_table_df['JIRA ID'].copy()
-        # Transform JIRA ID column to contain full URLs
-        completed_table_df['JIRA ID'] = completed_table_df['JIRA ID'].apply(
-            lambda x: f"{jira_base_url}/browse/{x}" if pd.notna(x) else ""
-        )
-        # Reorder columns to put Issue Key before JIRA Link
-        columns = completed_table_df.columns.tolist()
-        # Remove Issue Key from its current position and insert it at the beginning
-        columns.remove('Issue Key')
-        columns.insert(0, 'Issue Key')
-        completed_table_df = completed_table_df[columns]
-        
         # Display as interactive table
-        st.dataframe(
-            completed_table_df,
-            use_container_width=True,
-            height=400,
-            column_config={
-                "Issue Key": st.column_config.TextColumn(
-                    "Issue Key",
-                    help="JIRA issue identifier",
-                    width="medium"
-                ),
-                "JIRA ID": st.column_config.LinkColumn(
-                    "JIRA Link",
-                    help="Click to open in JIRA",
-                    width="small"
-                ),
-                "Issue Type": st.column_config.TextColumn(
-                    "Issue Type",
-                    help="Type of JIRA issue",
-                    width="small"
-                ),
-                "Summary": st.column_config.TextColumn(
-                    "Summary",
-                    help="Issue description/title",
-                    width="large"
-                ),
-                "Status": st.column_config.TextColumn(
-                    "Status",
-                    help="Current status (should be Done)",
-                    width="small"
-                ),
-                "Assigned To": st.column_config.TextColumn(
-                    "Assigned To",
-                    help="Team member who completed the issue",
-                    width="medium"
-                ),
-                "Completed Date": st.column_config.DateColumn(
-                    "Completed Date",
-                    help="Date when the issue was completed",
-                    width="medium"
-                ),
-                "Created Date": st.column_config.DateColumn(
-                    "Created Date",
-                    help="Date when the issue was created",
-                    width="medium"
-                ),
-                "Est. Story Points": st.column_config.NumberColumn(
-                    "Est. Story Points",
-                    help="Estimated effort in story points",
-                    format="%.1f",
-                    width="small"
-                ),
-                "Act. Story Points": st.column_config.NumberColumn(
-                    "Act. Story Points",
-                    help="Actual effort logged from time tracking and worklogs (8 hours = 1 story point)",
-                    format="%.1f",
-                    width="small"
-                )
-            }
-        )
+        with perf.span("render completed table", "render"):
+            render_paged_table(
+                completed_table_df,
+                key="completed_issues_table",
+                height=400,
+                column_config={
+                    "Issue Key": st.column_config.TextColumn(
+                        "Issue Key",
+                        help="JIRA issue identifier",
+                        width="medium"
+                    ),
+                    "JIRA ID": st.column_config.LinkColumn(
+                        "JIRA Link",
+                        help="Click to open in JIRA",
+                        width="small"
+                    ),
+                    "Issue Type": st.column_config.TextColumn(
+                        "Issue Type",
+                        help="Type of JIRA issue",
+                        width="small"
+                    ),
+                    "Summary": st.column_config.TextColumn(
+                        "Summary",
+                        help="Issue description/title",
+                        width="large"
+                    ),
+                    "Status": st.column_config.TextColumn(
+                        "Status",
+                        help="Current status (should be Done)",
+                        width="small"
+                    ),
+                    "Assigned To": st.column_config.TextColumn(
+                        "Assigned To",
+                        help="Team member who completed the issue",
+                        width="medium"
+                    ),
+                    "Completed Date": st.column_config.DateColumn(
+                        "Completed Date",
+                        help="Date when the issue was completed",
+                        width="medium"
+                    ),
+                    "Created Date": st.column_config.DateColumn(
+                        "Created Date",
+                        help="Date when the issue was created",
+                        width="medium"
+                    ),
+                    "Est. Story Points": st.column_config.NumberColumn(
+                        "Est. Story Points",
+                        help="Estimated effort in story points",
+                        format="%.1f",
+                        width="small"
+                    ),
+                    "Act. Story Points": st.column_config.NumberColumn(
+                        "Act. Story Points",
+                        help="Actual effort logged from time tracking and worklogs (8 hours = 1 story point)",
+                        format="%.1f",
+                        width="small"
+                    )
+                }
+            )
         
         # Export button
-        csv_data = export_to_csv(completed_df, "last_week_completed.csv")
-        st.download_button(
+        render_csv_download_button(
+            completed_df,
             label="📥 Export Completed Issues",
-            data=csv_data,
             file_name=f"last_week_completed_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv"
+            key="completed_export_csv"
         )
         
         # Story points summary - matching Priority Dashboard format
         st.markdown("### 📊 Story Points Summary")
         col1, col2 = st.columns(2)
         with col1:
-            total_estimated = completed_df.get('story_points', pd.Series(dtype='float64')).fillna(0).sum()
+            total_estimated = completed_rollup.total('story_points')
             st.markdown(f"""
             <div class='metric-card'>
                 <h4 style='margin: 0; color: #2E86AB;'>📈 Total Est. Story Points</h4>
@@ -1073,7 +1337,7 @@ def render_last_week_completed_tab(selected_members):
             </div>
             """, unsafe_allow_html=True)
         with col2:
-            total_actual = completed_df.get('actual_story_points', pd.Series(dtype='float64')).fillna(0).sum()
+            total_actual = completed_rollup.total('actual_story_points')
             st.markdown(f"""
             <div class='metric-card'>
                 <h4 style='margin: 0; color: #A23B72;'>✅ Total Act. Story Points</h4>
@@ -1085,12 +1349,28 @@ def render_last_week_completed_tab(selected_members):
 
 def main():
     """Main application function"""
+    perf.start_rerun()
+    telemetry.ensure_exporter()
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        telemetry.touch_session(ctx.session_id)
     initialize_session_state()
     
-    # Initialize JIRA client early to catch connection issues
-    jira_client = get_jira_client()
+    # The connection opens in the background while the header and sidebar render
+    start_jira_connection()
+    refresh_info = render_header()
+    
+    # Teams configured by JIRA group list their members only once connected
+    connect_first = bool(config['teams'].unresolved_groups())
+    jira_client = get_jira_client() if connect_first else None
+    
+    # Render global sidebar once and get selected team members
+    selected_members, report_export_slot = render_global_sidebar()
+    telemetry.FIRST_PAINT_DURATION.observe(time.perf_counter() - SCRIPT_STARTED)
     
-    render_header()
+    if not connect_first:
+        jira_client = get_jira_client()
+    render_refresh_info(refresh_info)
     
     # Show connection status
     if jira_client is None:
@@ -1100,20 +1380,33 @@ def main():
     else:
         st.success("✅ Connected to JIRA successfully!")
     
-    # Render global sidebar once and get selected team members
-    selected_members = render_global_sidebar()
-    
-    # Navigation tabs - added "Last Week Completed" tab
-    tab1, tab2, tab3 = st.tabs(["📊 Weekly Activity", "🎯 Priority Dashboard", "📋 Last Week Completed"])
+    with report_export_slot:
+        render_report_export(selected_members)
     
-    with tab1:
-        show_weekly_activity(selected_members)
-    
-    with tab2:
-        render_priority_dashboard_tab(selected_members)
+    # Dashboard views in navigation order
+    views = {
+        "📊 Weekly Activity": show_weekly_activity,
+        "🎯 Priority Dashboard": render_priority_dashboard_tab,
+        "📋 Last Week Completed": render_last_week_completed_tab
+    }
     
-    with tab3:
-        render_last_week_completed_tab(selected_members)
+    if config['app']['LAZY_NAVIGATION']:
+        # Only the selected view is built, so rerun cost follows what is on screen
+        preserve_view_state()
+        active_view = st.radio(
+            "View",
+            options=list(views.keys()),
+            horizontal=True,
+            label_visibility="collapsed",
+            key="active_view"
+        )
+        with perf.span(f"view: {active_view}", "app"):
+            views[active_view](selected_members)
+    else:
+        # Classic tabs execute every view on each rerun
+        for tab, render_view in zip(st.tabs(list(views.keys())), views.values()):
+            with tab:
+                render_view(selected_members)
     
     # Footer
     st.markdown("---")
@@ -1127,6 +1420,13 @@ def main():
         """, 
         unsafe_allow_html=True
     )
+    
+    # Timing waterfall for this rerun, shown with the sidebar debug info
+    profile = perf.finish_rerun()
+    telemetry.RERUN_DURATION.observe(profile.total_seconds)
+    if st.session_state.get("debug_info"):
+        perf.render_performance_panel(profile)
+        data_store.render_cache_panel(data_store.STORE)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,281 @@
+"""
+Performance instrumentation for JIRA Daily Activity Dashboard
+Records lightweight timing spans per script rerun and renders the Performance panel
+"""
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Callable
+
+import pandas as pd
+
+import telemetry
+
+_local = threading.local()
+
+
+class RerunProfile:
+    """Timing spans and query statistics collected during one script rerun"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+        self.spans: List[Dict[str, Any]] = []
+        self.queries: Dict[str, Dict[str, Any]] = {}
+        # Worker threads record into the same profile (see in_current_rerun)
+        self.lock = threading.Lock()
+
+    @property
+    def total_seconds(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def query_stats(self, query: str) -> Dict[str, Any]:
+        """Get (or create) the statistics entry for a query; update it while holding lock"""
+        with self.lock:
+            if query not in self.queries:
+                self.queries[query] = {'calls': 0, 'hits': 0, 'misses': 0, 'rows': 0, 'bytes': 0, 'seconds': 0.0}
+            return self.queries[query]
+
+    def add_span(self, span: Dict[str, Any]) -> None:
+        with self.lock:
+            self.spans.append(span)
+
+
+def start_rerun() -> RerunProfile:
+    """Start collecting spans for the current script rerun"""
+    profile = RerunProfile()
+    _local.profile = profile
+    _local.depth = 0
+    return profile
+
+
+def finish_rerun() -> Optional[RerunProfile]:
+    """Stop collecting spans and return the finished profile"""
+    profile = current_profile()
+    if profile is not None:
+        profile.finished_at = time.perf_counter()
+        _local.profile = None
+    return profile
+
+
+def current_profile() -> Optional[RerunProfile]:
+    """Profile for the rerun executing on this thread, if any"""
+    return getattr(_local, 'profile', None)
+
+
+@contextmanager
+def span(name: str, category: str = "app"):
+    """Time a block of code as a span of the current rerun (no-op outside a rerun)"""
+    profile = current_profile()
+    if profile is None:
+        yield
+        return
+
+    # Nesting depth is tracked per thread, so concurrent spans of worker threads do not interleave it
+    depth = getattr(_local, 'depth', 0)
+    start = time.perf_counter()
+    _local.depth = depth + 1
+    try:
+        yield
+    finally:
+        _local.depth = depth
+        profile.add_span({
+            'name': name,
+            'category': category,
+            'start': start - profile.started_at,
+            'duration': time.perf_counter() - start,
+            'depth': depth
+        })
+
+
+def _result_rows(result: Any) -> int:
+    """Row count of a query result"""
+    try:
+        return len(result)
+    except TypeError:
+        return 0
+
+
+def _active_queries() -> List[str]:
+    """Stack of queries running on this thread"""
+    if not hasattr(_local, 'active_queries'):
+        _local.active_queries = []
+    return _local.active_queries
+
+
+def in_current_rerun(func: Callable) -> Callable:
+    """Wrap func so that on a worker thread it records into the calling thread's rerun and query"""
+    profile = current_profile()
+    active = list(_active_queries())
+    depth = getattr(_local, 'depth', 0)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = getattr(_local, 'profile', None), getattr(_local, 'active_queries', []), getattr(_local, 'depth', 0)
+        # Spans of the worker nest below the span that was open when func was wrapped
+        _local.profile, _local.active_queries, _local.depth = profile, list(active), depth
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.profile, _local.active_queries, _local.depth = previous
+
+    return wrapper
+
+
+def timed_query(func: Callable) -> Callable:
+    """Record a span, metrics, rows returned and cache hit/miss for a cached JIRAClient query.
+
+    Apply above the cache decorator; pair with cache_miss applied below it so that
+    an executed function body is counted as a miss.
+    """
+    query = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        active = _active_queries()
+        misses_before = getattr(_local, 'miss_count', 0)
+        active.append(query)
+        start = time.perf_counter()
+        try:
+            with span(f"jira: {query}", "jira"):
+                result = func(*args, **kwargs)
+        finally:
+            active.pop()
+        elapsed = time.perf_counter() - start
+        hit = getattr(_local, 'miss_count', 0) == misses_before
+        rows = _result_rows(result)
+
+        telemetry.QUERY_CALLS.inc(query=query)
+        telemetry.QUERY_DURATION.observe(elapsed, query=query)
+        telemetry.QUERY_ROWS.inc(rows, query=query)
+        (telemetry.CACHE_HITS if hit else telemetry.CACHE_MISSES).inc(query=query)
+
+        profile = current_profile()
+        if profile is not None:
+            stats = profile.query_stats(query)
+            with profile.lock:
+                stats['calls'] += 1
+                stats['seconds'] += elapsed
+                stats['rows'] += rows
+                stats['hits' if hit else 'misses'] += 1
+        return result
+
+    return wrapper
+
+
+def cache_miss(func: Callable) -> Callable:
+    """Mark a cached query as a miss whenever its body actually executes"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _local.miss_count = getattr(_local, 'miss_count', 0) + 1
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def record_response(response, *args, **kwargs):
+    """requests response hook attributing payload bytes to the running query"""
+    active = _active_queries()
+    query = active[-1] if active else "other"
+    size = len(response.content or b'')
+    telemetry.RESPONSE_BYTES.inc(size, query=query)
+    profile = current_profile()
+    if profile is not None:
+        stats = profile.query_stats(query)
+        with profile.lock:
+            stats['bytes'] += size
+    return response
+
+
+def spans_dataframe(profile: RerunProfile) -> pd.DataFrame:
+    """Spans of a profile as a DataFrame ordered by start time"""
+    with profile.lock:
+        spans = list(profile.spans)
+    if not spans:
+        return pd.DataFrame(columns=['name', 'category', 'start', 'duration', 'depth'])
+    return pd.DataFrame(spans).sort_values('start').reset_index(drop=True)
+
+
+def create_waterfall_chart(profile: RerunProfile):
+    """Create a timing waterfall chart for one rerun"""
+    import plotly.graph_objects as go
+
+    spans_df = spans_dataframe(profile)
+    if spans_df.empty:
+        return go.Figure()
+
+    labels = [f"{'· ' * depth}{name}" for name, depth in zip(spans_df['name'], spans_df['depth'])]
+    fig = go.Figure(go.Bar(
+        x=spans_df['duration'] * 1000,
+        y=labels,
+        base=spans_df['start'] * 1000,
+        orientation='h',
+        marker_color=[{'jira': '#007bff', 'data': '#28a745', 'chart': '#fd7e14', 'render': '#6f42c1'}.get(c, '#6c757d')
+                      for c in spans_df['category']],
+        hovertemplate="%{y}<br>start %{base:.1f} ms<br>%{x:.1f} ms<extra></extra>"
+    ))
+    fig.update_layout(
+        title=f"Rerun Timing Waterfall ({profile.total_seconds * 1000:.0f} ms total)",
+        xaxis_title="Milliseconds since rerun start",
+        yaxis=dict(autorange='reversed'),
+        height=max(300, 22 * len(spans_df) + 120),
+        showlegend=False
+    )
+    return fig
+
+
+def render_performance_panel(profile: Optional[RerunProfile], scope: str = "this rerun") -> None:
+    """Render the collapsible Performance panel for a finished rerun"""
+    import streamlit as st
+
+    if profile is None:
+        return
+
+    with st.expander(f"⏱️ Performance ({profile.total_seconds * 1000:.0f} ms {scope})", expanded=False):
+        st.plotly_chart(create_waterfall_chart(profile), use_container_width=True)
+
+        if profile.queries:
+            queries_df = pd.DataFrame([
+                {
+                    'Query': query,
+                    'Calls': stats['calls'],
+                    'Cache Hits': stats['hits'],
+                    'Cache Misses': stats['misses'],
+                    'Rows': stats['rows'],
+                    'Payload (KB)': stats['bytes'] / 1024,
+                    'Time (ms)': stats['seconds'] * 1000
+                }
+                for query, stats in profile.queries.items()
+            ])
+            st.markdown("**JIRA Queries**")
+            st.dataframe(
+                queries_df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Payload (KB)": st.column_config.NumberColumn("Payload (KB)", format="%.1f"),
+                    "Time (ms)": st.column_config.NumberColumn("Time (ms)", format="%.1f")
+                }
+            )
+
+        spans_df = spans_dataframe(profile)
+        if not spans_df.empty:
+            slowest = spans_df.sort_values('duration', ascending=False).head(10)
+            st.markdown("**Slowest Spans**")
+            st.dataframe(
+                pd.DataFrame({
+                    'Span': slowest['name'],
+                    'Category': slowest['category'],
+                    'Start (ms)': slowest['start'] * 1000,
+                    'Duration (ms)': slowest['duration'] * 1000
+                }),
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Start (ms)": st.column_config.NumberColumn("Start (ms)", format="%.1f"),
+                    "Duration (ms)": st.column_config.NumberColumn("Duration (ms)", format="%.1f")
+                }
+            )
@@ -0,0 +1,132 @@
+"""
+Pre-aggregated rollup cube for JIRA Daily Activity Dashboard
+Counts and story-point sums by status, issue type, assignee and day, built in one pass per fetch
+"""
+from typing import Dict, List, Any, Optional
+
+import pandas as pd
+
+# Status groups shared by the summary metrics and the status filter
+COMPLETED_STATUSES = ["Done", "Closed", "Resolved"]
+# Updated logic: count "Development" status as "In Progress" for Weekly Activity
+PROGRESS_STATUSES = ["Development", "In Progress", "In Review", "Testing"]
+BLOCKED_STATUSES = ["Blocked"]
+
+# Statuses selected by each option of the status filter
+STATUS_FILTER_GROUPS = {
+    "Completed": COMPLETED_STATUSES,
+    "In Progress": ["In Progress", "In Review", "Testing"],
+    "Blocked": BLOCKED_STATUSES
+}
+
+CUBE_DIMENSIONS = ['status', 'issue_type', 'assignee', 'day']
+CUBE_MEASURES = ['count', 'story_points', 'story_points_count', 'actual_story_points']
+
+
+def status_bucket(statuses: pd.Series) -> pd.Series:
+    """Map statuses to Completed / In Progress / Blocked / Other"""
+    buckets = pd.Series("Other", index=statuses.index)
+    buckets[statuses.isin(PROGRESS_STATUSES)] = "In Progress"
+    buckets[statuses.isin(BLOCKED_STATUSES)] = "Blocked"
+    buckets[statuses.isin(COMPLETED_STATUSES)] = "Completed"
+    return buckets
+
+
+class RollupCube:
+    """Issue counts and story-point sums by status, issue type, assignee and updated day"""
+
+    def __init__(self, cells: pd.DataFrame):
+        self.cells = cells
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    @property
+    def empty(self) -> bool:
+        return self.cells.empty
+
+    @property
+    def total_issues(self) -> int:
+        return int(self.cells['count'].sum())
+
+    def slice(self, issue_types: Optional[List[str]] = None, statuses: Optional[List[str]] = None) -> 'RollupCube':
+        """Cube restricted to the given issue types and statuses (None keeps everything)"""
+        mask = pd.Series(True, index=self.cells.index)
+        if issue_types is not None:
+            mask &= self.cells['issue_type'].isin(issue_types)
+        if statuses is not None:
+            mask &= self.cells['status'].isin(statuses)
+        return RollupCube(self.cells[mask])
+
+    def slice_status_filter(self, status_filter: str = "All") -> 'RollupCube':
+        """Cube restricted the same way filter_dataframe_by_status restricts rows"""
+        if status_filter == "All":
+            return self
+        return self.slice(statuses=STATUS_FILTER_GROUPS.get(status_filter, [status_filter]))
+
+    def counts_by(self, dimension: str) -> pd.Series:
+        """Issue count per value of one dimension, largest first (like value_counts)"""
+        counts = self.cells.groupby(dimension, sort=False)['count'].sum()
+        return counts.sort_values(ascending=False, kind='stable')
+
+    def daily_counts(self) -> pd.Series:
+        """Number of issues updated per calendar day, in date order"""
+        return self.cells.groupby('day')['count'].sum().rename_axis('updated_date')
+
+    def total(self, measure: str) -> float:
+        """Sum of a measure over the whole cube"""
+        return float(self.cells[measure].sum()) if not self.cells.empty else 0.0
+
+    def summary_metrics(self) -> Dict[str, Any]:
+        """Summary metrics answered from the cube (same keys as utils.get_summary_metrics)"""
+        total_issues = self.total_issues
+        buckets = self.cells.groupby('status_bucket')[['count', 'story_points', 'story_points_count']].sum()
+
+        def bucket_value(bucket: str, measure: str) -> float:
+            return buckets.at[bucket, measure] if bucket in buckets.index else 0
+
+        completed_issues = int(bucket_value("Completed", 'count'))
+        completed_points_count = bucket_value("Completed", 'story_points_count')
+        avg_story_points = (
+            bucket_value("Completed", 'story_points') / completed_points_count
+            if completed_points_count else 0
+        )
+
+        return {
+            'total_issues': total_issues,
+            'completed_issues': completed_issues,
+            'in_progress_issues': int(bucket_value("In Progress", 'count')),
+            'blocked_issues': int(bucket_value("Blocked", 'count')),
+            'completion_rate': (completed_issues / total_issues * 100) if total_issues > 0 else 0,
+            'avg_story_points': avg_story_points or 0
+        }
+
+
+def _numeric_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Numeric view of an optional column (missing or non-numeric values become NaN)"""
+    if column not in df.columns:
+        return pd.Series(float('nan'), index=df.index)
+    return pd.to_numeric(df[column], errors='coerce')
+
+
+def build_rollup(df: pd.DataFrame) -> RollupCube:
+    """Aggregate an issue frame into a rollup cube in one grouped pass"""
+    if df.empty:
+        return RollupCube(pd.DataFrame(columns=CUBE_DIMENSIONS + CUBE_MEASURES + ['status_bucket']))
+
+    frame = pd.DataFrame({
+        'status': df['status'],
+        'issue_type': df['issue_type'],
+        'assignee': df['assignee'],
+        'day': df['updated'].dt.date,
+        'story_points': _numeric_column(df, 'story_points'),
+        'actual_story_points': _numeric_column(df, 'actual_story_points')
+    })
+    cells = frame.groupby(CUBE_DIMENSIONS, sort=False, dropna=False).agg(
+        count=('story_points', 'size'),
+        story_points=('story_points', 'sum'),
+        story_points_count=('story_points', 'count'),
+        actual_story_points=('actual_story_points', 'sum')
+    ).reset_index()
+    cells['status_bucket'] = status_bucket(cells['status'])
+    return RollupCube(cells)
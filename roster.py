@@ -0,0 +1,150 @@
+"""
+Team roster for JIRA Daily Activity Dashboard
+Loads the teams and people the dashboard filters on from a roster file (JSON or CSV) or from
+JIRA groups, so one deployment can cover several teams and hundreds of people.
+"""
+import csv
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Roster file with the teams to show (JSON or CSV); the built-in team list is used when unset
+TEAM_ROSTER_FILE = os.getenv("TEAM_ROSTER_FILE", "")
+
+# JIRA group whose members form the team, when no roster file is set
+TEAM_GROUP = os.getenv("TEAM_GROUP", "")
+
+DEFAULT_TEAM = "Team"
+
+
+def make_team(members: Dict[str, str], group: Optional[str] = None) -> Dict[str, Any]:
+    return {'group': group or None, 'members': dict(members)}
+
+
+def load_roster_file(path: str) -> Dict[str, Dict[str, Any]]:
+    """Teams of a roster file.
+
+    JSON: {"teams": {"Data": {"group": "data-team", "members": {"Name": "email"}}}} or a flat
+    {"Name": "email"} mapping. CSV: a header row with name and email columns, plus optional
+    team and group columns.
+    """
+    if path.lower().endswith('.csv'):
+        teams: Dict[str, Dict[str, Any]] = {}
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                name, email = (row.get('name') or '').strip(), (row.get('email') or '').strip()
+                if not name or not email:
+                    continue
+                team = teams.setdefault((row.get('team') or '').strip() or DEFAULT_TEAM, make_team({}))
+                team['group'] = team['group'] or (row.get('group') or '').strip() or None
+                if team['members'].get(name, email) != email:
+                    raise ValueError(f"Name {name} is used for both {team['members'][name]} and {email}")
+                team['members'][name] = email
+        return teams
+
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if 'teams' not in data:
+        return {DEFAULT_TEAM: make_team(data)}
+    return {
+        team: make_team(spec.get('members') or {}, spec.get('group'))
+        for team, spec in data['teams'].items()
+    }
+
+
+def name_collisions(teams: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Member names that stand for more than one email across teams -> their emails"""
+    emails: Dict[str, List[str]] = {}
+    for team in teams.values():
+        for name, email in team['members'].items():
+            if email not in emails.setdefault(name, []):
+                emails[name].append(email)
+    return {name: found for name, found in emails.items() if len(found) > 1}
+
+
+def qualify_names(members: Dict[str, str], taken: Dict[str, str]) -> Dict[str, str]:
+    """members, with names another email already has renamed to Name (email)"""
+    return {
+        (f"{name} ({email})" if taken.get(name, email) != email else name): email
+        for name, email in members.items()
+    }
+
+
+class TeamRoster:
+    """Teams with their optional JIRA group and members (name -> email)
+
+    Members are selected by name, so a name may stand for only one email across all teams.
+    """
+
+    def __init__(self, teams: Dict[str, Dict[str, Any]]):
+        collisions = name_collisions(teams)
+        if collisions:
+            raise ValueError("Names used for more than one person: " + "; ".join(
+                f"{name} ({', '.join(emails)})" for name, emails in collisions.items()
+            ))
+        self.teams = teams
+        # All members of all teams; the same dict for the life of the process, updated in place
+        self.members: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._rebuild_members()
+
+    def _rebuild_members(self) -> None:
+        members = {}
+        for team in self.teams.values():
+            members.update(team['members'])
+        self.members.clear()
+        self.members.update(members)
+
+    def team_names(self) -> List[str]:
+        return list(self.teams.keys())
+
+    def members_of(self, teams: Iterable[str]) -> List[str]:
+        """Names of the members of the given teams, in roster order"""
+        names = [name for team in teams if team in self.teams for name in self.teams[team]['members']]
+        return list(dict.fromkeys(names))
+
+    def groups(self) -> Dict[str, List[str]]:
+        """JIRA group -> member emails, for teams that declare a group"""
+        return {
+            team['group']: list(team['members'].values())
+            for team in self.teams.values() if team['group'] and team['members']
+        }
+
+    def unresolved_groups(self) -> List[str]:
+        """Groups of teams whose members have not been loaded from JIRA yet"""
+        return [team['group'] for team in self.teams.values() if team['group'] and not team['members']]
+
+    def resolve_groups(self, fetch_members: Callable[[str], Dict[str, str]]) -> None:
+        """Load the members of group-only teams with fetch_members(group) -> {name: email}"""
+        with self._lock:
+            for team_name, team in self.teams.items():
+                if not team['group'] or team['members']:
+                    continue
+                try:
+                    # JIRA display names are not unique; a name another team already uses for a
+                    # different person is qualified with the email instead of merging the two
+                    team['members'] = qualify_names(dict(fetch_members(team['group']) or {}), self.members)
+                    self.members.update(team['members'])
+                    logger.info(f"Loaded {len(team['members'])} members of team {team_name} from group {team['group']}")
+                except Exception as e:
+                    logger.error(f"Failed to load members of group {team['group']}: {str(e)}")
+            self._rebuild_members()
+
+
+def load_roster(default_members: Dict[str, str], path: str = TEAM_ROSTER_FILE, group: str = TEAM_GROUP) -> TeamRoster:
+    """Roster from the roster file or JIRA group, falling back to the built-in team"""
+    if path:
+        try:
+            teams = load_roster_file(path)
+            logger.info(f"Loaded roster of {sum(len(t['members']) for t in teams.values())} people in {len(teams)} teams from {path}")
+            return TeamRoster(teams)
+        except Exception as e:
+            logger.error(f"Failed to load roster file {path}: {str(e)}")
+    if group:
+        # Members are loaded from JIRA once a connection exists
+        return TeamRoster({group: make_team({}, group)})
+    return TeamRoster({DEFAULT_TEAM: make_team(default_members)})
@@ -0,0 +1,126 @@
+"""
+Sharded JIRA search for JIRA Daily Activity Dashboard
+Fetches long activity windows as slices of the updated timeline. Each slice is small enough to
+be paged with shallow startAt offsets; slices whose total is too large are split further, and
+all pages are fetched concurrently and merged by issue key.
+"""
+import logging
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from jql import merge_results
+
+logger = logging.getLogger(__name__)
+
+# Activity windows of at least this many days are fetched whole as sharded slices (0 disables sharding)
+SHARD_MIN_WINDOW_DAYS = int(os.getenv("SHARD_MIN_WINDOW_DAYS", "30"))
+
+# Issues one slice may hold before it is split, bounding the deepest startAt offset
+MAX_SLICE_RESULTS = int(os.getenv("SHARD_MAX_SLICE_RESULTS", "500"))
+
+# Slices are not split below this width (a busier hour is simply paged further)
+MIN_SLICE_MINUTES = 60
+
+# Issues requested per search call; JIRA caps pages at 100 on most instances
+PAGE_SIZE = 100
+
+# Each request resolves "now" on its own, so adjacent slices overlap to leave no gap between them
+SLICE_OVERLAP_MINUTES = 1
+
+# (search JQL, newer_than minutes ago, older_than minutes ago or None for "up to now")
+Shard = Tuple[str, int, Optional[int]]
+
+
+def insert_clause(jql: str, clause: str) -> str:
+    """Add a clause to the WHERE part of a search JQL, keeping its ORDER BY"""
+    where, separator, order = jql.partition(" ORDER BY ")
+    return f"({where.strip()}) AND {clause}" + (f"{separator}{order}" if separator else "")
+
+
+def slice_clause(newer_than: int, older_than: Optional[int]) -> str:
+    """JQL clause for issues updated between two offsets in minutes; relative, so no timezone applies"""
+    clause = f"updated >= -{newer_than}m"
+    if older_than is not None and older_than > SLICE_OVERLAP_MINUTES:
+        clause += f" AND updated < -{older_than - SLICE_OVERLAP_MINUTES}m"
+    return clause
+
+
+def split_shard(shard: Shard, parts: int) -> List[Shard]:
+    """Split a slice into parts of equal width, newest first"""
+    query, newer_than, older_than = shard
+    newest = older_than or 0
+    width = (newer_than - newest) / parts
+    bounds = [newest + round(width * i) for i in range(parts + 1)]
+    return [
+        (query, bounds[i + 1], bounds[i] if i or older_than is not None else None)
+        for i in range(parts)
+    ]
+
+
+def sharded_search(search: Callable[[str, int, int], Any], searches: List[str], window_days: int,
+                   executor: Executor, count: Optional[Callable[[str], int]] = None,
+                   max_slice_results: int = MAX_SLICE_RESULTS) -> List[Any]:
+    """All issues of each search updated in the last window_days, fetched as updated-time slices.
+
+    search(jql, start_at, max_results) runs one search call (max_results 0 fetches every page).
+    Every slice is probed for its size: slices above max_slice_results are split in proportion
+    to it and probed again, the others are fetched; all calls run concurrently on executor.
+    The probe is the slice's first page, whose total gives the size. With count(jql) (JIRA Cloud,
+    whose token-paged search reports no totals) the size is counted instead and each slice is
+    then fetched whole.
+    """
+    pages: List[Any] = []
+    running: Dict[Future, Tuple[str, Optional[Shard], str]] = {}
+    probes = followups = 0
+
+    def probe(shard: Shard) -> None:
+        jql = insert_clause(shard[0], slice_clause(shard[1], shard[2]))
+        future = executor.submit(search, jql, 0, PAGE_SIZE) if count is None else executor.submit(count, jql)
+        running[future] = ('probe', shard, jql)
+
+    def fetch(jql: str, start_at: int, max_results: int) -> None:
+        running[executor.submit(search, jql, start_at, max_results)] = ('page', None, jql)
+
+    for query in searches:
+        probe((query, window_days * 24 * 60, None))
+    # Each slice is split or paged as soon as its own probe returns, without waiting for the others
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            kind, shard, jql = running.pop(future)
+            result = future.result()
+            if kind == 'page':
+                pages.append(result)
+                continue
+            probes += 1
+            issues, total = (None, result) if count is not None else (result, getattr(result, 'total', None) or len(result))
+            width = shard[1] - (shard[2] or 0)
+            if total > max_slice_results and width > MIN_SLICE_MINUTES:
+                parts = max(2, min(math.ceil(total / max_slice_results) + 1, width // MIN_SLICE_MINUTES))
+                for part in split_shard(shard, parts):
+                    probe(part)
+            elif issues is None:
+                if total:
+                    fetch(jql, 0, 0)
+                    followups += 1
+            else:
+                pages.append(issues)
+                # The server may cap pages below PAGE_SIZE; step by what it actually returned
+                step = len(issues) or PAGE_SIZE
+                for start_at in range(len(issues), total, step):
+                    fetch(jql, start_at, step)
+                    followups += 1
+
+    issues = merge_results(pages, _order_by(searches[0]) if searches else "")
+    logger.info(
+        f"Sharded search: {probes} slice probes and {followups} follow-up pages "
+        f"returned {len(issues)} issues over {window_days} days"
+    )
+    return issues
+
+
+def _order_by(jql: str) -> str:
+    _, separator, order = jql.partition(" ORDER BY ")
+    return f"ORDER BY {order}" if separator else ""
@@ -0,0 +1,248 @@
+"""
+Daily snapshot store for JIRA Daily Activity Dashboard
+Append-only, dictionary-encoded Parquet snapshots of the team's issue states that trend charts
+read instead of re-querying months of JIRA history.
+Usage: python snapshots.py [--force]   (e.g. from a daily cron job)
+"""
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from config import get_config
+from rollup import status_bucket
+
+logger = logging.getLogger(__name__)
+
+# Where snapshot files are kept (override with SNAPSHOT_DIR)
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots"))
+
+# Issue fields kept per snapshot row
+SNAPSHOT_COLUMNS = ['key', 'status', 'issue_type', 'assignee', 'priority', 'story_points',
+                    'actual_story_points', 'resolution_date']
+
+# Repeated strings stored once per file as Parquet dictionaries
+SNAPSHOT_CATEGORY_COLUMNS = ['status', 'status_bucket', 'issue_type', 'assignee', 'priority']
+
+# Loaded history frames kept in memory, keyed by the snapshot files they came from
+HISTORY_CACHE_SIZE = 8
+
+# Snapshot files kept in memory as Arrow tables, so a new day only reads one new file
+FILE_CACHE_SIZE = 400
+
+TREND_BUCKETS = ["In Progress", "Blocked", "Other"]
+
+# After a long gap without snapshots, resolutions are backfilled at most this far (the longest trend window)
+MAX_RESOLVED_BACKFILL_DAYS = 365
+
+_FILE_RE = re.compile(r"^snapshot-(\d{4}-\d{2}-\d{2})\.parquet$")
+
+_history_cache: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
+_history_cache_lock = threading.Lock()
+_file_cache: "OrderedDict[Tuple[str, int], object]" = OrderedDict()
+_snapshot_lock = threading.Lock()
+
+
+def snapshot_path(day: date, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or SNAPSHOT_DIR, f"snapshot-{day.isoformat()}.parquet")
+
+
+def build_snapshot(df: pd.DataFrame, day: date) -> pd.DataFrame:
+    """Compact snapshot rows of an issue frame: categories for repeated strings, float32 points"""
+    snapshot = pd.DataFrame({
+        column: df[column] if column in df.columns else pd.Series(None, index=df.index, dtype=object)
+        for column in SNAPSHOT_COLUMNS
+    }).reset_index(drop=True)
+    snapshot['status_bucket'] = status_bucket(snapshot['status'])
+    for column in ('story_points', 'actual_story_points'):
+        snapshot[column] = pd.to_numeric(snapshot[column], errors='coerce').astype('float32')
+    snapshot['resolution_date'] = pd.to_datetime(snapshot['resolution_date'], errors='coerce', utc=True)
+    snapshot['snapshot_date'] = pd.Timestamp(day)
+    return snapshot.astype({column: 'category' for column in SNAPSHOT_CATEGORY_COLUMNS})
+
+
+def write_snapshot(df: pd.DataFrame, day: Optional[date] = None, directory: Optional[str] = None,
+                   overwrite: bool = False) -> Optional[str]:
+    """Persist one day's snapshot; an existing day is kept unless overwrite (returns the path written)"""
+    day = day or date.today()
+    path = snapshot_path(day, directory)
+    if os.path.exists(path) and not overwrite:
+        return None
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    build_snapshot(df, day).to_parquet(tmp_path, index=False, compression='zstd')
+    # Readers never see a partially written file
+    os.replace(tmp_path, path)
+    logger.info(f"Wrote snapshot of {len(df)} issues to {path}")
+    return path
+
+
+def snapshot_days(directory: Optional[str] = None) -> List[date]:
+    """Days with a stored snapshot, oldest first"""
+    directory = directory or SNAPSHOT_DIR
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        date.fromisoformat(match.group(1))
+        for match in map(_FILE_RE.match, os.listdir(directory)) if match
+    )
+
+
+def _history_key(days: int, directory: Optional[str], end: Optional[date]) -> Tuple:
+    """Snapshot files (path, mtime) covering the last N days up to end"""
+    end = end or date.today()
+    start = end - timedelta(days=days - 1)
+    paths = [snapshot_path(day, directory) for day in snapshot_days(directory) if start <= day <= end]
+    return tuple((path, os.stat(path).st_mtime_ns) for path in paths)
+
+
+def _cached(key: Tuple):
+    with _history_cache_lock:
+        cached = _history_cache.get(key)
+        if cached is not None:
+            _history_cache.move_to_end(key)
+        return cached
+
+
+def _remember(key: Tuple, value) -> None:
+    with _history_cache_lock:
+        _history_cache[key] = value
+        while len(_history_cache) > HISTORY_CACHE_SIZE:
+            _history_cache.popitem(last=False)
+
+
+def load_history(days: int = 90, directory: Optional[str] = None, end: Optional[date] = None) -> pd.DataFrame:
+    """Snapshot rows of the last N days, memoized until a snapshot file in the range changes"""
+    key = _history_key(days, directory, end)
+    if not key:
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS + ['status_bucket', 'snapshot_date'])
+
+    cached = _cached(key)
+    if cached is not None:
+        return cached
+
+    import pyarrow as pa
+
+    # Each file has its own dictionaries; Arrow unifies them into one set of categories
+    history = pa.concat_tables([_read_snapshot_file(path, mtime) for path, mtime in key]).to_pandas()
+    _remember(key, history)
+    return history
+
+
+def load_trends(days: int = 90, assignees: Optional[Iterable[str]] = None, directory: Optional[str] = None,
+                end: Optional[date] = None) -> Tuple[pd.Series, pd.Series]:
+    """WIP trend and weekly throughput of the last N days, memoized with the snapshot files they come from"""
+    assignees = tuple(sorted(assignees)) if assignees is not None else None
+    key = ('trends', _history_key(days, directory, end), assignees)
+    trends = _cached(key)
+    if trends is None:
+        history = load_history(days, directory, end)
+        trends = (wip_trend(history, assignees), weekly_throughput(history, assignees))
+        _remember(key, trends)
+    return trends
+
+
+def _read_snapshot_file(path: str, mtime: int):
+    """Arrow table of one snapshot file, cached by path and modification time"""
+    import pyarrow.parquet as pq
+
+    with _history_cache_lock:
+        table = _file_cache.get((path, mtime))
+    if table is None:
+        table = pq.read_table(path)
+        with _history_cache_lock:
+            _file_cache[(path, mtime)] = table
+            while len(_file_cache) > FILE_CACHE_SIZE:
+                _file_cache.popitem(last=False)
+    return table
+
+
+def _assignee_mask(history: pd.DataFrame, assignees: Optional[Iterable[str]]):
+    if assignees is None:
+        return True
+    return history['assignee'].isin(list(assignees)).to_numpy()
+
+
+def wip_trend(history: pd.DataFrame, assignees: Optional[Iterable[str]] = None) -> pd.Series:
+    """Open issues per snapshot day and status bucket (In Progress / Blocked / Other)"""
+    if history.empty:
+        return pd.Series(dtype='int64', name='count')
+    mask = history['status_bucket'].isin(TREND_BUCKETS).to_numpy() & _assignee_mask(history, assignees)
+    # Only the two grouping columns are filtered, never the whole frame
+    dates, buckets = history['snapshot_date'][mask], history['status_bucket'][mask]
+    return dates.groupby([dates, buckets], observed=True).size().rename('count')
+
+
+def weekly_throughput(history: pd.DataFrame, assignees: Optional[Iterable[str]] = None) -> pd.Series:
+    """Issues resolved per week (week starting Monday), each issue counted once"""
+    if history.empty:
+        return pd.Series(dtype='int64', name='count')
+    mask = ((history['status_bucket'] == "Completed").to_numpy()
+            & history['resolution_date'].notna().to_numpy()
+            & _assignee_mask(history, assignees))
+    resolved = pd.Series(history['resolution_date'].to_numpy()[mask], index=history['key'].to_numpy()[mask])
+    resolved = resolved[~resolved.index.duplicated(keep='last')]
+    weeks = resolved.dt.tz_localize(None).dt.to_period('W-SUN').dt.start_time
+    return weeks.value_counts().sort_index().rename_axis('week').rename('count')
+
+
+def resolved_since(directory: Optional[str] = None, today: Optional[date] = None) -> date:
+    """First day whose resolutions today's snapshot must include: the day of the last stored snapshot.
+
+    Resolutions later that day or on days without a snapshot are then still counted (throughput counts
+    each issue once, so the overlap with the last snapshot is harmless). Without one, yesterday.
+    """
+    today = today or date.today()
+    earlier = [day for day in snapshot_days(directory) if day < today]
+    since = earlier[-1] if earlier else today - timedelta(days=1)
+    return max(since, today - timedelta(days=MAX_RESOLVED_BACKFILL_DAYS))
+
+
+def take_daily_snapshot(jira_client, directory: Optional[str] = None, force: bool = False) -> Optional[str]:
+    """Fetch the whole team's open issues and those resolved since the last snapshot, and store today's snapshot"""
+    path = snapshot_path(date.today(), directory)
+    if os.path.exists(path) and not force:
+        return None
+    with _snapshot_lock:
+        if os.path.exists(path) and not force:
+            return None
+        members = list(get_config()['team_members'].keys())
+        df = jira_client.get_team_snapshot_issues(members, resolved_since(directory).isoformat())
+        if df.empty:
+            logger.warning("Snapshot skipped: no issues returned")
+            return None
+        return write_snapshot(df, directory=directory, overwrite=force)
+
+
+def ensure_daily_snapshot(jira_client, directory: Optional[str] = None) -> None:
+    """Take today's snapshot in the background if no session has taken it yet"""
+    if os.path.exists(snapshot_path(date.today(), directory)) or _snapshot_lock.locked():
+        return
+
+    def run():
+        try:
+            take_daily_snapshot(jira_client, directory)
+        except Exception as e:
+            logger.error(f"Failed to take daily snapshot: {str(e)}")
+
+    threading.Thread(target=run, name="daily-snapshot", daemon=True).start()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from jira_client import JIRAClient
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Store today's snapshot of the team's issues")
+    parser.add_argument('--force', action='store_true', help="Replace today's snapshot if it exists")
+    parser.add_argument('--dir', help=f"Snapshot directory (default {SNAPSHOT_DIR})")
+    args = parser.parse_args()
+    written = take_daily_snapshot(JIRAClient(), args.dir, force=args.force)
+    print(written or "Today's snapshot already exists (use --force to replace it)")
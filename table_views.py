@@ -0,0 +1,301 @@
+"""
+Declarative table views for JIRA Daily Activity Dashboard
+Display frames for the three tabs built with Arrow compute column transforms and memoized per data version,
+row filters, and the search, sort and page slicing of the paginated issue tables, which run on Arrow tables
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional, Iterable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from extraction import parse_timestamps
+
+# Number of built display frames kept in memory
+TABLE_VIEW_CACHE_SIZE = 32
+
+SUMMARY_MAX_LENGTH = 80
+
+# Rows per page of the paginated issue tables; only the visible page is sent to the browser
+TABLE_PAGE_SIZE = int(os.getenv("TABLE_PAGE_SIZE", "50"))
+
+# Searched/sorted row orders kept in memory, so paging through a result does not redo them
+TABLE_ORDER_CACHE_SIZE = 64
+
+# Columns that identify the content of a frame of issues
+VERSION_COLUMNS = ['key', 'updated']
+
+# A column spec is (output column, source column, transform)
+ColumnSpec = Tuple[str, str, str]
+
+_view_cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+_view_cache_lock = threading.Lock()
+
+# id(display frame) -> (frame, Arrow table), (frame, search text) and (id, sort, order, search) ->
+# (frame, row positions). Entries hold the frame itself, so an id is never reused while its entry exists.
+_arrow_cache: "OrderedDict[int, Tuple[pd.DataFrame, pa.Table]]" = OrderedDict()
+_search_text_cache: "OrderedDict[int, Tuple[pd.DataFrame, pa.ChunkedArray]]" = OrderedDict()
+_order_cache: "OrderedDict[tuple, Tuple[pd.DataFrame, np.ndarray]]" = OrderedDict()
+_order_cache_lock = threading.Lock()
+
+
+def _text(values: pa.Array) -> pa.Array:
+    return values if pa.types.is_string(values.type) else pc.cast(values, pa.string())
+
+
+def date_text(values: pa.Array) -> pa.Array:
+    """Dates as YYYY-MM-DD strings, 'N/A' where missing"""
+    if not pa.types.is_timestamp(values.type):
+        values = parse_timestamps(_text(values))
+    # A date32 cast formats as YYYY-MM-DD an order of magnitude faster than strftime
+    return pc.fill_null(pc.cast(pc.cast(values, pa.date32()), pa.string()), 'N/A')
+
+
+def truncated_text(values: pa.Array, max_length: int = SUMMARY_MAX_LENGTH) -> pa.Array:
+    """Text truncated with an ellipsis, 'N/A' where missing"""
+    text = pc.fill_null(_text(values), 'N/A')
+    truncated = pc.binary_join_element_wise(pc.utf8_slice_codeunits(text, 0, max_length), '...', '')
+    return pc.if_else(pc.greater(pc.utf8_length(text), max_length), truncated, text)
+
+
+def assignee_names(values: pa.Array) -> pa.Array:
+    """Readable assignee names (waseyt.ibrahim@... -> Waseyt Ibrahim)"""
+    text = pc.fill_null(_text(values), 'Unassigned')
+    local_part = pc.list_element(pc.split_pattern(text, '@', max_splits=1), 0)
+    names = pc.utf8_title(pc.replace_substring(local_part, '.', ' '))
+    return pc.if_else(pc.match_substring(text, '@'), names, text)
+
+
+def issue_links(keys: pa.Array, jira_url: str) -> pa.Array:
+    """Browse URLs for issue keys, empty where the key is missing"""
+    return pc.fill_null(pc.binary_join_element_wise(f"{jira_url}/browse/", _text(keys), ''), '')
+
+
+def story_points(values: pa.Array) -> pa.Array:
+    """Numeric story points with missing values as 0"""
+    if not (pa.types.is_integer(values.type) or pa.types.is_floating(values.type)):
+        values = pa.array(pd.to_numeric(values.to_pandas(), errors='coerce'), from_pandas=True)
+    return pc.fill_null(values, 0)
+
+
+def format_date_column(values: pd.Series) -> pd.Series:
+    """Dates of a pandas column as YYYY-MM-DD strings, 'N/A' where missing"""
+    days = date_text(_arrow_column(values)).to_pandas()
+    days.index = values.index
+    return days
+
+
+# Transforms run on the source column's Arrow data
+TRANSFORMS = {
+    'value': lambda values, jira_url: values,
+    'date': lambda values, jira_url: date_text(values),
+    'truncate': lambda values, jira_url: truncated_text(values),
+    'assignee': lambda values, jira_url: assignee_names(values),
+    'link': issue_links,
+    'points': lambda values, jira_url: story_points(values)
+}
+
+# Weekly Activity issue details
+WEEKLY_ACTIVITY_COLUMNS: List[ColumnSpec] = [
+    ('Issue Key', 'key', 'value'),
+    ('Summary', 'summary', 'value'),
+    ('Description', 'description', 'value'),
+    ('Status', 'status', 'value'),
+    ('Type', 'issue_type', 'value'),
+    ('Assignee', 'assignee', 'value'),
+    ('Priority', 'priority', 'value'),
+    ('Updated', 'updated', 'date'),
+    ('Due Date', 'due_date', 'date'),
+    ('Est. Story Points', 'story_points', 'value'),
+    ('Act. Story Points', 'actual_story_points', 'value'),
+    ('JIRA Link', 'key', 'link')
+]
+
+# Priority Dashboard tables (source frames are already renamed by get_enhanced_priority_issues)
+PRIORITY_COLUMNS: List[ColumnSpec] = [
+    ('Priority', 'Priority', 'value'),
+    ('Issue Key', 'JIRA ID', 'value'),
+    ('JIRA ID', 'JIRA ID', 'link'),
+    ('Issue Type', 'Issue Type', 'value'),
+    ('Status', 'Status', 'value'),
+    ('Start Date', 'Start Date', 'value'),
+    ('Due Date', 'Due Date', 'value'),
+    ('Est. Story Points', 'Est. Story Points', 'value'),
+    ('Act. Story Points', 'Act. Story Points', 'value'),
+    ('Assigned To', 'Assigned To', 'value'),
+    ('Description', 'Description', 'value')
+]
+
+# Last Week Completed table without links (utils.create_completed_issues_table layout)
+COMPLETED_ISSUES_COLUMNS: List[ColumnSpec] = [
+    ('JIRA ID', 'key', 'value'),
+    ('Issue Type', 'issue_type', 'value'),
+    ('Summary', 'summary', 'truncate'),
+    ('Status', 'status', 'value'),
+    ('Assigned To', 'assignee', 'assignee'),
+    ('Completed Date', 'updated', 'date'),
+    ('Created Date', 'created', 'date'),
+    ('Est. Story Points', 'story_points', 'points'),
+    ('Act. Story Points', 'actual_story_points', 'points')
+]
+
+TABLE_VIEWS: Dict[str, List[ColumnSpec]] = {
+    'weekly_activity': WEEKLY_ACTIVITY_COLUMNS,
+    'priority': PRIORITY_COLUMNS,
+    'last_week_completed': [
+        ('Issue Key', 'key', 'value'),
+        ('JIRA ID', 'key', 'link')
+    ] + COMPLETED_ISSUES_COLUMNS[1:]
+}
+
+
+def build_table_view(df: pd.DataFrame, columns: List[ColumnSpec], jira_url: str = "",
+                     hidden: Iterable[str] = ()) -> pd.DataFrame:
+    """Build a display frame from column specs with Arrow compute; specs whose source column is missing are skipped"""
+    hidden = set(hidden)
+    sources: Dict[str, pa.Array] = {}
+    data = {}
+    for output, source, transform in columns:
+        if output in hidden or source not in df.columns:
+            continue
+        if source not in sources:
+            # Text columns of extracted frames already hold Arrow data, so this does not copy them
+            sources[source] = _arrow_column(df[source])
+        data[output] = TRANSFORMS[transform](sources[source], jira_url)
+    if not data:
+        return pd.DataFrame(index=pd.RangeIndex(len(df)))
+    table = pa.table(data)
+    display_df = table.to_pandas()
+    # Paging and search read the Arrow table the view was built as
+    _store(_arrow_cache, id(display_df), display_df, table)
+    return display_df
+
+
+def rows_in(df: pd.DataFrame, column: str, values: Iterable) -> pd.DataFrame:
+    """Rows of df whose column holds one of values, matched with Arrow compute"""
+    values = list(values)
+    if not values:
+        return df.iloc[:0]
+    matches = pc.is_in(_arrow_column(df[column]), value_set=pa.array(values))
+    return df[np.asarray(matches)]
+
+
+def data_version(df: pd.DataFrame) -> str:
+    """Hash identifying one version of a fetched frame"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    # Any edit to an issue bumps its updated timestamp, so key + updated identify the rows' content
+    version_source = df[VERSION_COLUMNS] if set(VERSION_COLUMNS).issubset(df.columns) else df
+    try:
+        digest.update(pd.util.hash_pandas_object(version_source, index=False).to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cell values (e.g. lists); fall back to the serialized frame
+        digest.update(df.to_csv(index=False).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def table_view(df: pd.DataFrame, view: str, jira_url: str = "", hidden: Iterable[str] = (),
+               version: Optional[str] = None) -> pd.DataFrame:
+    """Display frame for a named view, memoized per data version; treat the result as read-only"""
+    hidden = tuple(sorted(hidden))
+    key = f"{view}|{jira_url}|{hidden}|{version or data_version(df)}"
+    with _view_cache_lock:
+        cached = _view_cache.get(key)
+        if cached is not None:
+            _view_cache.move_to_end(key)
+            return cached
+
+    display_df = build_table_view(df, TABLE_VIEWS[view], jira_url, hidden)
+    with _view_cache_lock:
+        _view_cache[key] = display_df
+        while len(_view_cache) > TABLE_VIEW_CACHE_SIZE:
+            _view_cache.popitem(last=False)
+    return display_df
+
+
+def _cached(cache: OrderedDict, key, frame: pd.DataFrame):
+    with _order_cache_lock:
+        entry = cache.get(key)
+        if entry is not None and entry[0] is frame:
+            cache.move_to_end(key)
+            return entry[1]
+    return None
+
+
+def _store(cache: OrderedDict, key, frame: pd.DataFrame, value):
+    with _order_cache_lock:
+        cache[key] = (frame, value)
+        while len(cache) > TABLE_ORDER_CACHE_SIZE:
+            cache.popitem(last=False)
+    return value
+
+
+def _arrow_column(values: pd.Series) -> pa.Array:
+    try:
+        return pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed value types; display them as text
+        return pa.array(values.astype('string'), from_pandas=True)
+
+
+def arrow_table(display_df: pd.DataFrame) -> pa.Table:
+    """Display frame as an Arrow table, converted once per frame; pages are taken from it without pandas"""
+    table = _cached(_arrow_cache, id(display_df), display_df)
+    if table is None:
+        table = pa.table({column: _arrow_column(display_df[column]) for column in display_df.columns})
+        table = _store(_arrow_cache, id(display_df), display_df, table)
+    return table
+
+
+def search_text(display_df: pd.DataFrame) -> pa.ChunkedArray:
+    """Lower-cased text of all cells of each row, built once per display frame"""
+    text = _cached(_search_text_cache, id(display_df), display_df)
+    if text is None:
+        table = arrow_table(display_df)
+        columns = [pc.fill_null(pc.cast(column, pa.string()), '') for column in table.columns]
+        if columns:
+            text = pc.utf8_lower(pc.binary_join_element_wise(*columns, '\x1f'))
+        else:
+            text = pa.chunked_array([pa.array([''] * table.num_rows, pa.string())])
+        text = _store(_search_text_cache, id(display_df), display_df, text)
+    return text
+
+
+def row_order(display_df: pd.DataFrame, sort_by: Optional[str] = None, descending: bool = False,
+              search: str = "") -> np.ndarray:
+    """Positions of the rows matching a search (case-insensitive, any cell), in sort order; memoized"""
+    search = search.strip().lower()
+    key = (id(display_df), sort_by, descending, search)
+    positions = _cached(_order_cache, key, display_df)
+    if positions is not None:
+        return positions
+
+    positions = np.arange(len(display_df))
+    if search:
+        matches = pc.match_substring(search_text(display_df), search)
+        positions = positions[matches.to_numpy(zero_copy_only=False)]
+    if sort_by in display_df.columns:
+        values = arrow_table(display_df)[sort_by].take(positions)
+        if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+            # 'N/A' placeholders sort with the missing values, after everything else
+            values = pc.if_else(pc.equal(values, 'N/A'), pa.scalar(None, values.type), values)
+        # Arrow sorts are stable, so ties keep the view's default order
+        order = pc.array_sort_indices(values.combine_chunks(), order='descending' if descending else 'ascending',
+                                      null_placement='at_end')
+        positions = positions[order.to_numpy()]
+    return _store(_order_cache, key, display_df, positions)
+
+
+def table_page(display_df: pd.DataFrame, page: int = 1, page_size: int = TABLE_PAGE_SIZE,
+               sort_by: Optional[str] = None, descending: bool = False,
+               search: str = "") -> Tuple[pa.Table, int]:
+    """One page of a display frame after search and sort, as Arrow, and the number of matching rows"""
+    positions = row_order(display_df, sort_by, descending, search)
+    pages = max(1, -(-len(positions) // page_size))
+    start = (min(max(page, 1), pages) - 1) * page_size
+    return arrow_table(display_df).take(positions[start:start + page_size]), len(positions)
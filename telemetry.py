@@ -0,0 +1,294 @@
+"""
+Prometheus-format metrics for JIRA Daily Activity Dashboard
+Counters, gauges and histograms exposed as a text endpoint and/or a textfile for node_exporter
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple, Optional, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from cache hits up to slow paginated JIRA searches
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Sessions seen within this window count as active
+ACTIVE_SESSION_WINDOW_SECONDS = 300
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{_escape(extra[1])}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base class for labelled metrics"""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+
+    metric_type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, optionally computed at scrape time"""
+
+    metric_type = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 callback: Optional[Callable[[], float]] = None):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._callback = callback
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self) -> List[str]:
+        if self._callback is not None:
+            return [f"{self.name} {_format_value(self._callback())}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            # Per series: one count per bucket, then sum and total count
+            series = self._series.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        lines = []
+        for key, series in items:
+            for bound, count in zip(self.buckets, series):
+                labels = _format_labels(self.labelnames, key, ('le', _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(count)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(series[-1])}")
+        return lines
+
+
+class Registry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return '\n'.join(metric.render() for metric in self._metrics) + '\n'
+
+
+REGISTRY = Registry()
+
+_sessions_lock = threading.Lock()
+_session_last_seen: Dict[str, float] = {}
+
+
+def touch_session(session_id: str) -> None:
+    """Mark a browser session as active"""
+    with _sessions_lock:
+        _session_last_seen[session_id] = time.time()
+
+
+def active_session_count() -> int:
+    """Number of sessions seen within the active window; prunes stale entries"""
+    cutoff = time.time() - ACTIVE_SESSION_WINDOW_SECONDS
+    with _sessions_lock:
+        for session_id in [s for s, seen in _session_last_seen.items() if seen < cutoff]:
+            del _session_last_seen[session_id]
+        return len(_session_last_seen)
+
+
+QUERY_CALLS = REGISTRY.register(Counter(
+    'jira_dashboard_query_calls_total', 'JIRAClient query method calls.', ['query']))
+QUERY_DURATION = REGISTRY.register(Histogram(
+    'jira_dashboard_query_duration_seconds', 'JIRAClient query method latency, including cache lookups.', ['query']))
+CACHE_HITS = REGISTRY.register(Counter(
+    'jira_dashboard_cache_hits_total', 'Query calls answered from the result cache.', ['query']))
+CACHE_MISSES = REGISTRY.register(Counter(
+    'jira_dashboard_cache_misses_total', 'Query calls that executed against JIRA.', ['query']))
+QUERY_ROWS = REGISTRY.register(Counter(
+    'jira_dashboard_query_rows_total', 'Rows returned by JIRAClient query methods.', ['query']))
+RESPONSE_BYTES = REGISTRY.register(Counter(
+    'jira_dashboard_jira_response_bytes_total', 'JIRA REST response payload bytes.', ['query']))
+EXTRACTION_DURATION = REGISTRY.register(Histogram(
+    'jira_dashboard_extraction_duration_seconds', 'Time spent extracting issue fields into rows.'))
+RERUN_DURATION = REGISTRY.register(Histogram(
+    'jira_dashboard_rerun_duration_seconds', 'Streamlit script rerun duration.'))
+FRAGMENT_RERUN_DURATION = REGISTRY.register(Histogram(
+    'jira_dashboard_fragment_rerun_duration_seconds', 'Streamlit fragment rerun duration.'))
+FIRST_PAINT_DURATION = REGISTRY.register(Histogram(
+    'jira_dashboard_first_paint_seconds', 'Time from script start to the header and sidebar rendered.'))
+DATA_CACHE_BYTES = REGISTRY.register(Gauge(
+    'jira_dashboard_data_cache_bytes', 'Estimated memory held by the shared query result store.'))
+DATA_CACHE_ENTRIES = REGISTRY.register(Gauge(
+    'jira_dashboard_data_cache_entries', 'Query results held by the shared store.'))
+DATA_CACHE_EVICTIONS = REGISTRY.register(Counter(
+    'jira_dashboard_data_cache_evictions_total', 'Entries removed from the shared store, by reason.', ['reason']))
+DATA_CACHE_BACKEND_REQUESTS = REGISTRY.register(Counter(
+    'jira_dashboard_data_cache_backend_requests_total', 'Shared cache backend outcomes for local misses.', ['result']))
+ACTIVE_SESSIONS = REGISTRY.register(Gauge(
+    'jira_dashboard_active_sessions', f'Browser sessions active in the last {ACTIVE_SESSION_WINDOW_SECONDS} seconds.',
+    callback=active_session_count))
+
+
+def render_metrics() -> str:
+    """All metrics in the Prometheus text exposition format"""
+    return REGISTRY.render()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves /metrics"""
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = render_metrics().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+_exporter_lock = threading.Lock()
+_exporter_started = False
+
+
+def _write_textfile_forever(path: str, interval: float) -> None:
+    """Periodically write metrics to a file, atomically replacing it"""
+    while True:
+        try:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(render_metrics())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write metrics file {path}: {str(e)}")
+        time.sleep(interval)
+
+
+def ensure_exporter(port: Optional[int] = None, textfile_path: Optional[str] = None, interval: float = 15.0) -> None:
+    """Start the metrics endpoint and/or textfile writer once per process.
+
+    Reads METRICS_PORT (0 disables the endpoint) and METRICS_TEXTFILE when not given.
+    """
+    global _exporter_started
+    if _exporter_started:
+        return
+
+    with _exporter_lock:
+        if _exporter_started:
+            return
+        _exporter_started = True
+
+        if port is None:
+            port = int(os.getenv('METRICS_PORT', '9464'))
+        if textfile_path is None:
+            textfile_path = os.getenv('METRICS_TEXTFILE', '')
+
+        if port:
+            try:
+                server = ThreadingHTTPServer((os.getenv('METRICS_HOST', '127.0.0.1'), port), _MetricsHandler)
+                server.daemon_threads = True
+                threading.Thread(target=server.serve_forever, name='metrics-exporter', daemon=True).start()
+                logger.info(f"Serving Prometheus metrics on http://{server.server_address[0]}:{port}/metrics")
+            except OSError as e:
+                logger.warning(f"Metrics endpoint not started on port {port}: {str(e)}")
+
+        if textfile_path:
+            threading.Thread(
+                target=_write_textfile_forever,
+                args=(textfile_path, interval),
+                name='metrics-textfile',
+                daemon=True
+            ).start()
+            logger.info(f"Writing Prometheus metrics to {textfile_path} every {interval:.0f}s")
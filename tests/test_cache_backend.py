@@ -0,0 +1,171 @@
+import io
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("redis")
+
+import cache_backend
+from cache_backend import (
+    LocalRespServer, RedisCacheBackend, RespError, _encode_reply, _read_reply, deserialize, serialize
+)
+from rollup import RollupCube
+
+
+@pytest.fixture
+def server():
+    server = LocalRespServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def backend(server):
+    backend = RedisCacheBackend(server.url, namespace="test")
+    yield backend
+    backend.close()
+
+
+@pytest.mark.parametrize('value, expected', [
+    (True, "OK"), (None, None), (42, 42), (-2, -2), (b"payload\r\nwith crlf", b"payload\r\nwith crlf"),
+    ("PONG", b"PONG"), ([b"a", None, 3], [b"a", None, 3])
+])
+def test_reply_encoding_round_trip(value, expected):
+    assert _read_reply(io.BufferedReader(io.BytesIO(_encode_reply(value)))) == expected
+
+
+def test_error_reply_is_returned_as_resp_error():
+    reply = _read_reply(io.BufferedReader(io.BytesIO(_encode_reply(RespError("ERR boom")))))
+    assert isinstance(reply, RespError)
+    assert str(reply) == "ERR boom"
+
+
+def test_truncated_reply_raises_connection_error():
+    with pytest.raises(ConnectionError):
+        _read_reply(io.BufferedReader(io.BytesIO(b"$10\r\nshort\r\n")))
+
+
+def test_frame_round_trip_keeps_types():
+    df = pd.DataFrame({
+        'key': ['DATA-1', 'DATA-2'],
+        'updated': pd.to_datetime(['2024-01-05T10:11:12Z', None], utc=True),
+        'story_points': [3.0, None],
+        'sprints': [['Sprint 1', 'Sprint 2'], []]
+    })
+    restored = deserialize(serialize(df))
+    pd.testing.assert_frame_equal(restored, df)
+    assert isinstance(restored.loc[0, 'sprints'], list)
+
+
+def test_rollup_and_json_round_trip():
+    cells = pd.DataFrame({'status': ['Done'], 'issues': [3]})
+    restored = deserialize(serialize(RollupCube(cells)))
+    assert isinstance(restored, RollupCube)
+    pd.testing.assert_frame_equal(restored.cells, cells)
+    assert deserialize(serialize({'a': [1, 2]})) == {'a': [1, 2]}
+
+
+def test_unserializable_value_is_not_stored(backend):
+    assert serialize({1, 2}) is None
+    assert backend.set("test:set", {1, 2}, 10) is False
+
+
+def test_set_and_get_with_ttl(backend):
+    assert backend.set("test:frame", pd.DataFrame({'a': [1]}), ttl=30)
+    value, remaining = backend.get("test:frame")
+    assert value['a'].tolist() == [1]
+    assert 29 < remaining <= 30
+
+
+def test_entries_without_ttl_report_no_remaining_time(backend):
+    backend.set("test:json", [1, 2], ttl=None)
+    assert backend.get("test:json") == ([1, 2], None)
+
+
+def test_entries_expire_with_their_ttl(backend):
+    backend.set("test:short", [1], ttl=0.05)
+    time.sleep(0.1)
+    assert backend.get("test:short") is None
+
+
+def test_load_lock_is_exclusive_and_released_by_its_owner(backend):
+    token = backend.acquire_load_lock("test:key")
+    assert token is not None
+    assert backend.acquire_load_lock("test:key") is None
+    backend.release_load_lock("test:key", "someone-else")
+    assert backend.acquire_load_lock("test:key") is None
+    backend.release_load_lock("test:key", token)
+    assert backend.acquire_load_lock("test:key") is not None
+
+
+def test_expired_lock_taken_over_is_not_released_by_the_old_owner(backend, monkeypatch):
+    monkeypatch.setattr(cache_backend, 'LOAD_LOCK_SECONDS', 0.05)
+    stale = backend.acquire_load_lock("test:key")
+    time.sleep(0.1)
+    monkeypatch.setattr(cache_backend, 'LOAD_LOCK_SECONDS', 60.0)
+    current = backend.acquire_load_lock("test:key")
+    assert current is not None
+
+    backend.release_load_lock("test:key", stale)
+    assert backend.acquire_load_lock("test:key") is None
+
+
+def test_clear_starts_a_new_generation_for_every_replica(server, backend):
+    other = RedisCacheBackend(server.url, namespace="test")
+    name = backend.key_name(('query', ('days', 7)))
+    backend.clear()
+    other._generation_checked_at = 0.0
+    assert other.generation() == backend.generation() == 1
+    assert other.key_name(('query', ('days', 7))) != name
+
+
+def test_unreachable_backend_degrades_to_local_loading():
+    backend = RedisCacheBackend("redis://127.0.0.1:1/0", timeout=0.2)
+    assert backend.get("test:key") is None
+    assert not backend.available
+    # Every replica loads for itself while the backend is down
+    assert backend.acquire_load_lock("test:key") is not None
+
+
+def test_unsupported_url_is_rejected():
+    with pytest.raises(ValueError):
+        RedisCacheBackend("http://cache:6379/0")
+
+
+def test_replicas_share_results_through_the_backend(server):
+    from data_store import SharedDataStore
+
+    replicas = [SharedDataStore(backend=RedisCacheBackend(server.url, namespace="test")) for _ in range(2)]
+    calls = []
+    loader = lambda: calls.append(1) or pd.DataFrame({'key': ['DATA-1']})
+    first = replicas[0].get_or_load(('query', ('days', 7)), loader, ttl=30)
+    second = replicas[1].get_or_load(('query', ('days', 7)), loader, ttl=30)
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert replicas[1].stats()['backend_hits'] == 1
+
+
+def test_failed_query_is_not_published(server):
+    from data_store import QueryError, SharedDataStore, shared_query
+
+    replicas = [SharedDataStore(backend=RedisCacheBackend(server.url, namespace="test")) for _ in range(2)]
+    calls = []
+
+    def query(store):
+        @shared_query(ttl=30, store=store)
+        def activity(_self):
+            calls.append(1)
+            if len(calls) == 1:
+                raise QueryError("JIRA unavailable")
+            return pd.DataFrame({'key': ['DATA-1']})
+        return activity
+
+    assert query(replicas[0])(None).empty
+    # The other replica loads for itself instead of being served the failure
+    assert len(query(replicas[1])(None)) == 1
+    assert len(calls) == 2
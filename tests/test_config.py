@@ -0,0 +1,52 @@
+"""Tests for configuration snapshots and their reload"""
+import sys
+
+import pytest
+import streamlit
+
+import config
+
+
+@pytest.fixture
+def fresh_config(monkeypatch):
+    monkeypatch.setattr(config, 'CONFIG_WATCH_SECONDS', 0)
+    monkeypatch.setattr(config, '_config', None)
+    monkeypatch.setattr(config, '_pending_changes', [])
+    monkeypatch.setenv('JIRA_USERNAME', 'before@x.com')
+    monkeypatch.delitem(sys.modules, 'streamlit', raising=False)
+    return config.get_config()
+
+
+def test_snapshot_is_read_only_and_memoized(fresh_config):
+    with pytest.raises(TypeError):
+        fresh_config['jira']['JIRA_USERNAME'] = 'changed'
+    assert config.get_config() is fresh_config
+
+
+def test_changes_are_applied_by_the_next_access(fresh_config, monkeypatch):
+    monkeypatch.setenv('JIRA_USERNAME', 'after@x.com')
+    assert config.get_config()['jira']['JIRA_USERNAME'] == 'before@x.com'
+
+    config._pending_changes = [config.SECRETS_FILES[0]]
+
+    assert config.get_config()['jira']['JIRA_USERNAME'] == 'after@x.com'
+    assert config._pending_changes == []
+
+
+def test_streamlit_secrets_are_not_reloaded_outside_a_script_thread(fresh_config, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'streamlit', streamlit)
+    config._pending_changes = [config.SECRETS_FILES[0]]
+
+    assert config.get_config() is fresh_config
+    assert config._pending_changes == [config.SECRETS_FILES[0]]
+
+
+def test_failed_reload_keeps_the_previous_snapshot(fresh_config, monkeypatch):
+    def broken(changed=None):
+        raise ValueError("bad roster")
+
+    monkeypatch.setattr(config, 'reload_config', broken)
+    config._pending_changes = [config.SECRETS_FILES[0]]
+
+    assert config.get_config() is fresh_config
+    assert config._pending_changes == []
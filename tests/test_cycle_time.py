@@ -0,0 +1,124 @@
+"""Tests for changelog parsing and the cycle-time engine"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pandas as pd
+
+from cycle_time import CHANGELOG_BATCH_SIZE, CycleTimeEngine, parse_status_intervals
+
+
+def utc(day, hour=0):
+    return datetime(2024, 1, day, hour, tzinfo=timezone.utc)
+
+
+def issue(key, transitions=(), status='Done', created='2024-01-01T09:00:00.000+0000',
+          updated='2024-01-10T09:00:00.000+0000'):
+    """Fake JIRA issue; transitions are (created, from, to) status changes"""
+    histories = [
+        SimpleNamespace(created=at, items=[SimpleNamespace(field='status', fromString=old, toString=new)])
+        for at, old, new in transitions
+    ]
+    return SimpleNamespace(
+        key=key,
+        fields=SimpleNamespace(created=created, updated=updated, status=SimpleNamespace(name=status)),
+        changelog=SimpleNamespace(histories=histories)
+    )
+
+
+def frame(*rows):
+    return pd.DataFrame(
+        [{'key': key, 'status': status, 'updated': updated, 'issue_type': 'Story', 'assignee': 'Ana'}
+         for key, status, updated in rows]
+    )
+
+
+class FakeJira:
+    """Records changelog searches and answers them from a dict of issues"""
+
+    def __init__(self, issues):
+        self.issues = {item.key: item for item in issues}
+        self.queries = []
+
+    def search_issues(self, jql, maxResults=None, fields=None, expand=None):
+        keys = jql[len("key in ("):-1].split(', ')
+        self.queries.append(keys)
+        return [self.issues[key] for key in keys if key in self.issues]
+
+
+def test_parse_status_intervals_follows_transitions():
+    parsed = parse_status_intervals(issue('A-1', [
+        ('2024-01-03T09:00:00.000+0000', 'To Do', 'In Progress'),
+        ('2024-01-05T09:00:00.000+0000', 'In Progress', 'Done'),
+    ]))
+
+    assert parsed == [
+        ('A-1', 'To Do', utc(1, 9), utc(3, 9)),
+        ('A-1', 'In Progress', utc(3, 9), utc(5, 9)),
+        ('A-1', 'Done', utc(5, 9), None),
+    ]
+
+
+def test_parse_status_intervals_sorts_histories_and_converts_offsets():
+    parsed = parse_status_intervals(issue('A-1', [
+        ('2024-01-05T04:00:00.000-0500', 'In Progress', 'Done'),
+        ('2024-01-03T09:00:00.000+0000', 'To Do', 'In Progress'),
+    ]))
+
+    assert [(status, entered) for _, status, entered, _ in parsed] == [
+        ('To Do', utc(1, 9)), ('In Progress', utc(3, 9)), ('Done', utc(5, 9))
+    ]
+
+
+def test_parse_status_intervals_ignores_other_fields():
+    item = issue('A-1', [('2024-01-03T09:00:00.000+0000', 'To Do', 'In Progress')])
+    item.changelog.histories[0].items.insert(0, SimpleNamespace(field='assignee', fromString='Bo', toString='Ana'))
+
+    assert [status for _, status, _, _ in parse_status_intervals(item)] == ['To Do', 'In Progress']
+
+
+def test_parse_status_intervals_without_changelog_uses_current_status():
+    item = issue('A-1', status='To Do')
+    item.changelog = None
+
+    assert parse_status_intervals(item) == [('A-1', 'To Do', utc(1, 9), None)]
+
+
+def test_cycle_time_runs_from_first_start_to_last_done():
+    engine = CycleTimeEngine()
+    engine.ingest([issue('A-1', [
+        ('2024-01-02T00:00:00.000+0000', 'To Do', 'In Progress'),
+        ('2024-01-04T00:00:00.000+0000', 'In Progress', 'Done'),
+        ('2024-01-05T00:00:00.000+0000', 'Done', 'In Progress'),
+        ('2024-01-08T00:00:00.000+0000', 'In Progress', 'Done'),
+    ])])
+
+    cycles = engine.cycle_times(frame(('A-1', 'Done', '2024-01-10T09:00:00.000+0000')))
+
+    assert cycles['key'].tolist() == ['A-1']
+    assert cycles['cycle_days'].tolist() == [6.0]
+
+
+def test_refresh_fetches_changelogs_of_finished_issues_only():
+    done = [issue(f"A-{number}") for number in range(CHANGELOG_BATCH_SIZE + 1)]
+    jira = FakeJira(done + [issue('B-1', status='In Progress')])
+    df = frame(*[(item.key, 'Done', item.fields.updated) for item in done],
+               ('B-1', 'In Progress', '2024-01-10T09:00:00.000+0000'))
+    engine = CycleTimeEngine()
+
+    assert engine.refresh(jira, df) == CHANGELOG_BATCH_SIZE + 1
+    assert [len(batch) for batch in jira.queries] == [CHANGELOG_BATCH_SIZE, 1]
+    assert 'B-1' not in {key for batch in jira.queries for key in batch}
+
+
+def test_refresh_only_refetches_updated_issues():
+    jira = FakeJira([issue('A-1'), issue('A-2')])
+    df = frame(('A-1', 'Done', '2024-01-10T09:00:00.000+0000'), ('A-2', 'Done', '2024-01-10T09:00:00.000+0000'))
+    engine = CycleTimeEngine()
+    engine.refresh(jira, df)
+
+    jira.issues['A-2'] = issue('A-2', updated='2024-01-11T09:00:00.000+0000')
+    df.loc[df['key'] == 'A-2', 'updated'] = '2024-01-11T09:00:00.000+0000'
+
+    assert engine.refresh(jira, df) == 1
+    assert jira.queries[-1] == ['A-2']
+    assert engine.refresh(jira, df) == 0
@@ -0,0 +1,188 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from data_store import QueryError, SharedDataStore, estimate_size, raise_query_errors, shared_query
+
+
+def frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({'key': [f"DATA-{i}" for i in range(rows)], 'points': range(rows)})
+
+
+def test_lru_evicts_least_recently_used():
+    size = estimate_size(frame(100))
+    store = SharedDataStore(max_bytes=size * 2 + size // 2)
+    store.get_or_load('a', lambda: frame(100))
+    store.get_or_load('b', lambda: frame(100))
+    store.get_or_load('a', lambda: pytest.fail("a should be cached"))
+    store.get_or_load('c', lambda: frame(100))
+
+    keys = list(store._entries)
+    assert keys == ['a', 'c']
+    assert store.stats()['evictions'] == 1
+
+
+def test_lfu_evicts_least_frequently_used():
+    size = estimate_size(frame(100))
+    store = SharedDataStore(max_bytes=size * 2 + size // 2, policy='lfu')
+    store.get_or_load('a', lambda: frame(100))
+    store.get_or_load('b', lambda: frame(100))
+    for _ in range(3):
+        store.get_or_load('a', lambda: frame(100))
+    store.get_or_load('b', lambda: frame(100))
+    store.get_or_load('c', lambda: frame(100))
+
+    # b is more recent than a but was hit less often
+    assert set(store._entries) == {'a', 'c'}
+
+
+def test_byte_budget_is_respected():
+    size = estimate_size(frame(100))
+    store = SharedDataStore(max_bytes=size * 3)
+    for key in range(10):
+        store.get_or_load(key, lambda: frame(100))
+    assert store.total_bytes <= store.max_bytes
+    assert len(store) == 3
+
+    store.configure(max_bytes=size)
+    assert len(store) == 1
+    assert store.total_bytes == sum(entry.size for entry in store._entries.values())
+
+
+def test_result_larger_than_budget_is_served_but_not_stored():
+    store = SharedDataStore(max_bytes=100)
+    result = store.get_or_load('big', lambda: frame(1000))
+    assert len(result) == 1000
+    assert len(store) == 0
+    assert store.stats()['rejected'] == 1
+
+
+def test_expired_entries_are_reloaded():
+    store = SharedDataStore()
+    calls = []
+    store.get_or_load('a', lambda: calls.append(1) or frame(1), ttl=0.01)
+    time.sleep(0.02)
+    store.get_or_load('a', lambda: calls.append(1) or frame(1), ttl=0.01)
+    assert len(calls) == 2
+
+
+def test_shared_views_do_not_modify_the_store():
+    store = SharedDataStore()
+    view = store.get_or_load('a', lambda: frame(3))
+    view.loc[0, 'points'] = 100
+    assert store.get_or_load('a', lambda: frame(3)).loc[0, 'points'] == 0
+
+
+def test_concurrent_callers_load_once():
+    store = SharedDataStore()
+    calls = []
+    started = threading.Event()
+
+    def loader():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return frame(10)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(store.get_or_load('a', loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert not store._key_locks
+
+
+def test_clear_during_load_keeps_single_flight():
+    store = SharedDataStore()
+    calls = []
+    release = threading.Event()
+    loading = threading.Event()
+
+    def slow_loader():
+        calls.append('slow')
+        loading.set()
+        release.wait(5)
+        return frame(10)
+
+    first = threading.Thread(target=lambda: store.get_or_load('a', slow_loader))
+    first.start()
+    loading.wait(5)
+    store.clear()
+    # Arrives after the clear, while the first load is still running: it must wait for it
+    second = threading.Thread(target=lambda: store.get_or_load('a', lambda: calls.append('second') or frame(10)))
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join()
+    second.join()
+
+    assert calls == ['slow']
+    assert not store._key_locks
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        SharedDataStore(policy='fifo')
+
+
+def failing_client(store: SharedDataStore, calls: list):
+    class Client:
+        @shared_query(store=store)
+        def activity(_self, days_back: int = 7) -> pd.DataFrame:
+            calls.append(days_back)
+            if len(calls) == 1:
+                raise QueryError("JIRA unavailable")
+            return frame(days_back)
+
+        @shared_query(store=store, fallback=lambda: 'empty')
+        def summary(_self, days_back: int = 7):
+            return len(_self.activity(days_back))
+
+    return Client()
+
+
+def test_failed_query_is_not_stored():
+    store = SharedDataStore()
+    calls = []
+    client = failing_client(store, calls)
+
+    assert client.activity(3).empty
+    assert not store._entries
+    assert len(client.activity(3)) == 3
+    assert calls == [3, 3]
+
+
+def test_failure_inside_another_query_is_not_stored_by_either():
+    store = SharedDataStore()
+    calls = []
+    client = failing_client(store, calls)
+
+    assert client.summary(3) == 'empty'
+    assert not store._entries
+    assert client.summary(3) == 3
+
+
+def test_partial_result_is_served_without_being_stored():
+    store = SharedDataStore()
+
+    @shared_query(store=store)
+    def cycle_times(_self):
+        raise QueryError("Changelogs unavailable", frame(2))
+
+    assert len(cycle_times(None)) == 2
+    assert not store._entries
+
+
+def test_raise_query_errors_propagates_failures():
+    store = SharedDataStore()
+    client = failing_client(store, [])
+
+    with raise_query_errors(), pytest.raises(QueryError):
+        client.activity(3)
+    assert not store._entries
@@ -0,0 +1,42 @@
+"""Tests for report exports and their download"""
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+import exporters
+
+
+def sheets(rows=3):
+    return {
+        "Team Activity": pd.DataFrame({'key': [f"A-{n}" for n in range(rows)], 'status': 'Done', 'story_points': 1.0}),
+        "Completed": pd.DataFrame({'key': ['B-1'], 'status': ['Closed'], 'story_points': [2.0]}),
+    }
+
+
+def download_bytes(build) -> bytes:
+    """Bytes st.download_button sends for a deferred data callable"""
+    data, _ = convert_data_to_bytes_and_infer_mime(build(), ValueError("unsupported download data"))
+    return data
+
+
+@pytest.mark.parametrize('fmt', exporters.available_formats())
+def test_report_downloads_in_every_format(fmt):
+    data = download_bytes(lambda: exporters.export_report(sheets(), fmt))
+
+    assert data
+    if fmt in exporters.SINGLE_SHEET_FORMATS:
+        assert sorted(zipfile.ZipFile(io.BytesIO(data)).namelist()) == sorted(
+            f"{name}.{exporters.EXPORT_FORMATS[fmt]['extension']}" for name in ["Team Activity", "Completed"]
+        )
+
+
+def test_report_spilled_to_disk_still_downloads(monkeypatch):
+    monkeypatch.setattr(exporters, 'EXPORT_SPOOL_BYTES', 1024)
+
+    data = download_bytes(lambda: exporters.export_report({"Team Activity": sheets(5000)["Team Activity"]}, 'csv'))
+
+    df = pd.read_csv(io.BytesIO(data))
+    assert len(df) == 5000 and df['key'].iloc[-1] == "A-4999"
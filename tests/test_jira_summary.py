@@ -0,0 +1,48 @@
+"""Tests for the headless report CLI"""
+from argparse import Namespace
+
+import pandas as pd
+
+import jira_summary
+from data_store import QueryError, SharedDataStore, shared_query
+from jira_summary import build_sheets
+
+store = SharedDataStore()
+
+
+class FakeClient:
+    """Client whose team activity query fails the way JIRAClient does: the dashboard gets an empty frame"""
+
+    @shared_query(store=store)
+    def get_team_weekly_activity(_self, days_back, members):
+        raise QueryError("Error fetching team weekly activity: 401 Unauthorized")
+
+    def get_last_week_completed(self, members):
+        return pd.DataFrame({'key': ['A-1']})
+
+    def get_enhanced_priority_issues(self, priority_type, members):
+        return pd.DataFrame()
+
+
+def test_views_whose_query_failed_are_failed():
+    assert FakeClient().get_team_weekly_activity(7, ['Ana']).empty
+    sheets, failed = build_sheets(FakeClient(), ['weekly', 'completed', 'current'], 7, ['Ana'])
+
+    assert failed == ['weekly']
+    assert list(sheets) == ["Last Week Completed", "Current Priorities"]
+    assert not len(store)
+
+
+def test_failed_view_exits_non_zero_and_keeps_the_previous_report(tmp_path, monkeypatch):
+    import config
+    import jira_client
+
+    out = tmp_path / 'weekly.csv'
+    out.write_text("previous report", encoding='utf-8')
+    monkeypatch.setattr(jira_client, 'JIRAClient', FakeClient)
+    monkeypatch.setattr(jira_summary, 'select_members', lambda roster, members, teams: ['Ana'])
+    monkeypatch.setattr(config, 'get_config', lambda: {'teams': None})
+    args = Namespace(view=['weekly'], days=7, member=[], team=[], out=str(out), format=None)
+
+    assert jira_summary.run_report(args) == 1
+    assert out.read_text(encoding='utf-8') == "previous report"
@@ -0,0 +1,57 @@
+"""Tests for roster loading and member names"""
+import json
+
+import pytest
+
+from roster import DEFAULT_TEAM, TeamRoster, load_roster, load_roster_file, make_team
+
+
+def test_members_of_several_teams_keep_roster_order():
+    roster = TeamRoster({
+        'Data': make_team({'Ana': 'ana@x.com', 'Bo': 'bo@x.com'}),
+        'Ops': make_team({'Bo': 'bo@x.com', 'Cy': 'cy@x.com'}),
+    })
+
+    assert roster.members_of(['Ops', 'Data']) == ['Bo', 'Cy', 'Ana']
+    assert roster.members == {'Ana': 'ana@x.com', 'Bo': 'bo@x.com', 'Cy': 'cy@x.com'}
+
+
+def test_same_name_for_two_people_is_rejected():
+    with pytest.raises(ValueError, match='Alex'):
+        TeamRoster({
+            'Data': make_team({'Alex': 'alex.a@x.com'}),
+            'Ops': make_team({'Alex': 'alex.b@x.com'}),
+        })
+
+
+def test_csv_with_same_name_for_two_people_is_rejected(tmp_path):
+    path = tmp_path / 'roster.csv'
+    path.write_text("name,email,team\nAlex,alex.a@x.com,Data\nAlex,alex.b@x.com,Data\n", encoding='utf-8')
+
+    with pytest.raises(ValueError, match='Alex'):
+        load_roster_file(str(path))
+
+
+def test_roster_file_with_collision_falls_back_to_default_team(tmp_path):
+    path = tmp_path / 'roster.json'
+    path.write_text(json.dumps({'teams': {
+        'Data': {'members': {'Alex': 'alex.a@x.com'}},
+        'Ops': {'members': {'Alex': 'alex.b@x.com'}},
+    }}), encoding='utf-8')
+
+    roster = load_roster({'Ana': 'ana@x.com'}, path=str(path), group='')
+
+    assert roster.team_names() == [DEFAULT_TEAM]
+    assert roster.members == {'Ana': 'ana@x.com'}
+
+
+def test_group_members_with_taken_names_are_qualified():
+    roster = TeamRoster({
+        'Data': make_team({'Alex': 'alex.a@x.com'}),
+        'Ops': make_team({}, 'ops-team'),
+    })
+    roster.resolve_groups(lambda group: {'Alex': 'alex.b@x.com', 'Ana': 'ana@x.com'})
+
+    assert roster.members_of(['Ops']) == ['Alex (alex.b@x.com)', 'Ana']
+    assert roster.members['Alex'] == 'alex.a@x.com'
+    assert roster.members['Alex (alex.b@x.com)'] == 'alex.b@x.com'
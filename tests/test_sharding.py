@@ -0,0 +1,139 @@
+"""Tests for updated-time sharded search"""
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from sharding import MIN_SLICE_MINUTES, PAGE_SIZE, sharded_search, slice_clause, split_shard
+
+
+class Page(list):
+    """Search result page with the total of the whole search, like jira's ResultList"""
+
+    def __init__(self, issues, total):
+        super().__init__(issues)
+        self.total = total
+
+
+def issue(key, minutes_ago, version=1):
+    """Fake issue updated minutes_ago before 2024-01-31 00:00 UTC"""
+    day, minute = divmod(30 * 24 * 60 - minutes_ago, 24 * 60)
+    updated = f"2024-01-{day + 1:02d}T{minute // 60:02d}:{minute % 60:02d}:00.{version:03d}+0000"
+    return SimpleNamespace(key=key, minutes_ago=minutes_ago, fields=SimpleNamespace(updated=updated))
+
+
+class FakeSearch:
+    """Answers slice searches from issues by their minute offset, at most page_limit per page"""
+
+    def __init__(self, issues, page_limit=PAGE_SIZE):
+        self.issues = issues
+        self.page_limit = page_limit
+        self.calls = []
+
+    def matching(self, jql):
+        newer_than = int(jql.split("updated >= -")[1].split("m")[0])
+        older_than = int(jql.split("updated < -")[1].split("m")[0]) if "updated < -" in jql else 0
+        hits = [item for item in self.issues if older_than <= item.minutes_ago <= newer_than]
+        return sorted(hits, key=lambda item: item.minutes_ago)
+
+    def __call__(self, jql, start_at, max_results):
+        self.calls.append((jql, start_at, max_results))
+        hits = self.matching(jql)
+        size = min(max_results or len(hits), self.page_limit)
+        return Page(hits[start_at:start_at + size], len(hits))
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def test_split_shard_covers_the_slice_newest_first():
+    assert split_shard(("q", 3000, None), 3) == [("q", 1000, None), ("q", 2000, 1000), ("q", 3000, 2000)]
+    assert split_shard(("q", 3000, 1000), 2) == [("q", 2000, 1000), ("q", 3000, 2000)]
+
+
+def test_split_shard_parts_meet_without_gaps():
+    parts = split_shard(("q", 10007, 13), 7)
+    assert parts[0][2] == 13 and parts[-1][1] == 10007
+    assert all(newer[2] == older[1] for newer, older in zip(parts[1:], parts))
+
+
+def test_slice_clause_overlaps_the_newer_neighbour():
+    assert slice_clause(120, None) == "updated >= -120m"
+    assert slice_clause(120, 60) == "updated >= -120m AND updated < -59m"
+
+
+def test_small_window_is_one_probe(executor):
+    search = FakeSearch([issue(f"A-{n}", n * 10) for n in range(1, 21)])
+
+    issues = sharded_search(search, ["assignee = a ORDER BY updated DESC"], 1, executor)
+
+    assert len(search.calls) == 1
+    assert [item.key for item in issues] == [f"A-{n}" for n in range(1, 21)]
+
+
+def test_slice_over_the_limit_is_split_and_merged_newest_first(executor):
+    search = FakeSearch([issue(f"A-{n}", n * 5) for n in range(1, 1001)])
+
+    issues = sharded_search(search, ["q ORDER BY updated DESC"], 7, executor, max_slice_results=200)
+
+    assert [item.key for item in issues] == [f"A-{n}" for n in range(1, 1001)]
+    assert all(start_at < 200 for _, start_at, _ in search.calls)
+    assert len({jql for jql, _, _ in search.calls}) > 1
+
+
+def test_slice_is_paged_by_what_the_server_returns(executor):
+    search = FakeSearch([issue(f"A-{n}", n) for n in range(1, 131)], page_limit=50)
+
+    issues = sharded_search(search, ["q ORDER BY updated DESC"], 1, executor, max_slice_results=500)
+
+    assert sorted(start_at for _, start_at, _ in search.calls) == [0, 50, 100]
+    assert len(issues) == 130
+
+
+def test_narrow_slice_is_paged_instead_of_split(executor):
+    search = FakeSearch([issue(f"A-{n}", 1) for n in range(300)])
+
+    issues = sharded_search(search, ["q ORDER BY updated DESC"], 1, executor, max_slice_results=100)
+
+    widths = {jql for jql, _, _ in search.calls}
+    assert all(f"-{MIN_SLICE_MINUTES // 2}m" not in jql for jql in widths)
+    assert len(issues) == 300
+
+
+def test_issues_in_overlapping_slices_and_searches_are_deduplicated(executor):
+    shared = [issue(f"A-{n}", n * 30) for n in range(1, 200)]
+    search = FakeSearch(shared)
+
+    issues = sharded_search(search, ["q1 ORDER BY updated DESC", "q2 ORDER BY updated DESC"], 5, executor,
+                            max_slice_results=50)
+
+    assert [item.key for item in issues] == [item.key for item in shared]
+
+
+def test_count_sizes_slices_and_fetches_them_whole(executor):
+    search = FakeSearch([issue(f"A-{n}", n * 5) for n in range(1, 301)], page_limit=10 ** 6)
+    counts = []
+
+    def count(jql):
+        counts.append(jql)
+        return len(search.matching(jql))
+
+    issues = sharded_search(search, ["q ORDER BY updated DESC"], 2, executor, count=count, max_slice_results=100)
+
+    assert len(counts) > 1
+    assert all(start_at == 0 and max_results == 0 for _, start_at, max_results in search.calls)
+    assert [item.key for item in issues] == [f"A-{n}" for n in range(1, 301)]
+
+
+def test_newest_version_of_a_duplicate_is_kept(executor):
+    old, new = issue("A-1", 10, version=1), issue("A-1", 10, version=2)
+
+    def search(jql, start_at, max_results):
+        return Page([new if jql.startswith("(q2)") else old], 1)
+
+    issues = sharded_search(search, ["q1 ORDER BY updated DESC", "q2 ORDER BY updated DESC"], 1, executor)
+
+    assert issues == [new]
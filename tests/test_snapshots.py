@@ -0,0 +1,58 @@
+from datetime import date
+
+import pandas as pd
+
+from snapshots import (
+    MAX_RESOLVED_BACKFILL_DAYS, resolved_since, snapshot_days, weekly_throughput, wip_trend, write_snapshot
+)
+
+
+def issues(statuses, resolved=None):
+    return pd.DataFrame({
+        'key': [f"DATA-{i}" for i in range(len(statuses))],
+        'status': statuses,
+        'issue_type': 'Task',
+        'assignee': 'waseyt.ibrahim@spreetail.com',
+        'priority': 'Medium',
+        'story_points': 1.0,
+        'actual_story_points': 0.0,
+        'resolution_date': resolved or [None] * len(statuses)
+    })
+
+
+def test_resolved_since_starts_at_the_last_snapshot_day(tmp_path):
+    for day in (date(2024, 3, 1), date(2024, 3, 4)):
+        write_snapshot(issues(["In Progress"]), day, str(tmp_path))
+    assert resolved_since(str(tmp_path), today=date(2024, 3, 8)) == date(2024, 3, 4)
+    # Today's own snapshot (being replaced with --force) is not the previous one
+    write_snapshot(issues(["In Progress"]), date(2024, 3, 8), str(tmp_path))
+    assert resolved_since(str(tmp_path), today=date(2024, 3, 8)) == date(2024, 3, 4)
+
+
+def test_resolved_since_defaults_to_yesterday_and_caps_the_backfill(tmp_path):
+    assert resolved_since(str(tmp_path), today=date(2024, 3, 8)) == date(2024, 3, 7)
+    write_snapshot(issues(["In Progress"]), date(2020, 1, 1), str(tmp_path))
+    today = date(2024, 3, 8)
+    assert (today - resolved_since(str(tmp_path), today=today)).days == MAX_RESOLVED_BACKFILL_DAYS
+
+
+def test_existing_snapshot_is_not_overwritten(tmp_path):
+    day = date(2024, 3, 1)
+    assert write_snapshot(issues(["In Progress"]), day, str(tmp_path))
+    assert write_snapshot(issues(["Done"]), day, str(tmp_path)) is None
+    assert snapshot_days(str(tmp_path)) == [day]
+
+
+def test_trends_count_each_resolution_once():
+    from snapshots import build_snapshot
+
+    resolved = ['2024-03-05T10:00:00Z', None, None]
+    history = pd.concat([
+        build_snapshot(issues(["Done", "In Progress", "Blocked"], resolved), date(2024, 3, 5)),
+        build_snapshot(issues(["Done", "In Progress", "Blocked"], resolved), date(2024, 3, 6))
+    ], ignore_index=True)
+
+    assert weekly_throughput(history).tolist() == [1]
+    wip = wip_trend(history)
+    assert wip.loc[(pd.Timestamp(2024, 3, 6), "In Progress")] == 1
+    assert wip.loc[(pd.Timestamp(2024, 3, 6), "Blocked")] == 1
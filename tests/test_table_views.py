@@ -0,0 +1,108 @@
+"""Tests for Arrow extraction, display columns, row filters and table paging"""
+import pandas as pd
+import pyarrow as pa
+
+from extraction import issue_schema, parse_timestamps, records_to_dataframe, records_to_table
+from table_views import (
+    COMPLETED_ISSUES_COLUMNS, WEEKLY_ACTIVITY_COLUMNS, arrow_table, build_table_view, rows_in, table_page
+)
+
+
+def record(key, **fields):
+    row = {
+        'key': key, 'summary': f"Summary of {key}", 'status': 'To Do', 'issue_type': 'Task',
+        'assignee': 'ana.lopez@x.com', 'created': '2024-01-05T10:11:12.123+0000',
+        'updated': '2024-01-06T10:11:12.123+0000', 'due_date': None, 'story_points': 0,
+        'impact_custom': None, 'actual_story_points': None
+    }
+    row.update(fields)
+    return row
+
+
+def test_arrow_parses_jira_timestamps_and_dates():
+    parsed = parse_timestamps(pa.chunked_array([['2024-01-05T10:11:12.123+0000', '2024-01-05T23:30:00.000-0500', None]]))
+    assert parsed.to_pylist() == [
+        pd.Timestamp('2024-01-05 10:11:12.123', tz='UTC'), pd.Timestamp('2024-01-06 04:30', tz='UTC'), None
+    ]
+
+    dates = parse_timestamps(pa.chunked_array([['2024-01-05', None]]))
+    assert dates.to_pylist() == [pd.Timestamp('2024-01-05', tz='UTC'), None]
+
+
+def test_malformed_dates_become_null():
+    parsed = parse_timestamps(pa.chunked_array([['2024-01-05', 'soon']]))
+    assert parsed.to_pylist() == [pd.Timestamp('2024-01-05', tz='UTC'), None]
+
+
+def test_records_to_dataframe_matches_pandas_construction():
+    records = [record('A-1', due_date='2024-02-01', story_points=3), record('A-2', impact_custom='High')]
+
+    df = records_to_dataframe(records)
+
+    expected = pd.DataFrame(records)
+    for col in ['created', 'updated', 'due_date']:
+        expected[col] = pd.to_datetime(expected[col], utc=True)
+    pd.testing.assert_frame_equal(df.drop(columns='impact_custom'), expected.drop(columns='impact_custom'),
+                                  check_dtype=False)
+    assert str(df['updated'].dtype) == 'datetime64[us, UTC]'
+    # Custom fields stay object columns with None, as process extraction returns them
+    assert df['impact_custom'].tolist() == [None, 'High']
+
+
+def test_mixed_value_types_become_text():
+    table = records_to_table([record('A-1', impact_custom=3), record('A-2', impact_custom='High', story_points='x')])
+    assert table['impact_custom'].to_pylist() == ['3', 'High']
+    assert table['story_points'].to_pylist() == ['0', 'x']
+
+
+def test_schema_is_applied():
+    full = {name: None for name in issue_schema().names}
+    table = records_to_table([dict(full, **record('A-1'))], issue_schema())
+    assert table.schema == issue_schema()
+
+
+def test_display_columns_are_computed_with_arrow():
+    df = records_to_dataframe([
+        record('A-1', summary='x' * 100, assignee='ana.lopez@x.com', story_points=None),
+        record('A-2', summary=None, assignee='Bo', updated='2024-01-06T23:30:00.000-0500', story_points=2.5),
+    ])
+
+    view = build_table_view(df, COMPLETED_ISSUES_COLUMNS)
+
+    assert view['Summary'].tolist() == ['x' * 80 + '...', 'N/A']
+    assert view['Assigned To'].tolist() == ['Ana Lopez', 'Bo']
+    assert view['Completed Date'].tolist() == ['2024-01-06', '2024-01-07']
+    assert view['Est. Story Points'].tolist() == [0.0, 2.5]
+
+
+def test_links_hidden_columns_and_missing_dates():
+    df = records_to_dataframe([record('A-1'), record('A-2')])
+
+    view = build_table_view(df, WEEKLY_ACTIVITY_COLUMNS, "https://jira", hidden=["Description"])
+
+    assert view['JIRA Link'].tolist() == ["https://jira/browse/A-1", "https://jira/browse/A-2"]
+    assert view['Due Date'].tolist() == ['N/A', 'N/A']
+    assert 'Description' not in view.columns
+
+
+def test_display_frame_keeps_the_arrow_table_it_was_built_as():
+    view = build_table_view(records_to_dataframe([record('A-1')]), COMPLETED_ISSUES_COLUMNS)
+    assert arrow_table(view) is arrow_table(view)
+    assert arrow_table(view).column_names == list(view.columns)
+
+
+def test_rows_in_keeps_matching_rows_in_order():
+    df = records_to_dataframe([record('A-1', status='Done'), record('A-2'), record('A-3', status='Closed')])
+
+    assert rows_in(df, 'status', ['Closed', 'Done'])['key'].tolist() == ['A-1', 'A-3']
+    assert rows_in(df, 'status', []).empty
+
+
+def test_table_page_searches_sorts_and_pages():
+    df = records_to_dataframe([record(f"A-{n}", summary=f"{'bug' if n % 2 else 'story'} {n}") for n in range(1, 8)])
+    view = build_table_view(df, COMPLETED_ISSUES_COLUMNS)
+
+    page, total = table_page(view, page=2, page_size=2, sort_by='JIRA ID', descending=True, search='BUG')
+
+    assert total == 4
+    assert page['JIRA ID'].to_pylist() == ['A-3', 'A-1']
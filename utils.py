@@ -1,17 +1,29 @@
 """
 Utility functions for JIRA Daily Activity Dashboard
 """
+from __future__ import annotations
+
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import streamlit as st
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TYPE_CHECKING, get_args, get_origin
+from collections import OrderedDict
+from functools import lru_cache
+import collections.abc
+import hashlib
+import io
+import json
+import threading
 from config import get_config
+from rollup import COMPLETED_STATUSES, PROGRESS_STATUSES, BLOCKED_STATUSES, STATUS_FILTER_GROUPS
+import exporters
+from table_views import COMPLETED_ISSUES_COLUMNS, TABLE_PAGE_SIZE, arrow_table, build_table_view, format_date_column, row_order, rows_in
 import logging
 
-config = get_config()
+if TYPE_CHECKING:
+    # Charts import plotly when first built, so it does not delay the first paint
+    import plotly.graph_objects as go
+
 logger = logging.getLogger(__name__)
 
 def format_date(date_value, format_type: str = "date") -> str:
@@ -54,11 +66,11 @@ def format_date(date_value, format_type: str = "date") -> str:
 
 def get_status_color(status: str) -> str:
     """Get color for status"""
-    return config['colors'].get(status, "#6c757d")
+    return get_config()['colors'].get(status, "#6c757d")
 
 def get_issue_type_icon(issue_type: str) -> str:
     """Get icon for issue type"""
-    return config['icons'].get(issue_type, "📄")
+    return get_config()['icons'].get(issue_type, "📄")
 
 def create_status_badge(status: str) -> str:
     """Create HTML badge for status"""
@@ -106,28 +118,79 @@ def filter_dataframe_by_status(df: pd.DataFrame, status_filter: str = "All") ->
     
     if status_filter == "All":
         return df
-    elif status_filter == "Completed":
-        completed_statuses = ["Done", "Closed", "Resolved"]
-        return df[df['status'].isin(completed_statuses)]
-    elif status_filter == "In Progress":
-        progress_statuses = ["In Progress", "In Review", "Testing"]
-        return df[df['status'].isin(progress_statuses)]
-    elif status_filter == "Blocked":
-        return df[df['status'] == "Blocked"]
-    else:
-        return df[df['status'] == status_filter]
+    return rows_in(df, 'status', STATUS_FILTER_GROUPS.get(status_filter, [status_filter]))
 
-def create_status_distribution_chart(df: pd.DataFrame) -> go.Figure:
-    """Create status distribution pie chart"""
-    if df.empty:
+# Number of built figures kept as JSON, keyed by chart kind and aggregate hash
+CHART_CACHE_SIZE = 64
+
+_chart_cache: "OrderedDict[str, str]" = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+def aggregate_fingerprint(kind: str, aggregate: pd.Series, *extra: Any) -> str:
+    """Hash of a chart aggregate (index and values) plus any extra builder arguments"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(kind.encode('utf-8'))
+    digest.update(repr(extra).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(aggregate, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def cached_figure(kind: str, aggregate: pd.Series, builder, *extra: Any) -> go.Figure:
+    """Build a figure from an aggregate once and serve later reruns from its cached JSON"""
+    import plotly.graph_objects as go
+    
+    key = aggregate_fingerprint(kind, aggregate, *extra)
+    with _chart_cache_lock:
+        figure_json = _chart_cache.get(key)
+        if figure_json is not None:
+            _chart_cache.move_to_end(key)
+    if figure_json is not None:
+        # The JSON came from a validated figure, so skip plotly's property validation
+        return go.Figure(json.loads(figure_json), _validate=False)
+
+    fig = builder(aggregate, *extra)
+    with _chart_cache_lock:
+        _chart_cache[key] = fig.to_json()
+        while len(_chart_cache) > CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)
+    return fig
+
+def status_counts(df: pd.DataFrame) -> pd.Series:
+    """Issue count per status, most common first"""
+    return df['status'].value_counts()
+
+def issue_type_counts(df: pd.DataFrame) -> pd.Series:
+    """Issue count per issue type, most common first"""
+    return df['issue_type'].value_counts()
+
+def daily_activity_counts(df: pd.DataFrame) -> pd.Series:
+    """Number of issues updated per calendar day, in date order"""
+    return df['updated'].dt.date.value_counts().sort_index().rename_axis('updated_date')
+
+def assignee_counts(df: pd.DataFrame) -> pd.Series:
+    """Issue count per assignee, most common first"""
+    return df['assignee'].value_counts()
+
+def team_workload_counts(counts: pd.Series, team_members_config: Dict[str, str]) -> pd.Series:
+    """Assignee counts keyed by team member display name, largest first"""
+    # Create reverse mapping from email to display name
+    email_to_name = {email: name for name, email in team_members_config.items()}
+    fallback_names = counts.index.to_series().astype(str).str.split('@').str[0]
+    display_names = counts.index.to_series().map(email_to_name).fillna(fallback_names)
+    return counts.groupby(display_names.to_numpy(), sort=False).sum().sort_values(ascending=False, kind='stable')
+
+def build_status_distribution_chart(counts: pd.Series) -> go.Figure:
+    """Create status distribution pie chart from status counts"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    if counts.empty:
         return go.Figure()
     
-    status_counts = df['status'].value_counts()
-    colors = [get_status_color(status) for status in status_counts.index]
+    colors = [get_status_color(status) for status in counts.index]
     
     fig = px.pie(
-        values=status_counts.values,
-        names=status_counts.index,
+        values=counts.values,
+        names=counts.index,
         title="Issue Status Distribution",
         color_discrete_sequence=colors
     )
@@ -141,16 +204,17 @@ def create_status_distribution_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
-def create_issue_type_chart(df: pd.DataFrame) -> go.Figure:
-    """Create issue type distribution chart"""
-    if df.empty:
-        return go.Figure()
+def build_issue_type_chart(counts: pd.Series) -> go.Figure:
+    """Create issue type distribution chart from issue type counts"""
+    import plotly.express as px
+    import plotly.graph_objects as go
     
-    type_counts = df['issue_type'].value_counts()
+    if counts.empty:
+        return go.Figure()
     
     fig = px.bar(
-        x=type_counts.index,
-        y=type_counts.values,
+        x=counts.index,
+        y=counts.values,
         title="Issue Type Distribution",
         labels={'x': 'Issue Type', 'y': 'Count'}
     )
@@ -163,17 +227,16 @@ def create_issue_type_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
-def create_activity_timeline_chart(df: pd.DataFrame) -> go.Figure:
-    """Create activity timeline chart"""
-    if df.empty:
-        return go.Figure()
+def build_activity_timeline_chart(daily_counts: pd.Series) -> go.Figure:
+    """Create activity timeline chart from daily update counts"""
+    import plotly.express as px
+    import plotly.graph_objects as go
     
-    # Group by date and count
-    df['updated_date'] = df['updated'].dt.date
-    daily_counts = df.groupby('updated_date').size().reset_index(name='count')
+    if daily_counts.empty:
+        return go.Figure()
     
     fig = px.line(
-        daily_counts,
+        daily_counts.reset_index(name='count'),
         x='updated_date',
         y='count',
         title="Daily Issue Activity",
@@ -185,16 +248,19 @@ def create_activity_timeline_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
-def create_assignee_workload_chart(df: pd.DataFrame) -> go.Figure:
-    """Create assignee workload chart"""
-    if df.empty:
+def build_assignee_workload_chart(counts: pd.Series) -> go.Figure:
+    """Create top 10 assignee workload chart from assignee counts"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    if counts.empty:
         return go.Figure()
     
-    assignee_counts = df['assignee'].value_counts().head(10)  # Top 10 assignees
+    top_counts = counts.head(10)  # Top 10 assignees
     
     fig = px.bar(
-        x=assignee_counts.values,
-        y=assignee_counts.index,
+        x=top_counts.values,
+        y=top_counts.index,
         orientation='h',
         title="Top 10 Assignees by Issue Count",
         labels={'x': 'Number of Issues', 'y': 'Assignee'}
@@ -204,33 +270,21 @@ def create_assignee_workload_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
-def create_team_workload_chart(df: pd.DataFrame, team_members_config: Dict[str, str]) -> go.Figure:
-    """Create team member workload chart with proper name mapping"""
-    if df.empty:
-        return go.Figure()
-    
-    # Create reverse mapping from email to display name
-    email_to_name = {email: name for name, email in team_members_config.items()}
-    
-    # Count issues by assignee email and map to display names
-    assignee_counts = df['assignee'].value_counts()
-    
-    # Map emails to display names
-    display_data = {}
-    for email, count in assignee_counts.items():
-        display_name = email_to_name.get(email, email.split('@')[0] if '@' in email else email)
-        display_data[display_name] = count
+def build_team_workload_chart(workload: pd.Series) -> go.Figure:
+    """Create team member workload chart from counts keyed by display name"""
+    import plotly.express as px
+    import plotly.graph_objects as go
     
-    # Sort by count
-    sorted_data = dict(sorted(display_data.items(), key=lambda x: x[1], reverse=True))
+    if workload.empty:
+        return go.Figure()
     
     fig = px.bar(
-        x=list(sorted_data.values()),
-        y=list(sorted_data.keys()),
+        x=workload.values,
+        y=workload.index,
         orientation='h',
         title="Team Member Workload",
         labels={'x': 'Number of Issues', 'y': 'Team Member'},
-        color=list(sorted_data.values()),
+        color=workload.values,
         color_continuous_scale='Blues'
     )
     
@@ -242,6 +296,89 @@ def create_team_workload_chart(df: pd.DataFrame, team_members_config: Dict[str,
     
     return fig
 
+def build_wip_trend_chart(wip: pd.Series) -> go.Figure:
+    """Create work-in-progress trend chart from open issue counts per snapshot day and status bucket"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    if wip.empty:
+        return go.Figure()
+    
+    fig = px.area(
+        wip.reset_index(),
+        x='snapshot_date',
+        y='count',
+        color='status_bucket',
+        title="Open Issues Over Time",
+        labels={'snapshot_date': 'Date', 'count': 'Open Issues', 'status_bucket': 'Status'},
+        color_discrete_map={'In Progress': '#ffc107', 'Blocked': '#dc3545', 'Other': '#6c757d'}
+    )
+    
+    fig.update_layout(height=400)
+    
+    return fig
+
+def build_throughput_trend_chart(throughput: pd.Series) -> go.Figure:
+    """Create weekly throughput chart from resolved issue counts per week"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    if throughput.empty:
+        return go.Figure()
+    
+    fig = px.bar(
+        throughput.reset_index(),
+        x='week',
+        y='count',
+        title="Weekly Throughput",
+        labels={'week': 'Week Starting', 'count': 'Issues Resolved'}
+    )
+    
+    fig.update_layout(height=400, showlegend=False)
+    
+    return fig
+
+def create_status_distribution_chart(df: pd.DataFrame) -> go.Figure:
+    """Create status distribution pie chart"""
+    import plotly.graph_objects as go
+    
+    if df.empty:
+        return go.Figure()
+    return cached_figure("status_distribution", status_counts(df), build_status_distribution_chart)
+
+def create_issue_type_chart(df: pd.DataFrame) -> go.Figure:
+    """Create issue type distribution chart"""
+    import plotly.graph_objects as go
+    
+    if df.empty:
+        return go.Figure()
+    return cached_figure("issue_type", issue_type_counts(df), build_issue_type_chart)
+
+def create_activity_timeline_chart(df: pd.DataFrame) -> go.Figure:
+    """Create activity timeline chart"""
+    import plotly.graph_objects as go
+    
+    if df.empty:
+        return go.Figure()
+    return cached_figure("activity_timeline", daily_activity_counts(df), build_activity_timeline_chart)
+
+def create_assignee_workload_chart(df: pd.DataFrame) -> go.Figure:
+    """Create assignee workload chart"""
+    import plotly.graph_objects as go
+    
+    if df.empty:
+        return go.Figure()
+    return cached_figure("assignee_workload", assignee_counts(df), build_assignee_workload_chart)
+
+def create_team_workload_chart(df: pd.DataFrame, team_members_config: Dict[str, str]) -> go.Figure:
+    """Create team member workload chart with proper name mapping"""
+    import plotly.graph_objects as go
+    
+    if df.empty:
+        return go.Figure()
+    workload = team_workload_counts(assignee_counts(df), team_members_config)
+    return cached_figure("team_workload", workload, build_team_workload_chart)
+
 def filter_dataframe_by_team_members(df: pd.DataFrame, selected_members: List[str], team_config: Dict[str, str]) -> pd.DataFrame:
     """Filter dataframe by selected team members"""
     if df.empty or not selected_members:
@@ -261,21 +398,19 @@ def format_dataframe_for_display(df: pd.DataFrame, columns_to_show: List[str] =
     if df.empty:
         return df
     
-    display_df = df.copy()
-    
     # Default columns if not specified
     if columns_to_show is None:
         columns_to_show = ['key', 'summary', 'status', 'issue_type', 'assignee', 'updated', 'due_date']
     
-    # Filter columns that exist in the dataframe
-    columns_to_show = [col for col in columns_to_show if col in display_df.columns]
-    display_df = display_df[columns_to_show]
+    # Filter columns that exist in the dataframe (selecting columns already yields a new frame)
+    columns_to_show = [col for col in columns_to_show if col in df.columns]
+    display_df = df[columns_to_show]
     
     # Format date columns
     date_columns = ['created', 'updated', 'due_date', 'resolution_date']
-    for col in date_columns:
-        if col in display_df.columns:
-            display_df[col] = display_df[col].apply(lambda x: format_date(x, "date"))
+    date_columns = [col for col in date_columns if col in display_df.columns]
+    if date_columns:
+        display_df = display_df.assign(**{col: format_date_column(display_df[col]) for col in date_columns})
     
     # Rename columns for better display
     column_renames = {
@@ -312,28 +447,23 @@ def get_summary_metrics(df: pd.DataFrame) -> Dict[str, Any]:
             'avg_story_points': 0
         }
     
-    completed_statuses = ["Done", "Closed", "Resolved"]
-    # Updated logic: count "Development" status as "In Progress" for Weekly Activity
-    progress_statuses = ["Development", "In Progress", "In Review", "Testing"]
-    
+    # One pass over the statuses; the status groups are shared with the rollup cube
+    status_counts = df['status'].value_counts()
     total_issues = len(df)
-    completed_issues = len(df[df['status'].isin(completed_statuses)])
-    in_progress_issues = len(df[df['status'].isin(progress_statuses)])
-    blocked_issues = len(df[df['status'] == "Blocked"])
+    completed_issues = int(status_counts[status_counts.index.isin(COMPLETED_STATUSES)].sum())
+    in_progress_issues = int(status_counts[status_counts.index.isin(PROGRESS_STATUSES)].sum())
+    blocked_issues = int(status_counts[status_counts.index.isin(BLOCKED_STATUSES)].sum())
     completion_rate = (completed_issues / total_issues * 100) if total_issues > 0 else 0
     
     # Calculate average story points for completed issues with robust error handling
     avg_story_points = 0
     try:
-        if 'story_points' in df.columns:
-            completed_df = df[df['status'].isin(completed_statuses)]
-            if not completed_df.empty:
-                # Ensure story_points are numeric and handle any non-numeric values
-                story_points_series = pd.to_numeric(completed_df['story_points'], errors='coerce')
-                # Remove NaN values and calculate mean
-                valid_story_points = story_points_series.dropna()
-                if len(valid_story_points) > 0:
-                    avg_story_points = valid_story_points.mean()
+        if 'story_points' in df.columns and completed_issues:
+            completed_mask = df['status'].isin(COMPLETED_STATUSES)
+            # Ensure story_points are numeric and handle any non-numeric values
+            valid_story_points = pd.to_numeric(df.loc[completed_mask, 'story_points'], errors='coerce').dropna()
+            if len(valid_story_points) > 0:
+                avg_story_points = valid_story_points.mean()
     except Exception as e:
         logger.error(f"Error calculating story points average: {str(e)}")
         avg_story_points = 0
@@ -381,10 +511,129 @@ def export_to_csv(df: pd.DataFrame, filename: str) -> bytes:
     """Export dataframe to CSV"""
     return df.to_csv(index=False).encode('utf-8')
 
+# Number of generated exports kept in memory, keyed by frame content hash
+EXPORT_CACHE_SIZE = 16
+
+_export_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_export_cache_lock = threading.Lock()
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a dataframe (values, index, column names and dtypes)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    digest.update(repr([str(dtype) for dtype in df.dtypes]).encode('utf-8'))
+    try:
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cell values (e.g. lists); fall back to the serialized frame
+        digest.update(df.to_csv().encode('utf-8'))
+    return digest.hexdigest()
+
+def export_to_csv_cached(df: pd.DataFrame) -> bytes:
+    """Export dataframe to CSV, memoized by frame content hash and built chunk by chunk"""
+    key = frame_fingerprint(df)
+    with _export_cache_lock:
+        if key in _export_cache:
+            _export_cache.move_to_end(key)
+            return _export_cache[key]
+
+    buffer = io.BytesIO()
+    exporters.write_csv(df, buffer)
+    data = buffer.getvalue()
+
+    with _export_cache_lock:
+        _export_cache[key] = data
+        while len(_export_cache) > EXPORT_CACHE_SIZE:
+            _export_cache.popitem(last=False)
+    return data
+
+@lru_cache(maxsize=1)
+def supports_deferred_download() -> bool:
+    """Whether st.download_button accepts a callable that is only run on click"""
+    try:
+        from streamlit.elements.widgets.button import DownloadButtonDataType
+        return any(get_origin(arg) is collections.abc.Callable for arg in get_args(DownloadButtonDataType))
+    except ImportError:
+        return False
+
+def render_csv_download_button(df: pd.DataFrame, label: str, file_name: str, key: str) -> None:
+    """Render a CSV download button that only serializes the frame when clicked"""
+    if supports_deferred_download():
+        st.download_button(
+            label=label,
+            data=lambda: export_to_csv_cached(df),
+            file_name=file_name,
+            mime="text/csv",
+            key=key
+        )
+        return
+
+    # Older Streamlit: prepare the file on request, then offer the download
+    prepared_key = f"{key}_prepared"
+    if st.session_state.get(prepared_key):
+        st.download_button(
+            label=label,
+            data=export_to_csv_cached(df),
+            file_name=file_name,
+            mime="text/csv",
+            key=key,
+            on_click=lambda: st.session_state.pop(prepared_key, None)
+        )
+    elif st.button(f"📦 Prepare {label.replace('📥 ', '')}", key=f"{key}_prepare"):
+        st.session_state[prepared_key] = True
+        st.rerun()
+
+# Session state keys of a paginated table's controls are f"{table key}_{control}"
+PAGED_TABLE_CONTROLS = ['search', 'sort', 'descending', 'page']
+
+UNSORTED = "(default order)"
+
+def render_paged_table(display_df: pd.DataFrame, key: str, column_config: Optional[Dict[str, Any]] = None,
+                       height: int = 400, page_size: int = TABLE_PAGE_SIZE) -> None:
+    """Render a table one page at a time; search, sort and paging run on the server over the cached frame"""
+    page_key = f"{key}_page"
+    sort_key = f"{key}_sort"
+    sort_options = [UNSORTED] + list(display_df.columns)
+    # A column hidden since the last run can no longer be sorted by
+    if st.session_state.get(sort_key) not in sort_options:
+        st.session_state[sort_key] = UNSORTED
+
+    def first_page():
+        st.session_state[page_key] = 1
+
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        search = st.text_input("🔍 Search", key=f"{key}_search", placeholder="Filter rows...", on_change=first_page)
+    with col2:
+        sort_by = st.selectbox("Sort by", sort_options, key=sort_key, on_change=first_page)
+    with col3:
+        descending = st.checkbox("Descending", key=f"{key}_descending", on_change=first_page)
+
+    positions = row_order(display_df, None if sort_by == UNSORTED else sort_by, descending, search)
+    pages = max(1, -(-len(positions) // page_size))
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    with col4:
+        page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+
+    start = (page - 1) * page_size
+    # The page is taken from the memoized Arrow table, so Streamlit serializes it without converting pandas
+    st.dataframe(
+        arrow_table(display_df).take(positions[start:start + page_size]),
+        use_container_width=True,
+        height=height,
+        hide_index=True,
+        column_config=column_config
+    )
+    if len(positions):
+        st.caption(f"Rows {start + 1}-{min(start + page_size, len(positions))} of {len(positions)}, page {page} of {pages}")
+    else:
+        st.caption("No rows match the search")
+
 def create_jira_issue_link(issue_key: str, jira_url: str = None) -> str:
     """Create clickable link to JIRA issue"""
     if jira_url is None:
-        jira_url = config['jira']['JIRA_URL']
+        jira_url = get_config()['jira']['JIRA_URL']
     
     return f"{jira_url}/browse/{issue_key}"
 
@@ -399,90 +648,13 @@ def create_priority_table(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame()
     
-    # Create priority ranking based on order (most recently updated first for In Progress, oldest first for To Do)
-    priority_table = df.copy()
-    priority_table = priority_table.reset_index(drop=True)
-    
-    # Format assignee names better
-    def format_assignee(assignee):
-        if pd.isna(assignee) or assignee == 'Unassigned':
-            return 'Unassigned'
-        if '@' in str(assignee):
-            # Extract name from email and format
-            name_part = str(assignee).split('@')[0]
-            # Convert email format to readable name (e.g., waseyt.ibrahim -> Waseyt Ibrahim)
-            formatted_name = name_part.replace('.', ' ').title()
-            return formatted_name
-        return str(assignee)
-    
-    # Helper function to format dates safely
-    def format_date_safe(date_series):
-        try:
-            if date_series is None or pd.isna(date_series).all():
-                return 'N/A'
-            # Ensure the series is datetime
-            date_series = pd.to_datetime(date_series, errors='coerce', utc=True)
-            formatted_dates = date_series.dt.strftime('%Y-%m-%d')
-            return formatted_dates.fillna('N/A')
-        except (AttributeError, TypeError):
-            return 'N/A'
-    
-    # Return the DataFrame as is since columns are already properly named and ordered from get_enhanced_priority_issues
-    # No longer need ETA and Impact calculations
-    return priority_table
+    # Columns are already properly named and ordered by get_enhanced_priority_issues
+    return df.reset_index(drop=True)
 
 def create_completed_issues_table(df: pd.DataFrame) -> pd.DataFrame:
     """Create a table format for last week completed issues"""
     if df.empty:
         return pd.DataFrame()
     
-    # Create the completed issues table
-    completed_table = df.copy()
-    
-    # Helper function to format assignee names
-    def format_assignee(assignee):
-        if pd.isna(assignee) or assignee == 'Unassigned':
-            return 'Unassigned'
-        if '@' in str(assignee):
-            # Extract name from email and format
-            name_part = str(assignee).split('@')[0]
-            # Convert email format to readable name (e.g., waseyt.ibrahim -> Waseyt Ibrahim)
-            formatted_name = name_part.replace('.', ' ').title()
-            return formatted_name
-        return str(assignee)
-
-    # Helper function to format dates safely
-    def format_date_safe(date_value):
-        try:
-            if pd.isna(date_value):
-                return 'N/A'
-            # Ensure the value is datetime
-            date_value = pd.to_datetime(date_value, errors='coerce', utc=True)
-            if pd.isna(date_value):
-                return 'N/A'
-            return date_value.strftime('%Y-%m-%d')
-        except (AttributeError, TypeError):
-            return 'N/A'
-
-    # Helper function to truncate text
-    def safe_truncate(text, max_length=80):
-        if pd.isna(text):
-            return 'N/A'
-        text = str(text)
-        return text[:max_length] + '...' if len(text) > max_length else text
-
-    # Create the table with required columns - matching Priority Dashboard format
-    table_data = {
-        'JIRA ID': completed_table['key'],
-        'Issue Type': completed_table['issue_type'],
-        'Summary': completed_table['summary'].apply(lambda x: safe_truncate(x, 80)),
-        'Status': completed_table['status'],
-        'Assigned To': completed_table['assignee'].apply(format_assignee),
-        'Completed Date': completed_table['updated'].apply(format_date_safe),
-        'Created Date': completed_table['created'].apply(format_date_safe),
-        'Est. Story Points': completed_table.get('story_points', 0).fillna(0),
-        'Act. Story Points': completed_table.get('actual_story_points', 0).fillna(0)
-    }
-    
-    result_df = pd.DataFrame(table_data)
-    return result_df 
\ No newline at end of file
+    # Matching Priority Dashboard format, built with vectorized column transforms
+    return build_table_view(df, COMPLETED_ISSUES_COLUMNS)